@@ -0,0 +1,184 @@
+import asyncio
+import hashlib
+import time
+from typing import Any, Dict, List, Optional
+
+from facets import FacetIndex
+from pagination import CursorKey, sort_key
+from related import RelatedIndex
+from search import SearchIndex
+from shared_catalog import SharedCatalogSegment, decode_projects, encode_projects
+
+# Fields the project grid renders; everything else is detail-page only
+SUMMARY_FIELDS = (
+    "id", "title", "subtitle", "category", "hero_image", "hero_image_srcset", "tech_stack", "featured", "created_at",
+)
+EXCERPT_LENGTH = 200
+
+
+def summarize(project: Dict[str, Any]) -> Dict[str, Any]:
+    summary = {field: project.get(field) for field in SUMMARY_FIELDS}
+    summary["excerpt"] = (project.get("description") or "")[:EXCERPT_LENGTH]
+    return summary
+
+
+def select_fields(project: Dict[str, Any], fields: List[str]) -> Dict[str, Any]:
+    return {field: project[field] for field in fields if field in project}
+
+
+class ProjectCatalog:
+    """In-process snapshot of the projects stored in the repository.
+
+    The catalog is small and rarely written, so reads are served from memory:
+    projects indexed by id plus the newest-first and featured lists, both
+    precomputed. Write handlers patch the snapshot in place; the TTL is only a
+    safety net for writes that bypass this process. The full-text search
+    index, facet counts and related-project rankings are derived from the
+    same snapshot and patched alongside it.
+
+    With a `shared` segment (multi-worker mode) the serialized snapshot is
+    published there on every change, and each read first compares the
+    segment's generation with the one loaded here. Workers pick up each
+    other's writes from shared memory instead of querying the database.
+    """
+
+    def __init__(self, ttl: float = 300.0, shared: Optional[SharedCatalogSegment] = None):
+        self.ttl = ttl
+        self.shared = shared
+        # Generation of the shared snapshot this worker last loaded or wrote;
+        # without a segment, a local count of changes
+        self.generation = 0
+        self.by_id: Dict[str, Dict[str, Any]] = {}
+        self.ordered: List[Dict[str, Any]] = []
+        self.ascending_keys: List[CursorKey] = []
+        self.featured: List[Dict[str, Any]] = []
+        self.summaries: Dict[str, Dict[str, Any]] = {}
+        self.search = SearchIndex()
+        self.facets = FacetIndex()
+        self.related = RelatedIndex()
+        self.loaded_at: Optional[float] = None
+        # Content-derived, so every worker holding the same data agrees on it
+        self.version = ""
+        self._lock = asyncio.Lock()
+
+    def is_fresh(self) -> bool:
+        if self.loaded_at is None:
+            return False
+        return self.ttl <= 0 or time.monotonic() - self.loaded_at < self.ttl
+
+    async def ensure_fresh(self, repository) -> "ProjectCatalog":
+        if self.shared is not None and self.shared.generation() != self.generation:
+            self._load_shared(*self.shared.read())
+        if not self.is_fresh():
+            async with self._lock:
+                # Another request may have reloaded while we waited for the lock
+                if not self.is_fresh():
+                    await self.reload(repository)
+        return self
+
+    async def load(self, repository):
+        """Startup load: from the shared segment when another worker already filled it."""
+        if self.shared is not None:
+            generation, payload = self.shared.read()
+            if generation:
+                self._load_shared(generation, payload)
+                return
+        await self.reload(repository)
+
+    async def reload(self, repository):
+        # A write landing while list_all() runs is missing from its result, so
+        # the list is only installed if no change happened in the meantime
+        while True:
+            started = self.generation if self.shared is None else self.shared.generation()
+            projects = await repository.list_all()
+            if self.shared is None:
+                if self.generation == started:
+                    self._replace(projects)
+                    return
+                continue
+            with self.shared.locked():
+                generation, payload = self.shared.read(locked=True)
+                if generation != started:
+                    # Another write published a snapshot newer than our list
+                    self._load_shared(generation, payload)
+                    return
+                self._replace(projects)
+                self._publish()
+                return
+
+    def upsert(self, project: Dict[str, Any]):
+        project = {key: value for key, value in project.items() if key != "_id"}
+        self._change(lambda: self._apply_upsert(project))
+
+    def remove(self, project_id: str):
+        self._change(lambda: self._apply_remove(project_id))
+
+    def _apply_upsert(self, project: Dict[str, Any]) -> bool:
+        self.by_id[project["id"]] = project
+        self.search.add(project)
+        self.facets.add(project)
+        self.related.add(project)
+        return True
+
+    def _apply_remove(self, project_id: str) -> bool:
+        if self.by_id.pop(project_id, None) is None:
+            return False
+        self.search.remove(project_id)
+        self.facets.remove(project_id)
+        self.related.remove(project_id)
+        return True
+
+    def _change(self, apply):
+        if self.shared is None:
+            if apply():
+                self._reindex()
+                self.generation += 1
+            return
+        # Read-modify-write under the segment lock, starting from the latest
+        # snapshot, so concurrent writes in other workers are never lost
+        with self.shared.locked():
+            generation, payload = self.shared.read(locked=True)
+            if generation and generation != self.generation:
+                self._load_shared(generation, payload)
+            if apply():
+                self._reindex()
+                self._publish()
+
+    def _replace(self, projects: List[Dict[str, Any]]):
+        self.by_id = {project["id"]: project for project in projects}
+        self.search.rebuild(projects)
+        self.facets.rebuild(projects)
+        self.related.rebuild(projects)
+        self._reindex()
+        self.loaded_at = time.monotonic()
+
+    def _load_shared(self, generation: int, payload: bytes):
+        self._replace(decode_projects(payload))
+        self.generation = generation
+
+    def _publish(self):
+        self.generation = self.shared.write(encode_projects(self.ordered))
+
+    def get(self, project_id: str) -> Optional[Dict[str, Any]]:
+        return self.by_id.get(project_id)
+
+    def filtered(self, category: Optional[str], technologies: List[str]):
+        """Newest-first projects matching the facet filters, with their keys."""
+        ids = self.facets.matching(category, technologies)
+        if ids is None:
+            return self.ordered, self.ascending_keys
+        ordered = [project for project in self.ordered if project["id"] in ids]
+        return ordered, [sort_key(project) for project in reversed(ordered)]
+
+    def summary(self, project: Dict[str, Any]) -> Dict[str, Any]:
+        return self.summaries[project["id"]]
+
+    def _reindex(self):
+        self.ordered = sorted(self.by_id.values(), key=sort_key, reverse=True)
+        self.ascending_keys = [sort_key(project) for project in reversed(self.ordered)]
+        self.featured = [project for project in self.ordered if project.get("featured")]
+        self.summaries = {project_id: summarize(project) for project_id, project in self.by_id.items()}
+        fingerprint = hashlib.sha1()
+        for project in self.ordered:
+            fingerprint.update(f"{project['id']}|{project.get('updated_at')}\n".encode())
+        self.version = fingerprint.hexdigest()
@@ -0,0 +1,288 @@
+import asyncio
+import itertools
+import json
+import os
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # without flock each process must use its own journal path
+    fcntl = None
+
+
+class QueueFull(Exception):
+    pass
+
+
+def _encode(contact: Dict[str, Any]) -> str:
+    record = dict(contact)
+    record["created_at"] = record["created_at"].isoformat()
+    return json.dumps(record, ensure_ascii=False)
+
+
+def _decode(line: str) -> Dict[str, Any]:
+    record = json.loads(line)
+    record["created_at"] = datetime.fromisoformat(record["created_at"])
+    return record
+
+
+# Queued after the last record by stop()
+STOP = object()
+
+
+class ContactWriteQueue:
+    """Write-behind batching for contact form submissions.
+
+    Submissions are appended to a local journal, then queued in memory; a
+    background task writes them with one batched insert when the batch fills
+    or `flush_interval` elapses. Journal appends are group-committed by a
+    writer task off the event loop: every submission waiting at that moment
+    shares one write (and one fsync), and each is acknowledged once its line
+    is on disk.
+
+    The journal is a series of segments (`<path>-000001`, ...); the writer
+    starts a new one past `segment_bytes`, and a segment is deleted as soon
+    as every record in it has been stored, so the journal stays bounded
+    under steady traffic. Segments are replayed on the next start, so a
+    crash between accept and flush loses nothing; ids already stored are
+    skipped on replay.
+
+    Workers started from one launcher share `journal_path`: each locks the
+    first free slot (`path`, `path.1`, ...), so a restarted worker replays the
+    journal its predecessor left behind and no two processes write one file.
+    """
+
+    def __init__(
+        self,
+        repository,
+        journal_path: str,
+        batch_size: int = 100,
+        flush_interval: float = 0.5,
+        max_pending: int = 10000,
+        fsync: bool = False,
+        retry_delay: float = 1.0,
+        segment_bytes: int = 1024 * 1024,
+    ):
+        self.repository = repository
+        self.journal_path = journal_path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.fsync = fsync
+        self.retry_delay = retry_delay
+        self.segment_bytes = segment_bytes
+        # (segment, contact) pairs journaled and waiting to be stored
+        self._queue: "asyncio.Queue[Tuple[int, Dict[str, Any]]]" = asyncio.Queue()
+        # Submissions waiting for the next journal write
+        self._pending: List[Tuple[Dict[str, Any], str, asyncio.Future]] = []
+        self._wakeup = asyncio.Event()
+        self._closing = False
+        self._lock_file = None
+        self._segment = None
+        self._segment_number = 0
+        self._segment_size = 0
+        # segment -> records journaled there and not yet stored
+        self._unflushed: Dict[int, int] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._writer: Optional[asyncio.Task] = None
+
+    async def start(self):
+        directory = os.path.dirname(self.journal_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock_file = self._claim_journal()
+        last = await self._replay()
+        self._open_segment(last + 1)
+        self._writer = asyncio.create_task(self._write_journal())
+        self._task = asyncio.create_task(self._run())
+
+    def _claim_journal(self):
+        base = self.journal_path
+        for slot in itertools.count():
+            path = base if slot == 0 else f"{base}.{slot}"
+            journal = open(path, "a", encoding="utf-8")
+            if fcntl is None:
+                break
+            try:
+                fcntl.flock(journal, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                break
+            except BlockingIOError:
+                journal.close()
+        # The lock lives as long as this handle, i.e. until stop() or exit
+        self.journal_path = path
+        return journal
+
+    def _segment_path(self, number: int) -> str:
+        return f"{self.journal_path}-{number:06d}"
+
+    def _segments(self) -> List[int]:
+        prefix = os.path.basename(self.journal_path) + "-"
+        directory = os.path.dirname(self.journal_path) or "."
+        return sorted(
+            int(name[len(prefix):]) for name in os.listdir(directory)
+            if name.startswith(prefix) and name[len(prefix):].isdigit()
+        )
+
+    def _open_segment(self, number: int):
+        self._segment = open(self._segment_path(number), "ab")
+        self._segment_number = number
+        self._segment_size = self._segment.tell()
+        self._unflushed.setdefault(number, 0)
+
+    async def stop(self):
+        if self._writer:
+            # Let the writer journal whatever was submitted, then exit
+            self._closing = True
+            self._wakeup.set()
+            await self._writer
+            self._writer = None
+        if self._task:
+            # The flusher writes what is queued, without retrying, and exits
+            # at the marker; whatever fails stays in the journal
+            self._queue.put_nowait(STOP)
+            await self._task
+            self._task = None
+        if self._segment:
+            self._segment.close()
+            self._segment = None
+            if not self._unflushed.get(self._segment_number):
+                self._remove_segments([self._segment_number])
+        if self._lock_file:
+            self._lock_file.close()
+            self._lock_file = None
+
+    async def submit(self, contact: Dict[str, Any]):
+        """Journal `contact` and queue it; returns once the journal write is done."""
+        if self._closing or self.pending() >= self.max_pending:
+            raise QueueFull()
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((dict(contact), _encode(contact) + "\n", future))
+        self._wakeup.set()
+        await future
+
+    def pending(self) -> int:
+        return self._queue.qsize() + len(self._pending)
+
+    async def _write_journal(self):
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            while self._pending:
+                group, self._pending = self._pending, []
+                await self._append(group)
+            if self._closing:
+                return
+
+    async def _append(self, group: List[Tuple[Dict[str, Any], str, asyncio.Future]]):
+        data = "".join(line for _, line, _ in group).encode()
+        try:
+            if self._segment_size >= self.segment_bytes:
+                await self._rotate()
+            await asyncio.to_thread(self._write_segment, data)
+        except OSError as exc:
+            for _, _, future in group:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        self._segment_size += len(data)
+        self._unflushed[self._segment_number] += len(group)
+        for contact, _, future in group:
+            self._queue.put_nowait((self._segment_number, contact))
+            if not future.done():
+                future.set_result(None)
+
+    def _write_segment(self, data: bytes):
+        self._segment.write(data)
+        self._segment.flush()
+        if self.fsync:
+            os.fsync(self._segment.fileno())
+
+    async def _rotate(self):
+        previous = self._segment_number
+        await asyncio.to_thread(self._segment.close)
+        self._open_segment(previous + 1)
+        if not self._unflushed[previous]:
+            del self._unflushed[previous]
+            await asyncio.to_thread(self._remove_segments, [previous])
+
+    def _remove_segments(self, numbers: List[int]):
+        for number in numbers:
+            try:
+                os.unlink(self._segment_path(number))
+            except FileNotFoundError:
+                pass
+
+    async def _run(self):
+        while True:
+            record = await self._queue.get()
+            if record is STOP:
+                return
+            batch = [record]
+            deadline = asyncio.get_running_loop().time() + self.flush_interval
+            while len(batch) < self.batch_size:
+                timeout = deadline - asyncio.get_running_loop().time()
+                if timeout <= 0:
+                    break
+                try:
+                    record = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if record is STOP:
+                    await self._write(batch)
+                    return
+                batch.append(record)
+            await self._write(batch)
+
+    async def _write(self, batch: List[Tuple[int, Dict[str, Any]]]):
+        while True:
+            try:
+                await self._insert([contact for _, contact in batch])
+                break
+            except Exception as exc:
+                # Retry on any error: if the flusher died, submissions would
+                # keep being journaled and accepted but never stored
+                if self._closing:
+                    print(f"Nu s-au putut salva {len(batch)} mesaje de contact: {exc}")
+                    return
+                print(f"Salvarea mesajelor de contact a eșuat, reîncercare: {exc}")
+                await asyncio.sleep(self.retry_delay)
+        await self._checkpoint(batch)
+
+    async def _checkpoint(self, batch: List[Tuple[int, Dict[str, Any]]]):
+        # Closed segments whose records are all stored are no longer needed
+        for number, _ in batch:
+            self._unflushed[number] -= 1
+        done = [
+            number for number, count in self._unflushed.items()
+            if not count and number != self._segment_number
+        ]
+        for number in done:
+            del self._unflushed[number]
+        if done:
+            await asyncio.to_thread(self._remove_segments, done)
+
+    async def _insert(self, batch: List[Dict[str, Any]]):
+        await self.repository.insert_many(batch)
+
+    async def _replay(self) -> int:
+        """Store everything left in the journal; returns the last segment number seen."""
+        segments = self._segments()
+        # Journals written before segments held their records in the slot file itself
+        paths = [self.journal_path] + [self._segment_path(number) for number in segments]
+        records = []
+        for path in paths:
+            with open(path, encoding="utf-8") as journal:
+                for line in journal:
+                    try:
+                        records.append(_decode(line))
+                    except ValueError:
+                        # A torn final line from a crash mid-write was never acknowledged
+                        continue
+        for start in range(0, len(records), self.batch_size):
+            await self._insert(records[start:start + self.batch_size])
+        if records:
+            print(f"Au fost recuperate {len(records)} mesaje de contact din jurnal")
+        self._lock_file.truncate(0)
+        self._remove_segments(segments)
+        return segments[-1] if segments else 0
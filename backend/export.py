@@ -0,0 +1,63 @@
+import csv
+import io
+import json
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List
+
+# Streaming serializers for the contacts export. Rows are buffered into chunks
+# of roughly one cursor batch so memory stays flat regardless of how many
+# documents the export walks.
+
+CONTACT_EXPORT_FIELDS = ["id", "created_at", "status", "name", "email", "phone", "subject", "message"]
+
+# Spreadsheets run a cell starting with one of these as a formula; contact
+# fields come from the public form, so CSV cells get a leading quote
+FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+def _json_default(value: Any):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+async def ndjson_stream(cursor, chunk_size: int) -> AsyncIterator[bytes]:
+    lines: List[str] = []
+    async for doc in cursor:
+        lines.append(json.dumps(doc, default=_json_default, ensure_ascii=False))
+        if len(lines) >= chunk_size:
+            yield ("\n".join(lines) + "\n").encode()
+            lines = []
+    if lines:
+        yield ("\n".join(lines) + "\n").encode()
+
+
+def _csv_cell(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if value is None:
+        return ""
+    if isinstance(value, str) and value.startswith(FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+def _csv_row(doc: Dict[str, Any]) -> List[Any]:
+    return [_csv_cell(doc.get(field)) for field in CONTACT_EXPORT_FIELDS]
+
+
+async def csv_stream(cursor, chunk_size: int) -> AsyncIterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(CONTACT_EXPORT_FIELDS)
+    rows = 0
+    async for doc in cursor:
+        writer.writerow(_csv_row(doc))
+        rows += 1
+        if rows >= chunk_size:
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+            rows = 0
+    # Always flush: the header goes out even when nothing matched
+    yield buffer.getvalue().encode()
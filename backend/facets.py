@@ -0,0 +1,71 @@
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+# Facets exposed to the project filters: facet name -> project field
+FACET_FIELDS = {"categories": "category", "technologies": "tech_stack"}
+
+
+def _values(project: Dict[str, Any], field: str) -> List[str]:
+    value = project.get(field)
+    if value is None:
+        return []
+    # tech_stack repeats are counted once per project
+    return list(dict.fromkeys(value)) if isinstance(value, list) else [value]
+
+
+class FacetIndex:
+    """Materialized facet counts and per-value id sets for the catalog.
+
+    Counts are adjusted by each write instead of re-aggregating the whole
+    collection, and the id sets answer `category=`/`tech=` filters without
+    scanning every project.
+    """
+
+    def __init__(self):
+        self.counts: Dict[str, Counter] = {facet: Counter() for facet in FACET_FIELDS}
+        self.members: Dict[str, Dict[str, Set[str]]] = {facet: {} for facet in FACET_FIELDS}
+        self._indexed: Dict[str, Dict[str, List[str]]] = {}
+
+    def rebuild(self, projects: Iterable[Dict[str, Any]]):
+        self.__init__()
+        for project in projects:
+            self.add(project)
+
+    def add(self, project: Dict[str, Any]):
+        doc_id = project["id"]
+        self.remove(doc_id)
+        indexed = {}
+        for facet, field in FACET_FIELDS.items():
+            values = _values(project, field)
+            for value in values:
+                self.counts[facet][value] += 1
+                self.members[facet].setdefault(value, set()).add(doc_id)
+            indexed[facet] = values
+        self._indexed[doc_id] = indexed
+
+    def remove(self, doc_id: str):
+        indexed = self._indexed.pop(doc_id, None)
+        if indexed is None:
+            return
+        for facet, values in indexed.items():
+            for value in values:
+                self.counts[facet][value] -= 1
+                if not self.counts[facet][value]:
+                    del self.counts[facet][value]
+                members = self.members[facet][value]
+                members.discard(doc_id)
+                if not members:
+                    del self.members[facet][value]
+
+    def matching(self, category: Optional[str], technologies: List[str]) -> Optional[Set[str]]:
+        """Ids matching every given filter, or None when nothing is filtered."""
+        groups = []
+        if category:
+            groups.append(self.members["categories"].get(category, set()))
+        groups.extend(self.members["technologies"].get(tech, set()) for tech in technologies)
+        if not groups:
+            return None
+        return set.intersection(*sorted(groups, key=len))
+
+    def snapshot(self) -> Dict[str, Dict[str, int]]:
+        return {facet: dict(counts.most_common()) for facet, counts in self.counts.items()}
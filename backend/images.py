@@ -0,0 +1,196 @@
+import asyncio
+import hashlib
+import io
+import json
+import os
+import re
+import shutil
+import threading
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence
+
+import aiofiles
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+# Content-addressed image storage: every upload lives in
+# <media_root>/images/<sha256>/ next to its resized variants and a manifest,
+# so identical uploads share one directory and every URL is immutable.
+
+MEDIA_URL = "/media/images"
+MANIFEST = "manifest.json"
+IMMUTABLE_CACHE = "public, max-age=31536000, immutable"
+
+DIGEST_PATTERN = re.compile(r"^[0-9a-f]{64}$")
+FILENAME_PATTERN = re.compile(r"^(original\.(jpg|png|gif|webp)|w\d+\.(webp|jpg))$")
+MEDIA_URL_PATTERN = re.compile(r"^%s/([0-9a-f]{64})/" % re.escape(MEDIA_URL))
+
+EXTENSIONS = {"JPEG": "jpg", "PNG": "png", "GIF": "gif", "WEBP": "webp"}
+MIME_TYPES = {"webp": "image/webp", "jpg": "image/jpeg"}
+
+
+class InvalidImage(ValueError):
+    pass
+
+
+def probe(data: bytes) -> Dict[str, Any]:
+    """Hash an upload and sniff its format without decoding the pixels."""
+    try:
+        with Image.open(io.BytesIO(data)) as image:
+            image_format = image.format
+    except (UnidentifiedImageError, OSError) as exc:
+        raise InvalidImage(str(exc)) from exc
+    if image_format not in EXTENSIONS:
+        raise InvalidImage(image_format)
+    return {"digest": hashlib.sha256(data).hexdigest(), "extension": EXTENSIONS[image_format]}
+
+
+def _temporary(path: str) -> str:
+    # Per writer, so concurrent uploads of the same image never share one
+    return f"{path}.{os.getpid()}-{threading.get_ident()}.tmp"
+
+
+def _save_atomic(image: Image.Image, path: str, **options):
+    tmp_path = _temporary(path)
+    image.save(tmp_path, **options)
+    os.replace(tmp_path, path)
+
+
+def render_variants(directory: str, original: str, widths: Sequence[int]) -> Dict[str, Any]:
+    """Resize an original into WebP and JPEG variants; runs in a worker process."""
+    digest = os.path.basename(directory)
+    with Image.open(os.path.join(directory, original)) as source:
+        image = ImageOps.exif_transpose(source)
+        if image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGBA")
+        width, height = image.size
+        # Never upscale; images narrower than the smallest step get one variant
+        targets = sorted({w for w in widths if w < width} | {min(width, max(widths))})
+        variants = []
+        for target in targets:
+            resized = image if target == width else image.resize(
+                (target, max(1, round(height * target / width))), Image.LANCZOS
+            )
+            _save_atomic(resized, os.path.join(directory, f"w{target}.webp"), format="WEBP", quality=80, method=4)
+            _save_atomic(
+                resized.convert("RGB"), os.path.join(directory, f"w{target}.jpg"),
+                format="JPEG", quality=82, optimize=True, progressive=True,
+            )
+            for extension in ("webp", "jpg"):
+                variants.append({
+                    "width": target,
+                    "format": MIME_TYPES[extension],
+                    "url": f"{MEDIA_URL}/{digest}/w{target}.{extension}",
+                })
+
+    manifest = {
+        "digest": digest,
+        "width": width,
+        "height": height,
+        "original": f"{MEDIA_URL}/{digest}/{original}",
+        "variants": variants,
+        "srcset": {
+            mime: ", ".join(f"{v['url']} {v['width']}w" for v in variants if v["format"] == mime)
+            for mime in MIME_TYPES.values()
+        },
+    }
+    tmp_path = _temporary(os.path.join(directory, MANIFEST))
+    with open(tmp_path, "w") as manifest_file:
+        json.dump(manifest, manifest_file)
+    os.replace(tmp_path, os.path.join(directory, MANIFEST))
+    return manifest
+
+
+class ImageStore:
+    def __init__(self, media_root: str, widths: Sequence[int], workers: Optional[int] = None):
+        self.root = os.path.join(media_root, "images")
+        self.widths = tuple(sorted(widths))
+        self.workers = workers
+        self._pool: Optional[ProcessPoolExecutor] = None
+        # digest -> lock held while this process ingests it
+        self._locks: "weakref.WeakValueDictionary[str, asyncio.Lock]" = weakref.WeakValueDictionary()
+
+    def shutdown(self):
+        if self._pool:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    def path_for(self, digest: str, filename: str) -> Optional[str]:
+        if not DIGEST_PATTERN.match(digest) or not FILENAME_PATTERN.match(filename):
+            return None
+        path = os.path.join(self.root, digest, filename)
+        return path if os.path.isfile(path) else None
+
+    def manifest(self, digest: str) -> Optional[Dict[str, Any]]:
+        return _read_manifest(os.path.join(self.root, digest, MANIFEST))
+
+    def srcset_for(self, url: Optional[str]) -> Optional[Dict[str, str]]:
+        match = MEDIA_URL_PATTERN.match(url or "")
+        if not match:
+            return None
+        manifest = self.manifest(match.group(1))
+        return manifest["srcset"] if manifest else None
+
+    async def ingest(self, data: bytes) -> Dict[str, Any]:
+        info = await asyncio.to_thread(probe, data)
+        digest = info["digest"]
+        existing = self.manifest(digest)
+        if existing:
+            return existing
+
+        # Identical uploads in this process wait for the first one and reuse
+        # its result; other processes write under their own temporary names
+        lock = self._locks.get(digest)
+        if lock is None:
+            lock = self._locks[digest] = asyncio.Lock()
+        async with lock:
+            existing = self.manifest(digest)
+            if existing:
+                return existing
+            return await self._render(digest, info["extension"], data)
+
+    async def _render(self, digest: str, extension: str, data: bytes) -> Dict[str, Any]:
+        directory = os.path.join(self.root, digest)
+        os.makedirs(directory, exist_ok=True)
+        original = f"original.{extension}"
+        tmp_path = _temporary(os.path.join(directory, original))
+        async with aiofiles.open(tmp_path, "wb") as out:
+            await out.write(data)
+        os.replace(tmp_path, os.path.join(directory, original))
+
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.workers)
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(self._pool, render_variants, directory, original, self.widths)
+        except (OSError, ValueError, Image.DecompressionBombError) as exc:
+            # Truncated or corrupt pixel data only shows up when decoding; drop
+            # the original so the digest isn't left without variants, unless
+            # another process finished the same image meanwhile
+            if self.manifest(digest) is None:
+                shutil.rmtree(directory, ignore_errors=True)
+            raise InvalidImage(str(exc)) from exc
+
+
+@lru_cache(maxsize=4096)
+def _cached_manifest(path: str) -> Dict[str, Any]:
+    with open(path) as manifest_file:
+        return json.load(manifest_file)
+
+
+def _read_manifest(path: str) -> Optional[Dict[str, Any]]:
+    # Manifests never change once written, so only hits are cached
+    if not os.path.isfile(path):
+        return None
+    return _cached_manifest(path)
+
+
+def attach_srcsets(store: ImageStore, project: Dict[str, Any]) -> Dict[str, Any]:
+    project["hero_image_srcset"] = store.srcset_for(project.get("hero_image"))
+    project["gallery_srcsets"] = [store.srcset_for(url) for url in project.get("gallery_images") or []]
+    return project
+
+
+def parse_widths(value: str) -> List[int]:
+    return [int(width) for width in value.split(",") if width.strip()]
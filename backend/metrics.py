@@ -0,0 +1,328 @@
+import json
+import logging
+import threading
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from starlette.routing import Match
+
+try:
+    from pymongo import monitoring
+    CommandListener = monitoring.CommandListener
+    PoolListener = monitoring.ConnectionPoolListener
+except ImportError:  # only the Mongo backend needs the driver
+    CommandListener = PoolListener = object
+
+# Prometheus text exposition, kept dependency-free. Request metrics are
+# recorded by a pure ASGI middleware; Mongo timings come from driver event
+# listeners, which run on Motor's executor threads, so every metric guards
+# its state with a lock.
+
+# Starlette appends the charset for text/* media types
+CONTENT_TYPE = "text/plain; version=0.0.4"
+
+# Seconds; tuned for an API whose reads are mostly served from memory
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+# Route label for requests that matched no route, so scanners can't explode
+# the label space with arbitrary paths
+UNMATCHED_ROUTE = "<unmatched>"
+
+# Mongo commands kept per request for the slow-request log
+MAX_TRACED_COMMANDS = 50
+
+LabelValues = Tuple[str, ...]
+
+_request_trace: ContextVar[Optional[List[dict]]] = ContextVar("request_trace", default=None)
+
+slow_logger = logging.getLogger("portfolio.slow_requests")
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: Sequence[str], values: LabelValues, extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _number(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, label_names: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.label_names = tuple(label_names)
+        self._values: Dict[LabelValues, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, labels: LabelValues = (), amount: float = 1):
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        return [f"{self.name}{_labels(self.label_names, labels)} {_number(value)}" for labels, value in values]
+
+
+class Histogram:
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str, label_names: Sequence[str] = (), buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.name = name
+        self.help = help
+        self.label_names = tuple(label_names)
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: non-cumulative bucket counts (last slot is +Inf) and the sum
+        self._series: Dict[LabelValues, Tuple[List[int], List[float]]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, labels: LabelValues, value: float):
+        slot = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = ([0] * (len(self.buckets) + 1), [0.0])
+            series[0][slot] += 1
+            series[1][0] += value
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            snapshot = sorted((labels, list(counts), total[0]) for labels, (counts, total) in self._series.items())
+        lines = []
+        for labels, counts, total in snapshot:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else _number(bound)
+                bucket_labels = _labels(self.label_names, labels, 'le="%s"' % le)
+                lines.append(f"{self.name}_bucket{bucket_labels} {cumulative}")
+            lines.append(f"{self.name}_sum{_labels(self.label_names, labels)} {_number(total)}")
+            lines.append(f"{self.name}_count{_labels(self.label_names, labels)} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._metrics: Dict[str, object] = {}
+
+    def _register(self, metric):
+        # Registering a name twice returns the original, so a rebuilt
+        # middleware stack keeps counting into the same series
+        return self._metrics.setdefault(metric.name, metric)
+
+    def counter(self, name: str, help: str, label_names: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, help, label_names))
+
+    def histogram(self, name: str, help: str, label_names: Sequence[str] = (), buckets: Sequence[float] = LATENCY_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, help, label_names, buckets))
+
+    def render(self) -> bytes:
+        lines = []
+        for metric in self._metrics.values():
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.samples())
+        return ("\n".join(lines) + "\n").encode()
+
+
+class RequestMetrics:
+    """Pure ASGI middleware recording count, status and latency per route.
+
+    Routes are labelled by their template (`/api/projects/{project_id}`), read
+    from the endpoint the router stored in the scope, never by raw path. With
+    `slow_request_ms` set, requests slower than that are logged together with
+    their parameters and the Mongo commands they issued.
+    """
+
+    def __init__(self, app, registry: MetricsRegistry, slow_request_ms: float = 0, router=None):
+        self.app = app
+        # Used to label requests answered by inner middleware before routing
+        self.router = router
+        self.slow_request_s = slow_request_ms / 1000
+        self.requests = registry.counter(
+            "http_requests_total", "HTTP requests by route and status code.", ("method", "route", "status")
+        )
+        self.latency = registry.histogram(
+            "http_request_duration_seconds", "HTTP request latency by route.", ("method", "route")
+        )
+        self._route_templates: Dict[object, str] = {}
+
+    def _route(self, scope) -> str:
+        endpoint = scope.get("endpoint")
+        if endpoint is None:
+            for route in getattr(self.router, "routes", ()):
+                if route.matches(scope)[0] != Match.NONE:
+                    return route.path
+            return UNMATCHED_ROUTE
+        template = self._route_templates.get(endpoint)
+        if template is None:
+            router = scope.get("router", self.router)
+            for route in getattr(router, "routes", ()):
+                if getattr(route, "endpoint", None) is endpoint:
+                    template = route.path
+                    break
+            else:
+                template = getattr(endpoint, "__name__", UNMATCHED_ROUTE)
+            self._route_templates[endpoint] = template
+        return template
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+        trace_token = _request_trace.set([]) if self.slow_request_s else None
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - started
+            # The router updates the scope in place, so the matched endpoint is visible here
+            route = self._route(scope)
+            self.requests.inc((scope["method"], route, str(status)))
+            self.latency.observe((scope["method"], route), elapsed)
+            if trace_token is not None:
+                commands = _request_trace.get()
+                _request_trace.reset(trace_token)
+                if elapsed >= self.slow_request_s:
+                    self._log_slow(scope, route, status, elapsed, commands)
+
+    def _log_slow(self, scope, route: str, status: int, elapsed: float, commands: List[dict]):
+        record = {
+            "method": scope["method"],
+            "route": route,
+            "path": scope["path"],
+            "query": scope.get("query_string", b"").decode("latin-1"),
+            "path_params": {key: str(value) for key, value in scope.get("path_params", {}).items()},
+            "status": status,
+            "duration_ms": round(elapsed * 1000, 2),
+            "mongo_commands": commands,
+        }
+        slow_logger.warning("Cerere lentă: %s", json.dumps(record, ensure_ascii=False))
+
+
+def _command_collection(event) -> str:
+    if event.command_name == "getMore":
+        target = event.command.get("collection")
+    else:
+        target = event.command.get(event.command_name)
+    return target if isinstance(target, str) else ""
+
+
+class MongoCommandMetrics(CommandListener):
+    """Times every Mongo command by collection and command name."""
+
+    def __init__(self, registry: MetricsRegistry):
+        self.duration = registry.histogram(
+            "mongodb_command_duration_seconds",
+            "Mongo command round-trip time by collection and command.",
+            ("collection", "command"),
+        )
+        self.failures = registry.counter(
+            "mongodb_command_failures_total", "Failed Mongo commands by collection and command.", ("collection", "command")
+        )
+        # The succeeded/failed events don't carry the command document, so the
+        # collection is remembered from the started event
+        self._pending: Dict[Tuple[object, int], str] = {}
+        self._lock = threading.Lock()
+
+    def started(self, event):
+        with self._lock:
+            self._pending[(event.connection_id, event.request_id)] = _command_collection(event)
+
+    def _finish(self, event) -> Tuple[str, float]:
+        with self._lock:
+            collection = self._pending.pop((event.connection_id, event.request_id), "")
+        seconds = event.duration_micros / 1_000_000
+        self.duration.observe((collection, event.command_name), seconds)
+        trace = _request_trace.get()
+        if trace is not None and len(trace) < MAX_TRACED_COMMANDS:
+            trace.append({"collection": collection, "command": event.command_name, "ms": round(seconds * 1000, 3)})
+        return collection, seconds
+
+    def succeeded(self, event):
+        self._finish(event)
+
+    def failed(self, event):
+        collection, _ = self._finish(event)
+        self.failures.inc((collection, event.command_name))
+
+
+class MongoPoolMetrics(PoolListener):
+    """Measures how long operations wait to check a connection out of the pool."""
+
+    def __init__(self, registry: MetricsRegistry):
+        self.wait = registry.histogram(
+            "mongodb_pool_checkout_wait_seconds", "Time spent waiting for a pooled Mongo connection.", ("address",)
+        )
+        self.failures = registry.counter(
+            "mongodb_pool_checkout_failures_total", "Failed Mongo connection checkouts by reason.", ("address", "reason")
+        )
+        # Checkout start and finish are published on the same driver thread
+        self._local = threading.local()
+
+    def connection_check_out_started(self, event):
+        self._local.started = time.perf_counter()
+
+    def connection_checked_out(self, event):
+        started = getattr(self._local, "started", None)
+        if started is not None:
+            self.wait.observe((_address(event.address),), time.perf_counter() - started)
+            self._local.started = None
+
+    def connection_check_out_failed(self, event):
+        self._local.started = None
+        self.failures.inc((_address(event.address), str(event.reason)))
+
+    # The remaining pool events aren't measured, but the driver calls them all
+    def pool_created(self, event):
+        pass
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_cleared(self, event):
+        pass
+
+    def pool_closed(self, event):
+        pass
+
+    def connection_created(self, event):
+        pass
+
+    def connection_ready(self, event):
+        pass
+
+    def connection_closed(self, event):
+        pass
+
+    def connection_checked_in(self, event):
+        pass
+
+
+def _address(address) -> str:
+    return f"{address[0]}:{address[1]}" if address else ""
+
+
+def mongo_listeners(registry: MetricsRegistry) -> list:
+    """Driver event listeners to pass to the Motor client."""
+    return [MongoCommandMetrics(registry), MongoPoolMetrics(registry)]
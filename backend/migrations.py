@@ -0,0 +1,97 @@
+import asyncio
+from datetime import timedelta
+from typing import Awaitable, Callable, List, NamedTuple
+
+from sample_projects import sample_projects
+from storage import Storage
+
+
+class Migration(NamedTuple):
+    name: str
+    apply: Callable[[Storage], Awaitable[None]]
+
+
+# Applied in order, each exactly once per database. Names are recorded in the
+# backend's `_migrations` store, so never rename or reorder a released step;
+# add a new one instead.
+MIGRATIONS: List[Migration] = []
+
+# How long a claimed step may run before another worker assumes its runner
+# died and takes it over; longer than any step is expected to take
+MIGRATION_LEASE = timedelta(minutes=10)
+# How often a worker checks on a step another worker is running
+POLL_INTERVAL = 1.0
+
+
+def migration(name: str):
+    def register(apply: Callable[[Storage], Awaitable[None]]):
+        MIGRATIONS.append(Migration(name, apply))
+        return apply
+    return register
+
+
+@migration("0001_indexes")
+async def create_indexes(storage: Storage):
+    await storage.create_indexes()
+
+
+@migration("0002_sample_projects")
+async def seed_sample_projects(storage: Storage):
+    if await storage.projects.count() == 0:
+        await storage.projects.insert_many(sample_projects())
+        print("Proiectele exemplu au fost adăugate cu succes")
+
+
+@migration("0003_contact_status")
+async def contact_status_counters(storage: Storage):
+    # Adds the (status, created_at) index and seeds the per-status counters
+    await storage.create_indexes()
+    await storage.contacts.rebuild_status_counts()
+
+
+@migration("0004_project_versions")
+async def backfill_project_versions(storage: Storage):
+    # Optimistic concurrency compares stored versions exactly; a missing
+    # field would never match an If-Match and would never advance
+    backfilled = await storage.projects.backfill_versions()
+    if backfilled:
+        print(f"Versiunea 1 a fost setată pentru {backfilled} proiecte")
+
+
+@migration("0005_contact_counts")
+async def rebuild_contact_counters(storage: Storage):
+    # Mongo counters now change in the same transaction as the contacts where
+    # the deployment allows it; start them from an exact count
+    await storage.contacts.rebuild_status_counts()
+
+
+async def pending_migrations(storage: Storage) -> List[str]:
+    applied = await storage.applied_migrations()
+    return [step.name for step in MIGRATIONS if step.name not in applied]
+
+
+async def run_migrations(
+    storage: Storage, lease: timedelta = MIGRATION_LEASE, poll_interval: float = POLL_INTERVAL
+) -> List[str]:
+    """Apply pending migrations and return the names this process ran.
+
+    Each step is claimed as running under a lease and only counts as applied
+    once it is marked done. Workers starting together don't apply a step
+    twice: whoever loses the claim waits until the step is done, so no worker
+    reports ready early, or takes the step over once the lease expires because
+    its runner died. A failed step is released so the next start retries it.
+    """
+    ran = []
+    for step in MIGRATIONS:
+        while step.name not in await storage.applied_migrations():
+            if not await storage.claim_migration(step.name, lease):
+                await asyncio.sleep(poll_interval)
+                continue
+            try:
+                await step.apply(storage)
+            except BaseException:
+                await storage.release_migration(step.name)
+                raise
+            await storage.complete_migration(step.name)
+            ran.append(step.name)
+    return ran
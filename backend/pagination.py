@@ -0,0 +1,71 @@
+import base64
+import binascii
+import json
+from bisect import bisect_left
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+# Keyset pagination over the (created_at, id) ordering shared by projects and
+# contacts. Tokens are opaque to clients: url-safe base64 of the last key seen.
+
+SORT = [("created_at", -1), ("id", -1)]
+SORT_ASCENDING = [("created_at", 1), ("id", 1)]
+
+CursorKey = Tuple[datetime, str]
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def sort_key(doc: Dict[str, Any]) -> CursorKey:
+    return (doc.get("created_at") or datetime.min, doc.get("id", ""))
+
+
+def encode_cursor(doc: Dict[str, Any]) -> str:
+    created_at, doc_id = sort_key(doc)
+    raw = json.dumps([created_at.isoformat(), doc_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(token: str) -> CursorKey:
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        created_at, doc_id = json.loads(base64.urlsafe_b64decode(padded))
+        created_at = datetime.fromisoformat(created_at)
+    except (binascii.Error, ValueError, TypeError) as exc:
+        raise InvalidCursor(token) from exc
+    # Stored timestamps are naive, and so is every cursor encoded from them;
+    # an aware one couldn't be compared with the keys
+    if created_at.tzinfo is not None:
+        raise InvalidCursor(token)
+    return created_at, str(doc_id)
+
+
+def keyset_filter(key: CursorKey, ascending: bool = False) -> Dict[str, Any]:
+    """Mongo filter for documents strictly after `key` in the given order."""
+    created_at, doc_id = key
+    op = "$gt" if ascending else "$lt"
+    return {
+        "$or": [
+            {"created_at": {op: created_at}},
+            {"created_at": created_at, "id": {op: doc_id}},
+        ]
+    }
+
+
+def page_slice(
+    ordered: Sequence[Dict[str, Any]],
+    ascending_keys: List[CursorKey],
+    key: Optional[CursorKey],
+    limit: int,
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """Page through an in-memory newest-first list.
+
+    `ascending_keys` is the same ordering reversed, so the resume point is a
+    single bisect instead of a scan.
+    """
+    start = 0 if key is None else len(ordered) - bisect_left(ascending_keys, key)
+    items = list(ordered[start:start + limit])
+    has_more = start + limit < len(ordered)
+    return items, encode_cursor(items[-1]) if has_more and items else None
@@ -0,0 +1,192 @@
+import asyncio
+import hashlib
+import html
+import os
+import re
+import shutil
+from typing import Any, Callable, Dict, Optional
+
+from static_files import StaticAsset, StaticBuild, precompress, write_atomic
+
+# Project detail pages rendered ahead of time from the build's index.html, so
+# /project/{id} paints the project straight off disk and the bundle hydrates
+# from the embedded JSON instead of calling the API. Snapshots live under
+# <root>/<project id>/<key>.html, the key hashing the project's updated_at
+# together with the index.html it was built from: an edit or a new frontend
+# build simply lands under a new name.
+
+SAFE_ID = re.compile(r"^[A-Za-z0-9_-]{1,64}$")
+DATA_ELEMENT_ID = "project-data"
+
+TITLE_PATTERN = re.compile(r"<title>.*?</title>", re.S)
+LOADING_FALLBACK_PATTERN = re.compile(r'<div id="loading-fallback"[^>]*>.*?</div></div>', re.S)
+ROOT_ELEMENT = '<div id="root"></div>'
+
+# meta tag -> project field its content comes from
+META_FIELDS = {
+    ("name", "title"): "title",
+    ("name", "description"): "description",
+    ("property", "og:title"): "title",
+    ("property", "og:description"): "description",
+    ("property", "og:image"): "hero_image",
+    ("property", "twitter:title"): "title",
+    ("property", "twitter:description"): "description",
+    ("property", "twitter:image"): "hero_image",
+}
+DESCRIPTION_LENGTH = 300
+
+
+def _attribute(value: Any) -> str:
+    return html.escape(str(value or ""), quote=True)
+
+
+def _embed_json(payload: bytes) -> str:
+    # The JSON sits inside <script>, so nothing in it may close the element
+    return payload.decode().replace("<", "\\u003c").replace(">", "\\u003e").replace("&", "\\u0026")
+
+
+def _meta_content(project: Dict[str, Any], field: str) -> str:
+    value = str(project.get(field) or "")
+    if field == "description" and len(value) > DESCRIPTION_LENGTH:
+        value = value[:DESCRIPTION_LENGTH - 1].rsplit(" ", 1)[0] + "…"
+    return value
+
+
+def render_snapshot(template: str, project: Dict[str, Any], payload: bytes) -> bytes:
+    """The index.html template with the project inlined; `payload` is its API JSON."""
+    page = TITLE_PATTERN.sub(
+        lambda _: f"<title>{html.escape(project['title'])} - {html.escape(project.get('subtitle') or '')}</title>",
+        template,
+        count=1,
+    )
+    for (kind, name), field in META_FIELDS.items():
+        content = _attribute(_meta_content(project, field))
+        page = re.sub(
+            r'(<meta %s="%s" content=")[^"]*(")' % (kind, re.escape(name)),
+            lambda match: match.group(1) + content + match.group(2),
+            page,
+        )
+    hero = _attribute(project.get("hero_image"))
+    page = page.replace("</head>", f'<link rel="preload" as="image" href="{hero}"></head>', 1)
+
+    # The spinner overlay would hide the prerendered content until the bundle runs
+    page = LOADING_FALLBACK_PATTERN.sub("", page, count=1)
+    title = html.escape(project["title"])
+    content = (
+        '<div id="root"><div class="min-h-screen bg-dark-900 pt-24">'
+        '<section class="relative min-h-screen flex items-center justify-center">'
+        f'<div class="absolute inset-0"><img src="{hero}" alt="{_attribute(project["title"])}" class="w-full h-full object-cover"/></div>'
+        '<div class="relative z-10 text-center max-w-4xl mx-auto px-6">'
+        f'<span class="text-gold font-mono text-sm uppercase tracking-wider">{html.escape(project.get("category") or "")}</span>'
+        f'<h1 class="hero-title mb-4">{title}</h1>'
+        f'<p class="text-2xl text-silver mb-8">{html.escape(project.get("subtitle") or "")}</p>'
+        '</div></section>'
+        f'<section class="max-w-4xl mx-auto px-6 py-24"><p class="text-silver">{html.escape(project.get("description") or "")}</p></section>'
+        '</div></div>'
+        f'<script id="{DATA_ELEMENT_ID}" type="application/json">{_embed_json(payload)}</script>'
+    )
+    return page.replace(ROOT_ELEMENT, content, 1).encode()
+
+
+class ProjectSnapshots:
+    """Prerendered /project/{id} pages on disk, refreshed off the request path.
+
+    `encode` turns a catalog project into the bytes GET /api/projects/{id}
+    would return, so the embedded JSON matches what the page would fetch.
+    """
+
+    def __init__(self, root: str, build: StaticBuild, encode: Callable[[Dict[str, Any]], bytes]):
+        self.root = root
+        self.build = build
+        self.encode = encode
+        # project id -> its current snapshot
+        self._assets: Dict[str, StaticAsset] = {}
+        # project id -> latest project to render, or None once deleted; one
+        # drain task per id works through them so writes never reorder
+        self._latest: Dict[str, Optional[Dict[str, Any]]] = {}
+        self._tasks = set()
+        self._template: Optional[str] = None
+        self._template_etag: Optional[str] = None
+
+    def path_for(self, project: Dict[str, Any]) -> Optional[str]:
+        index = self.build.index
+        if index is None or not SAFE_ID.match(project["id"]):
+            return None
+        key = hashlib.sha256(f"{project['updated_at'].isoformat()}|{index.etag}".encode()).hexdigest()[:16]
+        return os.path.join(self.root, project["id"], f"{key}.html")
+
+    def cached(self, project: Dict[str, Any]) -> Optional[StaticAsset]:
+        """The snapshot this process last wrote or found for this exact revision."""
+        asset = self._assets.get(project["id"])
+        return asset if asset is not None and asset.path == self.path_for(project) else None
+
+    def write(self, project: Dict[str, Any]) -> Optional[StaticAsset]:
+        """Render and store the snapshot if missing, dropping older revisions; blocking."""
+        path = self.path_for(project)
+        if path is None:
+            return None
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            write_atomic(path, render_snapshot(self._read_template(), project, self.encode(project)))
+        for name in os.listdir(os.path.dirname(path)):
+            stale = os.path.join(os.path.dirname(path), name)
+            if not stale.startswith(path):
+                try:
+                    os.unlink(stale)
+                except FileNotFoundError:
+                    pass
+        asset = StaticAsset(path, immutable=False)
+        precompress(asset)
+        self._assets[project["id"]] = asset
+        return asset
+
+    def delete(self, project_id: str):
+        self._assets.pop(project_id, None)
+        if SAFE_ID.match(project_id):
+            shutil.rmtree(os.path.join(self.root, project_id), ignore_errors=True)
+
+    def _read_template(self) -> str:
+        index = self.build.index
+        if self._template_etag != index.etag:
+            with open(index.path, encoding="utf-8") as handle:
+                self._template = handle.read()
+            self._template_etag = index.etag
+        return self._template
+
+    def refresh(self, project: Dict[str, Any]):
+        """Re-render `project` in the background."""
+        self._enqueue(project["id"], project)
+
+    def discard(self, project_id: str):
+        """Remove the project's snapshots in the background."""
+        self._enqueue(project_id, None)
+
+    def _enqueue(self, project_id: str, project: Optional[Dict[str, Any]]):
+        idle = project_id not in self._latest
+        self._latest[project_id] = project
+        if idle:
+            task = asyncio.create_task(self._drain(project_id))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _drain(self, project_id: str):
+        try:
+            while True:
+                project = self._latest[project_id]
+                try:
+                    if project is None:
+                        await asyncio.to_thread(self.delete, project_id)
+                    else:
+                        await asyncio.to_thread(self.write, project)
+                except Exception as exc:
+                    # Pages fall back to rendering on request; nothing to retry here
+                    print(f"Eroare la generarea paginii pentru proiectul {project_id}: {exc}")
+                if self._latest[project_id] is project:
+                    break
+        finally:
+            self._latest.pop(project_id, None)
+
+    async def wait(self):
+        """Wait for queued renders; used at shutdown."""
+        while self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
@@ -0,0 +1,220 @@
+import asyncio
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Load shedding for cheap-to-send, expensive-to-handle endpoints. The
+# middleware runs before routing, so a rejected request never reaches body
+# parsing, pydantic validation or the database.
+
+TOO_MANY_REQUESTS = json.dumps(
+    {"detail": "Prea multe cereri, încercați din nou mai târziu"}, ensure_ascii=False
+).encode()
+PAYLOAD_TOO_LARGE = json.dumps({"detail": "Mesajul este prea mare"}, ensure_ascii=False).encode()
+
+StoredResponse = Tuple[int, List[Tuple[bytes, bytes]], bytes]
+
+
+class TokenBucketLimiter:
+    """Per-client token buckets held in a bounded LRU.
+
+    Each client may spend `burst` requests at once and regains `rate` tokens
+    per second. Once `max_clients` buckets exist the least recently seen one
+    is dropped; a dropped client simply starts again with a full bucket.
+    """
+
+    def __init__(self, rate: float, burst: int, max_clients: int = 10000):
+        self.rate = rate
+        self.burst = burst
+        self.max_clients = max_clients
+        # client -> [tokens, last refill]
+        self._buckets: "OrderedDict[str, List[float]]" = OrderedDict()
+
+    def retry_after(self, client: str) -> Optional[float]:
+        """Take a token for `client`; returns None if allowed, else seconds to wait."""
+        now = time.monotonic()
+        bucket = self._buckets.get(client)
+        if bucket is None:
+            bucket = self._buckets[client] = [float(self.burst), now]
+            if len(self._buckets) > self.max_clients:
+                self._buckets.popitem(last=False)
+        else:
+            self._buckets.move_to_end(client)
+            bucket[0] = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+            bucket[1] = now
+        if bucket[0] >= 1:
+            bucket[0] -= 1
+            return None
+        return (1 - bucket[0]) / self.rate if self.rate > 0 else 60.0
+
+
+class DuplicateWindow:
+    """Responses to recent submissions, keyed by a hash of their content."""
+
+    def __init__(self, window: float, max_entries: int = 10000):
+        self.window = window
+        self.max_entries = max_entries
+        # digest -> (expires at, response), oldest first
+        self._entries: "OrderedDict[str, Tuple[float, StoredResponse]]" = OrderedDict()
+        # Submissions still being handled, so concurrent duplicates can wait
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+    def get(self, digest: str) -> Optional[StoredResponse]:
+        now = time.monotonic()
+        # Entries share one lifetime, so expired ones are always at the front
+        while self._entries and next(iter(self._entries.values()))[0] <= now:
+            self._entries.popitem(last=False)
+        entry = self._entries.get(digest)
+        return entry[1] if entry else None
+
+    async def wait(self, digest: str):
+        """Wait until no identical submission is being handled."""
+        while digest in self._inflight:
+            await asyncio.shield(self._inflight[digest])
+
+    def begin(self, digest: str):
+        self._inflight[digest] = asyncio.get_running_loop().create_future()
+
+    def finish(self, digest: str, response: Optional[StoredResponse]):
+        if response is not None:
+            self._entries[digest] = (time.monotonic() + self.window, response)
+            self._entries.move_to_end(digest)
+            if len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        self._inflight.pop(digest).set_result(None)
+
+
+def content_digest(body: bytes) -> str:
+    # Canonical JSON so key order and whitespace don't defeat the check;
+    # anything unparsable is hashed as-is and left for the route to reject
+    try:
+        canonical = json.dumps(json.loads(body), sort_keys=True, ensure_ascii=False).encode()
+    except (ValueError, UnicodeDecodeError):
+        canonical = body
+    return hashlib.sha256(canonical).hexdigest()
+
+
+class SubmissionShield:
+    """Pure ASGI middleware guarding POSTs to `paths`.
+
+    Requests over the client's rate get a 429 before the body is read. The
+    rest are hashed, and a submission identical to one answered within the
+    duplicate window gets that original response back instead of being
+    handled again.
+    """
+
+    def __init__(
+        self,
+        app,
+        paths: Iterable[str],
+        limiter: TokenBucketLimiter,
+        duplicates: Optional[DuplicateWindow] = None,
+        max_body: int = 64 * 1024,
+        trust_forwarded: bool = False,
+    ):
+        self.app = app
+        self.paths = frozenset(paths)
+        self.limiter = limiter
+        self.duplicates = duplicates
+        self.max_body = max_body
+        self.trust_forwarded = trust_forwarded
+
+    def _client(self, scope) -> str:
+        if self.trust_forwarded:
+            for name, value in scope["headers"]:
+                if name == b"x-forwarded-for":
+                    # The last hop was added by our own proxy; earlier ones are client-supplied
+                    return value.decode("latin-1").rsplit(",", 1)[-1].strip()
+        client = scope.get("client")
+        return client[0] if client else ""
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] != "POST" or scope["path"] not in self.paths:
+            await self.app(scope, receive, send)
+            return
+
+        retry_after = self.limiter.retry_after(self._client(scope))
+        if retry_after is not None:
+            headers = [(b"retry-after", str(max(1, round(retry_after))).encode())]
+            await _send_response(send, 429, TOO_MANY_REQUESTS, headers)
+            return
+        if self.duplicates is None:
+            await self.app(scope, receive, send)
+            return
+
+        body = await _read_body(receive, self.max_body)
+        if body is None:
+            await _send_response(send, 413, PAYLOAD_TOO_LARGE)
+            return
+        digest = content_digest(body)
+
+        await self.duplicates.wait(digest)
+        stored = self.duplicates.get(digest)
+        if stored is not None:
+            await _replay(send, stored)
+            return
+
+        self.duplicates.begin(digest)
+        status, headers, chunks = 500, [], []
+
+        body_sent = False
+
+        async def replay_body():
+            nonlocal body_sent
+            if body_sent:
+                # Later reads only ever wait for the disconnect
+                return await receive()
+            body_sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+
+        async def capture(message):
+            nonlocal status, headers
+            if message["type"] == "http.response.start":
+                status, headers = message["status"], list(message.get("headers", []))
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, replay_body, capture)
+        finally:
+            # Only accepted submissions are collapsed; errors stay retryable
+            accepted = 200 <= status < 300
+            self.duplicates.finish(digest, (status, headers, b"".join(chunks)) if accepted else None)
+
+
+async def _read_body(receive, limit: int) -> Optional[bytes]:
+    chunks, size = [], 0
+    while True:
+        message = await receive()
+        if message["type"] == "http.disconnect":
+            break
+        chunk = message.get("body", b"")
+        size += len(chunk)
+        if size > limit:
+            return None
+        chunks.append(chunk)
+        if not message.get("more_body", False):
+            break
+    return b"".join(chunks)
+
+
+async def _send_response(send, status: int, body: bytes, headers: Optional[List[Tuple[bytes, bytes]]] = None):
+    await send({
+        "type": "http.response.start",
+        "status": status,
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+            *(headers or []),
+        ],
+    })
+    await send({"type": "http.response.body", "body": body})
+
+
+async def _replay(send, stored: StoredResponse):
+    status, headers, body = stored
+    await send({"type": "http.response.start", "status": status, "headers": headers})
+    await send({"type": "http.response.body", "body": body})
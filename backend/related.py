@@ -0,0 +1,206 @@
+from typing import Any, Dict, Iterable, List, Tuple
+
+import numpy as np
+
+# Weighted Jaccard-style similarity over tech stacks: the share of
+# technologies two projects have in common, plus a flat bonus when they are in
+# the same category
+CATEGORY_BOOST = 0.25
+# Neighbours kept per project; the endpoint's `k` can't exceed this
+MAX_RELATED = 12
+
+INITIAL_ROWS = 64
+INITIAL_COLUMNS = 64
+# Rows ranked per matrix product
+RANK_BATCH = 256
+
+
+def _technologies(project: Dict[str, Any]) -> List[str]:
+    return list(dict.fromkeys(tech.strip().lower() for tech in project.get("tech_stack") or [] if tech.strip()))
+
+
+class RelatedIndex:
+    """Each project's top neighbours by similarity, kept current on writes.
+
+    Projects are rows of a one-hot technology matrix, so scoring a set of
+    projects against all others is one matrix product. Only the neighbour
+    lists and their scores are stored, never the n x n similarity matrix:
+    memory and the occasional row growth stay linear in the project count.
+
+    A write scores the changed project against every other one, then
+    re-ranks only the projects whose neighbour list it enters or drops out
+    of. A lookup reads the stored list.
+
+    Removal moves the last row into the freed slot so rows stay dense.
+    Technology columns are never reclaimed; a rebuild compacts them.
+    """
+
+    def __init__(self, capacity: int = INITIAL_ROWS):
+        self.size = 0
+        self.ids: List[str] = []
+        self.rows: Dict[str, int] = {}
+        self.columns: Dict[str, int] = {}
+        self.category_codes: Dict[str, int] = {}
+        self.matrix = np.zeros((capacity, INITIAL_COLUMNS), dtype=np.float32)
+        self.counts = np.zeros(capacity, dtype=np.float32)
+        self.categories = np.full(capacity, -1, dtype=np.int32)
+        # Neighbour rows best first, -1 padded, their scores, and the score a
+        # newcomer must beat to enter the list (0 while it has free slots)
+        self.top = np.full((capacity, MAX_RELATED), -1, dtype=np.int32)
+        self.top_scores = np.zeros((capacity, MAX_RELATED), dtype=np.float32)
+        self.floor = np.zeros(capacity, dtype=np.float32)
+
+    def rebuild(self, projects: Iterable[Dict[str, Any]]):
+        projects = list(projects)
+        # Headroom for the writes that follow, so they rarely grow the rows
+        self.__init__(max(INITIAL_ROWS, 2 * len(projects)))
+        n = self.size = len(projects)
+        if not n:
+            return
+        self.ids = [project["id"] for project in projects]
+        self.rows = {project_id: row for row, project_id in enumerate(self.ids)}
+        stacks = [_technologies(project) for project in projects]
+        for technologies in stacks:
+            for tech in technologies:
+                self.columns.setdefault(tech, len(self.columns))
+        self._reserve_columns(len(self.columns))
+        # One fancy assignment for the whole one-hot matrix
+        rows = [row for row, technologies in enumerate(stacks) for _ in technologies]
+        columns = [self.columns[tech] for technologies in stacks for tech in technologies]
+        self.matrix[rows, columns] = 1
+        self.counts[:n] = [len(technologies) for technologies in stacks]
+        self.categories[:n] = [self._category_code(project) for project in projects]
+        self._rank(np.arange(n))
+
+    def add(self, project: Dict[str, Any]):
+        row = self.rows.get(project["id"])
+        if row is None:
+            self._reserve_rows(self.size + 1)
+            row = self.rows[project["id"]] = self.size
+            self.ids.append(project["id"])
+            self.size += 1
+        self._encode(row, project)
+
+        n = self.size
+        scores = self._scores(np.array([row]))[0]
+        # Only lists this project was in, or now qualifies for, can change
+        affected = (self.top[:n] == row).any(axis=1) | (scores > self.floor[:n])
+        affected[row] = True
+        self._rank(np.flatnonzero(affected))
+
+    def remove(self, project_id: str):
+        row = self.rows.pop(project_id, None)
+        if row is None:
+            return
+        n = self.size
+        last = n - 1
+        affected = (self.top[:n] == row).any(axis=1)
+        if last != row:
+            # Move the last project into the freed row
+            moved = self.ids[last]
+            self.ids[row] = moved
+            self.rows[moved] = row
+            self.matrix[row] = self.matrix[last]
+            self.counts[row] = self.counts[last]
+            self.categories[row] = self.categories[last]
+            self.top[row] = self.top[last]
+            self.top_scores[row] = self.top_scores[last]
+            self.floor[row] = self.floor[last]
+            affected[row] = affected[last]
+            self.top[:n][self.top[:n] == last] = row
+        self.ids.pop()
+        self.matrix[last] = 0
+        self.size = last
+        self._rank(np.flatnonzero(affected[:last]))
+
+    def related(self, project_id: str, k: int = MAX_RELATED) -> List[Tuple[str, float]]:
+        """Up to `k` (id, score) pairs, most similar first."""
+        row = self.rows.get(project_id)
+        if row is None:
+            return []
+        return [
+            (self.ids[neighbour], float(score))
+            for neighbour, score in zip(self.top[row, :k], self.top_scores[row, :k])
+            if neighbour >= 0
+        ]
+
+    def _encode(self, row: int, project: Dict[str, Any]):
+        technologies = _technologies(project)
+        for tech in technologies:
+            if tech not in self.columns:
+                self._reserve_columns(len(self.columns) + 1)
+                self.columns[tech] = len(self.columns)
+        self.matrix[row] = 0
+        self.matrix[row, [self.columns[tech] for tech in technologies]] = 1
+        self.counts[row] = len(technologies)
+        self.categories[row] = self._category_code(project)
+
+    def _category_code(self, project: Dict[str, Any]) -> int:
+        category = project.get("category")
+        return self.category_codes.setdefault(category, len(self.category_codes)) if category else -1
+
+    def _scores(self, rows: np.ndarray) -> np.ndarray:
+        """Similarity of `rows` to every project, each to itself at -inf."""
+        n, columns = self.size, len(self.columns)
+        scores = self.matrix[rows, :columns] @ self.matrix[:n, :columns].T
+        union = self.counts[rows, None] + self.counts[None, :n]
+        union -= scores
+        # Two empty stacks have nothing in common: 0 / 1
+        np.maximum(union, 1, out=union)
+        scores /= union
+        same = self.categories[rows, None] == self.categories[None, :n]
+        same &= self.categories[rows, None] >= 0
+        np.add(scores, CATEGORY_BOOST, out=scores, where=same)
+        scores[np.arange(len(rows)), rows] = -np.inf
+        return scores
+
+    def _rank(self, rows: np.ndarray):
+        """Recompute the neighbour lists of `rows`."""
+        n = self.size
+        if not len(rows):
+            return
+        k = min(MAX_RELATED, n)
+        # In batches, so a rebuild never holds more than RANK_BATCH x n scores
+        for start in range(0, len(rows), RANK_BATCH):
+            batch = rows[start:start + RANK_BATCH]
+            # Negated so the partition puts the best first
+            scores = self._scores(batch)
+            np.negative(scores, out=scores)
+            candidates = np.argpartition(scores, k - 1, axis=1)[:, :k]
+            candidate_scores = np.take_along_axis(scores, candidates, axis=1)
+            order = np.argsort(candidate_scores, axis=1, kind="stable")
+            best = np.take_along_axis(candidates, order, axis=1)
+            best_scores = -np.take_along_axis(candidate_scores, order, axis=1)
+            # Unrelated projects (and the project itself, at -inf) are never listed
+            unrelated = best_scores <= 0
+            best[unrelated] = -1
+            best_scores[unrelated] = 0
+            self.top[batch] = -1
+            self.top[batch, :k] = best
+            self.top_scores[batch] = 0
+            self.top_scores[batch, :k] = best_scores
+            full = (k == MAX_RELATED) & (best[:, -1] >= 0)
+            self.floor[batch] = np.where(full, best_scores[:, -1], 0)
+
+    def _reserve_rows(self, needed: int):
+        capacity = len(self.counts)
+        if needed <= capacity:
+            return
+        capacity = max(needed, 2 * capacity)
+        self.matrix = self._resized(self.matrix, (capacity, self.matrix.shape[1]), 0)
+        self.counts = self._resized(self.counts, (capacity,), 0)
+        self.categories = self._resized(self.categories, (capacity,), -1)
+        self.top = self._resized(self.top, (capacity, MAX_RELATED), -1)
+        self.top_scores = self._resized(self.top_scores, (capacity, MAX_RELATED), 0)
+        self.floor = self._resized(self.floor, (capacity,), 0)
+
+    def _reserve_columns(self, needed: int):
+        capacity = self.matrix.shape[1]
+        if needed > capacity:
+            self.matrix = self._resized(self.matrix, (self.matrix.shape[0], max(needed, 2 * capacity)), 0)
+
+    @staticmethod
+    def _resized(array: np.ndarray, shape: Tuple[int, ...], fill) -> np.ndarray:
+        resized = np.full(shape, fill, dtype=array.dtype)
+        resized[tuple(slice(0, extent) for extent in array.shape)] = array
+        return resized
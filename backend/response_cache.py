@@ -0,0 +1,140 @@
+import gzip
+import hashlib
+from collections import OrderedDict
+from typing import Callable, Dict, Optional, Tuple
+
+from starlette.requests import Request
+from starlette.responses import Response
+
+try:
+    import brotli
+except ImportError:  # brotli is optional; gzip is always available
+    brotli = None
+
+# Bodies smaller than this are not worth a Content-Encoding header
+MIN_COMPRESS_SIZE = 512
+
+
+def make_etag(*parts: object) -> str:
+    digest = hashlib.sha1("|".join(str(part) for part in parts).encode()).hexdigest()
+    return f'"{digest[:24]}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    # Tolerate weak validators added by proxies that re-encode the body
+    candidates = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    return etag in candidates
+
+
+def encoded_etag(etag: str, encoding: str) -> str:
+    """The strong validator of one content-coding of the representation tagged `etag`."""
+    return f'{etag[:-1]}-{encoding}"'
+
+
+def matching_etag(request: Request, etag: str) -> Optional[str]:
+    """The tag of whichever encoding of `etag` the client already holds, if any.
+
+    Checked before a body is built, so a revalidation costs no encoding work.
+    """
+    for candidate in (etag, encoded_etag(etag, "br"), encoded_etag(etag, "gzip")):
+        if etag_matches(request, candidate):
+            return candidate
+    return None
+
+
+def accepted_encodings(request: Request) -> Dict[str, float]:
+    accepted = {}
+    for item in request.headers.get("accept-encoding", "").split(","):
+        name, _, params = item.strip().partition(";")
+        quality = 1.0
+        if params.strip().startswith("q="):
+            try:
+                quality = float(params.strip()[2:])
+            except ValueError:
+                continue
+        if name:
+            accepted[name.lower()] = quality
+    return accepted
+
+
+class EncodedBody:
+    """A response body encoded once and compressed ahead of time."""
+
+    __slots__ = ("etag", "identity", "gzip", "br", "headers")
+
+    def __init__(self, etag: str, body: bytes, headers: Optional[Dict[str, str]] = None):
+        self.etag = etag
+        self.identity = body
+        self.headers = headers or {}
+        compress = len(body) >= MIN_COMPRESS_SIZE
+        self.gzip = gzip.compress(body, compresslevel=6, mtime=0) if compress else None
+        self.br = brotli.compress(body, quality=5) if compress and brotli else None
+
+    def response(self, request: Request, media_type: str = "application/json") -> Response:
+        """The best encoding the client accepts.
+
+        Each encoding is its own representation with its own ETag, so a cache
+        never serves gzip bytes to a client that revalidated the identity body.
+        """
+        accepted = accepted_encodings(request)
+        headers = dict(self.headers, Vary="Accept-Encoding")
+        etag = self.etag
+        if self.br is not None and accepted.get("br", 0) > 0:
+            body, headers["Content-Encoding"], etag = self.br, "br", encoded_etag(self.etag, "br")
+        elif self.gzip is not None and accepted.get("gzip", 0) > 0:
+            body, headers["Content-Encoding"], etag = self.gzip, "gzip", encoded_etag(self.etag, "gzip")
+        else:
+            body = self.identity
+        headers["ETag"] = etag
+        return Response(content=body, media_type=media_type, headers=headers)
+
+
+class ResponseCache:
+    """Bounded LRU of encoded bodies, dropped when the data version they were built from moves.
+
+    Entries built with version None are kept across version moves: their
+    ETag already identifies the data, as with single-project bodies.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self.version: Optional[str] = None
+        self._entries: "OrderedDict[str, EncodedBody]" = OrderedDict()
+        # Keys of the entries built against self.version
+        self._versioned = set()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_or_build(
+        self,
+        version: Optional[str],
+        etag: str,
+        build: Callable[[], Tuple[bytes, Optional[Dict[str, str]]]],
+    ) -> EncodedBody:
+        if version is not None and version != self.version:
+            for key in self._versioned:
+                self._entries.pop(key, None)
+            self._versioned.clear()
+            self.version = version
+        entry = self._entries.get(etag)
+        if entry is not None:
+            self._entries.move_to_end(etag)
+            return entry
+        body, headers = build()
+        entry = self._entries[etag] = EncodedBody(etag, body, headers)
+        if version is not None:
+            self._versioned.add(etag)
+        if len(self._entries) > self.max_entries:
+            evicted, _ = self._entries.popitem(last=False)
+            self._versioned.discard(evicted)
+        return entry
+
+
+def not_modified(etag: str, headers: Optional[Dict[str, str]] = None) -> Response:
+    return Response(status_code=304, headers=dict(headers or {}, ETag=etag, Vary="Accept-Encoding"))
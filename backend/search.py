@@ -0,0 +1,125 @@
+import math
+import re
+import unicodedata
+from bisect import bisect_left, insort
+from collections import Counter
+from typing import Any, Dict, List, Set, Tuple
+
+# Field weights for the BM25F-style score: a hit in the title outranks the
+# same word buried in the description
+FIELD_WEIGHTS = {"title": 3.0, "subtitle": 2.0, "tech_stack": 2.0, "category": 2.0, "description": 1.0}
+
+K1 = 1.2
+B = 0.75
+# Upper bound on vocabulary terms a type-ahead prefix may expand to
+MAX_PREFIX_EXPANSIONS = 64
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+def fold(text: str) -> str:
+    """Lowercase and strip diacritics, so "ștergere" matches "stergere"."""
+    decomposed = unicodedata.normalize("NFKD", text.lower())
+    return "".join(char for char in decomposed if not unicodedata.combining(char))
+
+
+def tokenize(text: str) -> List[str]:
+    return TOKEN_PATTERN.findall(fold(text))
+
+
+def _field_text(value: Any) -> str:
+    if isinstance(value, list):
+        return " ".join(str(item) for item in value)
+    return str(value or "")
+
+
+class SearchIndex:
+    """Inverted index over project text with BM25 ranking.
+
+    Postings map each folded term to per-document weighted term frequencies.
+    A sorted vocabulary supports prefix lookups for the last query token, so
+    results update as the user types.
+    """
+
+    def __init__(self):
+        self.postings: Dict[str, Dict[str, float]] = {}
+        self.vocabulary: List[str] = []
+        self.doc_lengths: Dict[str, float] = {}
+        self.doc_terms: Dict[str, Set[str]] = {}
+        self._total_length = 0.0
+
+    def __len__(self) -> int:
+        return len(self.doc_lengths)
+
+    def rebuild(self, projects: List[Dict[str, Any]]):
+        self.__init__()
+        for project in projects:
+            self.add(project)
+
+    def add(self, project: Dict[str, Any]):
+        doc_id = project["id"]
+        self.remove(doc_id)
+        frequencies: Counter = Counter()
+        for field, weight in FIELD_WEIGHTS.items():
+            for token in tokenize(_field_text(project.get(field))):
+                frequencies[token] += weight
+        for term, frequency in frequencies.items():
+            postings = self.postings.get(term)
+            if postings is None:
+                postings = self.postings[term] = {}
+                insort(self.vocabulary, term)
+            postings[doc_id] = frequency
+        length = sum(frequencies.values())
+        self.doc_lengths[doc_id] = length
+        self.doc_terms[doc_id] = set(frequencies)
+        self._total_length += length
+
+    def remove(self, doc_id: str):
+        terms = self.doc_terms.pop(doc_id, None)
+        if terms is None:
+            return
+        self._total_length -= self.doc_lengths.pop(doc_id)
+        for term in terms:
+            postings = self.postings[term]
+            del postings[doc_id]
+            if not postings:
+                del self.postings[term]
+                del self.vocabulary[bisect_left(self.vocabulary, term)]
+
+    def expand(self, prefix: str) -> List[str]:
+        start = bisect_left(self.vocabulary, prefix)
+        terms = []
+        for term in self.vocabulary[start:start + MAX_PREFIX_EXPANSIONS]:
+            if not term.startswith(prefix):
+                break
+            terms.append(term)
+        return terms
+
+    def search(self, query: str, limit: int = 10) -> List[Tuple[str, float]]:
+        tokens = tokenize(query)
+        if not tokens or not self.doc_lengths:
+            return []
+        count = len(self.doc_lengths)
+        average_length = self._total_length / count or 1.0
+        scores: Dict[str, float] = {}
+        matched: Dict[str, int] = {}
+        for position, token in enumerate(tokens):
+            # Only the token being typed is treated as a prefix
+            terms = self.expand(token) if position == len(tokens) - 1 else [token]
+            token_scores: Dict[str, float] = {}
+            for term in terms:
+                postings = self.postings.get(term)
+                if not postings:
+                    continue
+                idf = math.log(1 + (count - len(postings) + 0.5) / (len(postings) + 0.5))
+                for doc_id, frequency in postings.items():
+                    norm = K1 * (1 - B + B * self.doc_lengths[doc_id] / average_length)
+                    score = idf * frequency * (K1 + 1) / (frequency + norm)
+                    token_scores[doc_id] = max(token_scores.get(doc_id, 0.0), score)
+            for doc_id, score in token_scores.items():
+                scores[doc_id] = scores.get(doc_id, 0.0) + score
+                matched[doc_id] = matched.get(doc_id, 0) + 1
+        # Every query token has to match something in the project
+        ranked = [(doc_id, score) for doc_id, score in scores.items() if matched[doc_id] == len(tokens)]
+        ranked.sort(key=lambda hit: (-hit[1], hit[0]))
+        return ranked[:limit]
@@ -1,19 +1,65 @@
-from fastapi import FastAPI, HTTPException, UploadFile, File, Form
+from fastapi import FastAPI, Header, HTTPException, UploadFile, File, Query, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from motor.motor_asyncio import AsyncIOMotorClient
-from pydantic import BaseModel, EmailStr
-from typing import List, Optional
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import FileResponse, JSONResponse, StreamingResponse
+from pydantic import BaseModel, EmailStr, Field, TypeAdapter, ValidationError
+from typing import Any, Dict, List, Literal, Optional
+from contextlib import asynccontextmanager
+import asyncio
 import os
-from datetime import datetime
+from datetime import datetime, timedelta
 import uuid
 import json
 from dotenv import load_dotenv
 
+from catalog import ProjectCatalog, select_fields
+from contact_queue import ContactWriteQueue, QueueFull
+from export import csv_stream, ndjson_stream
+from images import IMMUTABLE_CACHE, ImageStore, InvalidImage, attach_srcsets, parse_widths
+from metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE, MetricsRegistry, RequestMetrics, mongo_listeners
+from migrations import MIGRATION_LEASE as DEFAULT_MIGRATION_LEASE, pending_migrations, run_migrations
+from pagination import InvalidCursor, decode_cursor, encode_cursor, page_slice
+from prerender import ProjectSnapshots
+from rate_limit import DuplicateWindow, SubmissionShield, TokenBucketLimiter
+from related import MAX_RELATED
+from response_cache import ResponseCache, make_etag, matching_etag, not_modified
+from shared_catalog import SharedCatalogSegment, default_path as default_segment_path
+from static_files import StaticBuild, StaticFileResponse
+from storage import StorageError, VersionConflict, create_storage
+
 # Load environment variables
 load_dotenv()
 
-app = FastAPI(title="API Portofoliu Luxos", version="1.0.0")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await start_services()
+    try:
+        yield
+    finally:
+        await stop_services()
+
+app = FastAPI(title="API Portofoliu Luxos", version="1.0.0", lifespan=lifespan)
+
+# Load shedding for the public contact form: a per-IP token bucket answers
+# floods with 429 before the body is parsed, and identical submissions within
+# CONTACT_DUPLICATE_WINDOW seconds (0 disables) get the original response back.
+# Added before CORS so rejections still carry CORS headers.
+CONTACT_DUPLICATE_WINDOW = float(os.getenv("CONTACT_DUPLICATE_WINDOW", "600"))
+app.add_middleware(
+    SubmissionShield,
+    paths=["/api/contact"],
+    limiter=TokenBucketLimiter(
+        rate=float(os.getenv("CONTACT_RATE_PER_MINUTE", "5")) / 60,
+        burst=int(os.getenv("CONTACT_RATE_BURST", "5")),
+        max_clients=int(os.getenv("CONTACT_RATE_CLIENTS", "10000")),
+    ),
+    duplicates=DuplicateWindow(
+        CONTACT_DUPLICATE_WINDOW, max_entries=int(os.getenv("CONTACT_DUPLICATE_ENTRIES", "10000"))
+    ) if CONTACT_DUPLICATE_WINDOW > 0 else None,
+    max_body=int(os.getenv("CONTACT_MAX_BODY_BYTES", str(64 * 1024))),
+    # Only behind a proxy that appends the real client address
+    trust_forwarded=os.getenv("TRUST_FORWARDED_FOR", "0") == "1",
+)
 
 # CORS middleware
 app.add_middleware(
@@ -22,12 +68,92 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "ETag"],
 )
 
-# MongoDB connection
+# Prometheus metrics on /metrics. Requests slower than SLOW_REQUEST_MS (0 turns
+# the log off) are logged with their parameters and Mongo commands.
+metrics = MetricsRegistry()
+SLOW_REQUEST_MS = float(os.getenv("SLOW_REQUEST_MS", "0"))
+app.add_middleware(RequestMetrics, registry=metrics, slow_request_ms=SLOW_REQUEST_MS, router=app.router)
+
+# Storage backend: "mongo" (default), "sqlite" for a local WAL-mode file, or
+# "memory" for hermetic tests and benchmarks
 MONGO_URL = os.getenv("MONGO_URL", "mongodb://localhost:27017/portfolio_db")
-client = AsyncIOMotorClient(MONGO_URL)
-db = client.portfolio_db
+STORAGE_BACKEND = os.getenv("STORAGE_BACKEND", "mongo")
+storage = create_storage(
+    STORAGE_BACKEND,
+    mongo_url=MONGO_URL,
+    mongo_listeners=mongo_listeners(metrics),
+    mongo_options={
+        "maxPoolSize": int(os.getenv("MONGO_MAX_POOL_SIZE", "100")),
+        "minPoolSize": int(os.getenv("MONGO_MIN_POOL_SIZE", "0")),
+        "serverSelectionTimeoutMS": int(os.getenv("MONGO_SERVER_SELECTION_TIMEOUT_MS", "30000")),
+    },
+    sqlite_path=os.getenv("SQLITE_PATH", "data/portfolio.db"),
+)
+
+# Index builds and seeding are versioned migrations recorded in the backend.
+# With RUN_MIGRATIONS=0 workers only check for pending steps, which are then
+# applied by `python server.py migrate` as a deploy step; /ready reports 503
+# until they are. A worker that finds a step running elsewhere waits for it;
+# if the runner dies, the step is taken over once its lease expires.
+RUN_MIGRATIONS = os.getenv("RUN_MIGRATIONS", "1") == "1"
+MIGRATION_LEASE = timedelta(
+    seconds=float(os.getenv("MIGRATION_LEASE_SECONDS", str(DEFAULT_MIGRATION_LEASE.total_seconds())))
+)
+service_state: Dict[str, Any] = {"pending_migrations": []}
+
+# In-process snapshot of the projects collection; the TTL (seconds) only
+# guards against writes made outside this process. Under `--workers N` the
+# launcher sets SHARED_CATALOG_PATH and workers exchange the snapshot through
+# that memory-mapped segment.
+PROJECT_CACHE_TTL = float(os.getenv("PROJECT_CACHE_TTL", "300"))
+SHARED_CATALOG_PATH = os.getenv("SHARED_CATALOG_PATH")
+catalog = ProjectCatalog(
+    ttl=PROJECT_CACHE_TTL,
+    shared=SharedCatalogSegment(SHARED_CATALOG_PATH) if SHARED_CATALOG_PATH else None,
+)
+
+# Encoded, precompressed project responses keyed by ETag
+response_cache = ResponseCache(max_entries=int(os.getenv("RESPONSE_CACHE_SIZE", "256")))
+
+# Documents fetched per round trip while streaming the contacts export
+EXPORT_BATCH_SIZE = int(os.getenv("EXPORT_BATCH_SIZE", "500"))
+
+# Uploaded images and their responsive variants, stored content-addressed
+MAX_UPLOAD_BYTES = int(os.getenv("MAX_UPLOAD_BYTES", str(10 * 1024 * 1024)))
+image_store = ImageStore(
+    media_root=os.getenv("MEDIA_ROOT", "data/media"),
+    widths=parse_widths(os.getenv("IMAGE_WIDTHS", "320,640,1024,1600")),
+    workers=int(os.getenv("IMAGE_WORKERS", "0")) or None,
+)
+
+# Optional write-behind batching for contact submissions
+CONTACT_BATCHING = os.getenv("CONTACT_BATCHING", "0") == "1"
+contact_queue = ContactWriteQueue(
+    storage.contacts,
+    journal_path=os.getenv("CONTACT_JOURNAL_PATH", "data/contacts.journal"),
+    batch_size=int(os.getenv("CONTACT_BATCH_SIZE", "100")),
+    flush_interval=float(os.getenv("CONTACT_FLUSH_INTERVAL", "0.5")),
+    max_pending=int(os.getenv("CONTACT_QUEUE_MAX", "10000")),
+    fsync=os.getenv("CONTACT_JOURNAL_FSYNC", "0") == "1",
+    segment_bytes=int(os.getenv("CONTACT_JOURNAL_SEGMENT_BYTES", str(1024 * 1024))),
+) if CONTACT_BATCHING else None
+
+# Production frontend build, served from this process when present. Hashed
+# bundles listed in asset-manifest.json are cached forever; other paths that
+# aren't API routes fall back to index.html for client-side routing.
+FRONTEND_BUILD_DIR = os.getenv(
+    "FRONTEND_BUILD_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "frontend", "build")
+)
+static_build = StaticBuild(FRONTEND_BUILD_DIR) if os.path.isdir(FRONTEND_BUILD_DIR) else None
+
+# Prerendered /project/{id} pages with the project inlined, re-rendered in the
+# background after every write so the detail page paints without an API call
+project_snapshots = ProjectSnapshots(
+    os.getenv("SNAPSHOT_DIR", "data/snapshots"), static_build, lambda project: encode_project(project)
+) if static_build else None
 
 # Pydantic models
 class ProjectBase(BaseModel):
@@ -51,6 +177,88 @@ class Project(ProjectBase):
     id: str
     created_at: datetime
     updated_at: datetime
+    # Bumped by every write; checked through If-Match for optimistic concurrency
+    version: int = 1
+    # srcset strings keyed by MIME type, present for images uploaded through /api/images
+    hero_image_srcset: Optional[Dict[str, str]] = None
+    gallery_srcsets: List[Optional[Dict[str, str]]] = []
+
+class ProjectPatch(BaseModel):
+    title: Optional[str] = None
+    subtitle: Optional[str] = None
+    description: Optional[str] = None
+    tech_stack: Optional[List[str]] = None
+    category: Optional[str] = None
+    hero_image: Optional[str] = None
+    gallery_images: Optional[List[str]] = None
+    video_url: Optional[str] = None
+    challenge: Optional[str] = None
+    solution: Optional[str] = None
+    process: Optional[str] = None
+    results: Optional[str] = None
+    live_url: Optional[str] = None
+    github_url: Optional[str] = None
+    featured: Optional[bool] = None
+    # Alternative to If-Match for clients that can't set headers
+    version: Optional[int] = None
+
+class ProjectSummary(BaseModel):
+    id: str
+    title: str
+    subtitle: str
+    category: str
+    hero_image: str
+    hero_image_srcset: Optional[Dict[str, str]] = None
+    tech_stack: List[str]
+    featured: bool = False
+    excerpt: str
+    created_at: datetime
+
+class ProjectFacets(BaseModel):
+    total: int
+    categories: Dict[str, int]
+    technologies: Dict[str, int]
+
+class ProjectSearchHit(ProjectSummary):
+    score: float
+
+class RelatedProject(ProjectSummary):
+    # Shared-technology overlap plus the same-category bonus
+    score: float
+
+class BulkProjectOperation(BaseModel):
+    op: Literal["create", "update", "delete"]
+    id: Optional[str] = None
+    # Validated per item against ProjectBase, so one bad entry can't reject the batch
+    project: Optional[Dict[str, Any]] = None
+
+class BulkProjectRequest(BaseModel):
+    operations: List[BulkProjectOperation] = Field(..., min_length=1, max_length=1000)
+
+class BulkOperationResult(BaseModel):
+    index: int
+    op: str
+    id: Optional[str] = None
+    status: int
+    error: Optional[str] = None
+
+class BulkProjectResponse(BaseModel):
+    succeeded: int
+    failed: int
+    results: List[BulkOperationResult]
+
+class ImageVariant(BaseModel):
+    width: int
+    format: str
+    url: str
+
+class ImageAsset(BaseModel):
+    digest: str
+    width: int
+    height: int
+    original: str
+    variants: List[ImageVariant]
+    srcset: Dict[str, str]
 
 class ContactMessage(BaseModel):
     name: str
@@ -59,6 +267,10 @@ class ContactMessage(BaseModel):
     message: str
     phone: Optional[str] = None
 
+# Inbox workflow: unread -> read -> replied or archived, in any order
+ContactStatus = Literal["necitit", "citit", "raspuns", "arhivat"]
+CONTACT_STATUSES = ("necitit", "citit", "raspuns", "arhivat")
+
 class ContactResponse(BaseModel):
     id: str
     name: str
@@ -69,155 +281,221 @@ class ContactResponse(BaseModel):
     created_at: datetime
     status: str = "necitit"
 
-# Startup event
-@app.on_event("startup")
-async def startup_event():
-    # Create indexes
-    await db.projects.create_index("id", unique=True)
-    await db.contacts.create_index("id", unique=True)
-    
-    # Initialize with sample projects if none exist
-    existing_projects = await db.projects.count_documents({})
-    if existing_projects == 0:
-        sample_projects = [
-            {
-                "id": str(uuid.uuid4()),
-                "title": "Platforma E-commerce Premium",
-                "subtitle": "Redesign Complet pentru Moda de Lux",
-                "description": "O reconstrucție completă a unei platforme e-commerce de lux pentru branduri premium de modă. Focusul a fost pe experiența utilizatorului de înaltă calitate, optimizarea conversiilor și integrarea unor funcționalități avansate de personalizare. Platforma include visualizare 3D a produselor, recomandări bazate pe AI și un proces de checkout fără frecare.",
-                "tech_stack": ["React", "Next.js", "TypeScript", "GSAP", "Framer Motion", "Tailwind CSS", "Node.js", "MongoDB"],
-                "category": "E-commerce",
-                "hero_image": "https://images.unsplash.com/photo-1512917774080-9991f1c4c750?crop=entropy&cs=srgb&fm=jpg&ixid=M3w3NTY2Nzh8MHwxfHNlYXJjaHwxfHxsdXh1cnklMjByZWFsJTIwZXN0YXRlfGVufDB8fHx8MTc1Mzc0Mzg4M3ww&ixlib=rb-4.1.0&q=85",
-                "gallery_images": [
-                    "https://images.pexels.com/photos/323780/pexels-photo-323780.jpeg",
-                    "https://images.unsplash.com/photo-1657216328535-e981d223dee3?crop=entropy&cs=srgb&fm=jpg&ixid=M3w3NDk1Nzl8MHwxfHNlYXJjaHwxfHxsdXh1cnklMjB3ZWIlMjBkZXNpZ258ZW58MHx8fHwxNzUzNzQzODYzfDA&ixlib=rb-4.1.0&q=85",
-                    "https://images.unsplash.com/photo-1657216328529-3852a5f372cb?crop=entropy&cs=srgb&fm=jpg&ixid=M3w3NDk1Nzl8MHwxfHNlYXJjaHw0fHxsdXh1cnklMjB3ZWIlMjBkZXNpZ258ZW58MHx8fHwxNzUzNzQzODYzfDA&ixlib=rb-4.1.0&q=85"
-                ],
-                "video_url": None,
-                "challenge": "Clientul avea nevoie de o platformă modernă de e-commerce care să atragă consumatori de lux, menținând în același timp performanțe excelente și experiența utilizatorului pe toate dispozitivele. Problema principală era rata mare de abandonare a coșului de cumpărături și lipsa de personalizare.",
-                "solution": "Am creat un sistem de design sofisticat cu animații premium, navigare intuitivă și filtrare avansată. Am implementat recomandări inteligente bazate pe AI, visualizare 3D a produselor și un proces de checkout optimizat cu opțiuni de plată flexibile.",
-                "process": "Cercetare & Analiză → Maparea Călătoriei Utilizatorului → Wireframing → Prototipare High-fidelity → Dezvoltare → Testare & Optimizare → Lansare",
-                "results": "Creștere de 180% în rata de conversie, reducere cu 55% a abandonării coșului, îmbunătățire cu 95% a metricilor de engagement ale utilizatorilor, și o creștere de 220% în valoarea medie a comenzilor.",
-                "live_url": "https://platforma-ecommerce-premium.ro",
-                "github_url": None,
-                "featured": True,
-                "created_at": datetime.now(),
-                "updated_at": datetime.now()
-            },
-            {
-                "id": str(uuid.uuid4()),
-                "title": "Dashboard Analitică AI",
-                "subtitle": "Interfață Inteligentă pentru Business Intelligence",
-                "description": "Un dashboard avansat de analiză pentru o platformă de business intelligence alimentată de AI. Caracteristici includ vizualizarea datelor în timp real, analiză predictivă și o interfață utilizator intuitivă pentru interpretarea datelor complexe. Sistemul procesează peste 1 milion de puncte de date zilnic și oferă insight-uri acționabile.",
-                "tech_stack": ["Vue.js", "D3.js", "WebGL", "Python", "TensorFlow", "Sass", "FastAPI", "PostgreSQL"],
-                "category": "Vizualizare Date",
-                "hero_image": "https://images.unsplash.com/photo-1551650992-ee4fd47df41f?crop=entropy&cs=srgb&fm=jpg&ixid=M3w3NDk1Nzl8MHwxfHNlYXJjaHwyfHxtb2Rlcm4lMjBpbnRlcmZhY2V8ZW58MHx8fHwxNzUzNzQzODc3fDA&ixlib=rb-4.1.0&q=85",
-                "gallery_images": [
-                    "https://images.unsplash.com/photo-1504868584819-f8e8b4b6d7e3?crop=entropy&cs=srgb&fm=jpg&ixid=M3w3NDk1Nzh8MHwxfHNlYXJjaHwxfHxidXNpbmVzcyUyMHNvZnR3YXJlfGVufDB8fHx8MTc1Mzc0Mzg5OXww&ixlib=rb-4.1.0&q=85",
-                    "https://images.unsplash.com/photo-1581092162384-8987c1d64718?crop=entropy&cs=srgb&fm=jpg&ixid=M3w3NDk1Nzh8MHwxfHNlYXJjaHw0fHxidXNpbmVzcyUyMHNvZnR3YXJlfGVufDB8fHx8MTc1Mzc0Mzg5OXww&ixlib=rb-4.1.0&q=85"
-                ],
-                "video_url": None,
-                "challenge": "Proiectarea unei interfețe care să facă analiza AI complexă accesibilă utilizatorilor non-tehnici, păstrând în același timp profunzimea necesară pentru specialiștii în date. Principala provocare era prezentarea informațiilor în mod intuitiv fără pierderea detaliilor importante.",
-                "solution": "Am dezvoltat o interfață cu straturi care folosește dezvăluirea progresivă, storytelling inteligent de date și componente de vizualizare personalizabile. Sistemul adaptează complexitatea informațiilor în funcție de nivelul utilizatorului și preferințele sale.",
-                "process": "Cercetare Utilizatori → Arhitectura Informației → Design Interacțiune → Prototipare → Testare Usabilitate → Implementare → Optimizare",
-                "results": "Reducere cu 70% a timpului pentru obținerea insight-urilor, creștere cu 45% în adoptarea de către utilizatori, scor de satisfacție utilizatori de 94%, și o îmbunătățire cu 60% în acuratețea deciziilor bazate pe date.",
-                "live_url": "https://dashboard-ai-analitice.ro",
-                "github_url": None,
-                "featured": True,
-                "created_at": datetime.now(),
-                "updated_at": datetime.now()
-            },
-            {
-                "id": str(uuid.uuid4()),
-                "title": "Aplicație Banking Mobil",
-                "subtitle": "Experiență Bancară Digitală de Nouă Generație",
-                "description": "O aplicație mobilă banking complet nouă, construită cu focus pe securitate, usabilitate și inovație. Aplicația oferă funcționalități complete de banking digital, plăți contactless, investiții integrate și un asistent AI personal pentru consiliere financiară. Designul minimalist ascunde o arhitectură tehnică complexă.",
-                "tech_stack": ["React Native", "TypeScript", "Node.js", "Express", "MongoDB", "Blockchain", "AI/ML"],
-                "category": "Mobile Banking",
-                "hero_image": "https://images.unsplash.com/photo-1681826292838-c37fbd22263a?crop=entropy&cs=srgb&fm=jpg&ixid=M3w3NTY2NzB8MHwxfHNlYXJjaHwxfHxtb2JpbGUlMjBiYW5raW5nfGVufDB8fHx8MTc1Mzc0Mzg5MXww&ixlib=rb-4.1.0&q=85",
-                "gallery_images": [
-                    "https://images.unsplash.com/photo-1609921141835-710b7fa6e438?crop=entropy&cs=srgb&fm=jpg&ixid=M3w3NTY2NzB8MHwxfHNlYXJjaHwzfHxtb2JpbGUlMjBiYW5raW5nfGVufDB8fHx8MTc1Mzc0Mzg5MXww&ixlib=rb-4.1.0&q=85"
-                ],
-                "video_url": None,
-                "challenge": "Crearea unei aplicații banking care să fie atât extrem de sigură, cât și extrem de ușor de folosit. Provocarea principală era echilibrarea măsurilor de securitate stricte cu o experiență utilizator fluidă și intuitivă.",
-                "solution": "Am implementat un sistem de autentificare biometrică cu multiple straturi, un design UI minimalist cu navigare gestuală avansată și funcționalități AI pentru recomandări financiare personalizate. Arhitectura folosește tehnologii blockchain pentru securitate maximă.",
-                "process": "Analiză Cerințe de Securitate → Cercetare UX → Prototipare → Testare de Securitate → Dezvoltare → Testare Beta → Lansare",
-                "results": "Timp de răspuns sub 0.3 secunde, scor de securitate 99.9%, adoptare de 85% în primele 6 luni, și creștere cu 40% în tranzacțiile mobile ale băncii.",
-                "live_url": "https://banking-app-premium.ro",
-                "github_url": None,
-                "featured": True,
-                "created_at": datetime.now(),
-                "updated_at": datetime.now()
-            },
-            {
-                "id": str(uuid.uuid4()),
-                "title": "Portal Imobiliar Exclusiv",
-                "subtitle": "Platforma Digitală pentru Proprietăți Premium",
-                "description": "Un portal imobiliar de lux dedicat proprietăților premium și exclusive. Platforma oferă tururi virtuale 3D, analize de piață în timp real, sistem de matchmaking între cumpărători și proprietăți, și instrumente avansate de căutare cu filtrare inteligentă. Designul reflectă eleganța și exclusivitatea proprietăților prezentate.",
-                "tech_stack": ["Next.js", "Three.js", "WebGL", "Mapbox", "Prisma", "PostgreSQL", "Stripe"],
-                "category": "Real Estate",
-                "hero_image": "https://images.unsplash.com/photo-1613490493576-7fde63acd811?crop=entropy&cs=srgb&fm=jpg&ixid=M3w3NTY2Nzh8MHwxfHNlYXJjaHwyfHxsdXh1cnklMjByZWFsJTIwZXN0YXRlfGVufDB8fHx8MTc1Mzc0Mzg4M3ww&ixlib=rb-4.1.0&q=85",
-                "gallery_images": [
-                    "https://images.unsplash.com/photo-1582268611958-ebfd161ef9cf?crop=entropy&cs=srgb&fm=jpg&ixid=M3w3NTY2Nzh8MHwxfHNlYXJjaHwzfHxsdXh1cnklMjByZWFsJTIwZXN0YXRlfGVufDB8fHx8MTc1Mzc0Mzg4M3ww&ixlib=rb-4.1.0&q=85"
-                ],
-                "video_url": None,
-                "challenge": "Crearea unei platforme care să transmită luxul și exclusivitatea proprietăților premium, oferind în același timp instrumente tehnice avansate pentru agenții imobiliari și cumpărători. Provocarea era prezentarea proprietăților în mod captivant și profesionist.",
-                "solution": "Am dezvoltat o platformă cu tururi virtuale 3D imersive, sistem de analize predictive pentru piață, și o interfață elegantă care pune în valoare fiecare proprietate. Integrarea cu servicii de mapare avansate oferă context geografic complet.",
-                "process": "Analiză Piață → Cercetare Comportament Cumpărători → Design Experience → Dezvoltare 3D → Integrare Servicii → Testare → Lansare",
-                "results": "Creștere cu 150% în timpul petrecut pe platformă, îmbunătățire cu 80% în calitatea lead-urilor, și o creștere cu 35% în tranzacțiile finalizate prin platformă.",
-                "live_url": "https://portal-imobiliar-exclusiv.ro",
-                "github_url": None,
-                "featured": True,
-                "created_at": datetime.now(),
-                "updated_at": datetime.now()
-            },
-            {
-                "id": str(uuid.uuid4()),
-                "title": "Sistem CRM Enterprise",
-                "subtitle": "Soluție Completă de Management Relații Clienți",
-                "description": "Un sistem CRM enterprise complet, proiectat pentru companii mari cu nevoi complexe de management al relațiilor cu clienții. Sistemul integrează AI pentru analiza comportamentului clienților, automatizarea proceselor de vânzări și predicții de churn. Interfața modulară permite customizarea completă pentru diferite industrii.",
-                "tech_stack": ["React", "Node.js", "Express", "MongoDB", "Redis", "Elasticsearch", "Docker", "AWS"],
-                "category": "Enterprise Software",
-                "hero_image": "https://images.unsplash.com/photo-1581092162384-8987c1d64718?crop=entropy&cs=srgb&fm=jpg&ixid=M3w3NDk1Nzh8MHwxfHNlYXJjaHw0fHxidXNpbmVzcyUyMHNvZnR3YXJlfGVufDB8fHx8MTc1Mzc0Mzg5OXww&ixlib=rb-4.1.0&q=85",
-                "gallery_images": [
-                    "https://images.pexels.com/photos/430205/pexels-photo-430205.jpeg"
-                ],
-                "video_url": None,
-                "challenge": "Dezvoltarea unui sistem CRM care să poată gestiona volume mari de date, să fie ușor de personalizat pentru diferite industrii și să ofere insight-uri acționabile în timp real. Provocarea era scalabilitatea și performanța la volume mari de utilizatori.",
-                "solution": "Am construit o arhitectură microservicii cu API-uri REST și GraphQL, sistem de caching distribuit cu Redis, și o interfață modulară cu componente reutilizabile. Sistemul folosește machine learning pentru analize predictive și automatizarea proceselor.",
-                "process": "Analiză Cerințe Enterprise → Arhitectura Sistemului → Design Modular → Dezvoltare Microservicii → Integrare AI → Testare Stress → Deployment",
-                "results": "Procesare de peste 100.000 de interacțiuni zilnic, reducere cu 60% a timpului de răspuns la clienți, creștere cu 45% în rata de conversie a lead-urilor, și economii de 30% în costurile operaționale.",
-                "live_url": "https://crm-enterprise-premium.ro",
-                "github_url": None,
-                "featured": False,
-                "created_at": datetime.now(),
-                "updated_at": datetime.now()
-            }
-        ]
-        await db.projects.insert_many(sample_projects)
-        print("Proiectele exemplu au fost adăugate cu succes")
+class ContactStatusUpdate(BaseModel):
+    status: ContactStatus
+
+class BulkContactStatusUpdate(BaseModel):
+    ids: List[str] = Field(..., min_length=1, max_length=1000)
+    status: ContactStatus
+
+class BulkContactStatusResponse(BaseModel):
+    updated: int
+
+class ContactStats(BaseModel):
+    total: int
+    unread: int
+    by_status: Dict[str, int]
+
+# Lifespan: runs once per worker. Everything here is a read unless
+# RUN_MIGRATIONS applies a pending step, which happens once per database.
+async def start_services():
+    await storage.setup()
+    if RUN_MIGRATIONS:
+        await run_migrations(storage, MIGRATION_LEASE)
+    service_state["pending_migrations"] = await pending_migrations(storage)
+
+    await catalog.load(storage.projects)
+
+    if static_build:
+        # Stats every file once; compresses only what has no fresh sibling yet
+        await asyncio.get_running_loop().run_in_executor(None, static_build.prepare)
+        # Revisions already on disk (from an earlier run or another worker) are kept
+        for project in catalog.ordered:
+            project_snapshots.refresh(project)
+
+    if contact_queue:
+        await contact_queue.start()
+
+async def stop_services():
+    if contact_queue:
+        await contact_queue.stop()
+    if project_snapshots:
+        await project_snapshots.wait()
+    image_store.shutdown()
+    await storage.close()
+
+def parse_cursor(cursor: Optional[str]):
+    if cursor is None:
+        return None
+    try:
+        return decode_cursor(cursor)
+    except InvalidCursor:
+        raise HTTPException(status_code=400, detail="Cursor de paginare invalid")
+
+def parse_fields(fields: Optional[str]) -> Optional[List[str]]:
+    """Parse a `?fields=` sparse fieldset; `id` is always returned."""
+    if not fields:
+        return None
+    requested = [field.strip() for field in fields.split(",") if field.strip()]
+    unknown = sorted(set(requested) - set(Project.model_fields))
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Câmpuri necunoscute: {', '.join(unknown)}")
+    return ["id"] + [field for field in requested if field != "id"]
+
+project_adapter = TypeAdapter(Project)
+summary_list_adapter = TypeAdapter(List[ProjectSummary])
+
+def encode_project(project: dict) -> bytes:
+    return project_adapter.dump_json(project_adapter.validate_python(project))
+
+def encode_json(content) -> bytes:
+    return json.dumps(jsonable_encoder(content), ensure_ascii=False, separators=(",", ":")).encode()
+
+def encode_project_list(projects, fields: Optional[List[str]], next_cursor: Optional[str] = None):
+    # Sparse fieldsets bypass the summary model; the default shape is precomputed
+    if fields is None:
+        summaries = summary_list_adapter.validate_python([catalog.summary(project) for project in projects])
+        body = summary_list_adapter.dump_json(summaries)
+    else:
+        body = encode_json([select_fields(project, fields) for project in projects])
+    return body, {"X-Next-Cursor": next_cursor} if next_cursor else None
+
+def catalog_etag(request: Request) -> str:
+    return make_etag(catalog.version, request.url.path, sorted(request.query_params.multi_items()))
+
+def project_etag(project: dict) -> str:
+    # The version prefix is what If-Match is checked against
+    tag = make_etag(project["id"], project["updated_at"].isoformat()).strip('"')
+    return f'"{project.get("version", 1)}-{tag[:16]}"'
+
+def parse_if_match(value: Optional[str]) -> Optional[int]:
+    # `*` matches any current representation: no version to check
+    if value is None or value.strip() == "*":
+        return None
+    tag = value.split(",")[0].strip().removeprefix("W/").strip('"')
+    try:
+        return int(tag.split("-", 1)[0])
+    except ValueError:
+        raise HTTPException(status_code=412, detail="Versiunea proiectului nu corespunde")
+
+async def conditional_update(project_id: str, changes: dict, version: Optional[int], conflict_status: int):
+    """Apply `changes` in one round trip, returning the project as written."""
+    try:
+        updated_project = await storage.projects.update(project_id, changes, version)
+    except VersionConflict:
+        raise HTTPException(status_code=conflict_status, detail="Proiectul a fost modificat între timp")
+    if updated_project is None:
+        raise HTTPException(status_code=404, detail="Proiectul nu a fost găsit")
+    catalog.upsert(updated_project)
+    if project_snapshots:
+        project_snapshots.refresh(updated_project)
+    return updated_project
+
+def cached_response(request: Request, etag: str, build, versioned: bool = True) -> Response:
+    """Serve a catalog read from pre-encoded bytes, or 304 if the client has them.
+
+    `etag` names the data and each encoding carries it with a suffix; a
+    client holding any of them gets a 304 before anything is built. Bodies
+    whose tag already identifies the data pass `versioned=False` and survive
+    catalog changes elsewhere.
+    """
+    matched = matching_etag(request, etag)
+    if matched is not None:
+        return not_modified(matched)
+    version = catalog.version if versioned else None
+    return response_cache.get_or_build(version, etag, build).response(request)
 
 # API Routes
 @app.get("/")
-async def root():
+async def root(request: Request):
+    # Browsers get the app; API clients keep getting the service banner
+    if static_build and static_build.index and "text/html" in request.headers.get("accept", ""):
+        return StaticFileResponse(request, static_build.index)
     return {"message": "API Portofoliu Luxos", "version": "1.0.0"}
 
-@app.get("/api/projects", response_model=List[Project])
-async def get_projects():
-    projects = await db.projects.find().sort("created_at", -1).to_list(100)
-    return projects
+@app.get("/live", include_in_schema=False)
+async def liveness():
+    return {"status": "ok"}
+
+@app.get("/ready", include_in_schema=False)
+async def readiness():
+    checks = {"storage": "ok", "migrations": "ok", "catalog": "ok"}
+    try:
+        await storage.ping()
+        if service_state["pending_migrations"]:
+            # Re-read only while something is pending; applied steps stay applied
+            service_state["pending_migrations"] = await pending_migrations(storage)
+    except StorageError as exc:
+        checks["storage"] = f"indisponibil: {exc}"
+    if service_state["pending_migrations"]:
+        checks["migrations"] = "în așteptare: " + ", ".join(service_state["pending_migrations"])
+    if catalog.loaded_at is None:
+        checks["catalog"] = "neîncărcat"
+    ready = all(value == "ok" for value in checks.values())
+    return JSONResponse({"ready": ready, "checks": checks}, status_code=200 if ready else 503)
+
+@app.get("/metrics", include_in_schema=False)
+async def get_metrics():
+    return Response(metrics.render(), media_type=METRICS_CONTENT_TYPE)
+
+@app.get("/api/projects", response_model=List[ProjectSummary])
+async def get_projects(
+    request: Request,
+    limit: int = Query(100, ge=1, le=500),
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
+    category: Optional[str] = None,
+    tech: List[str] = Query([]),
+):
+    key = parse_cursor(cursor)
+    selected = parse_fields(fields)
+    await catalog.ensure_fresh(storage.projects)
 
-@app.get("/api/projects/featured", response_model=List[Project])
-async def get_featured_projects():
-    projects = await db.projects.find({"featured": True}).sort("created_at", -1).to_list(10)
-    return projects
+    def build():
+        ordered, ascending_keys = catalog.filtered(category, tech)
+        projects, next_cursor = page_slice(ordered, ascending_keys, key, limit)
+        return encode_project_list(projects, selected, next_cursor)
+
+    return cached_response(request, catalog_etag(request), build)
+
+@app.get("/api/projects/featured", response_model=List[ProjectSummary])
+async def get_featured_projects(request: Request, fields: Optional[str] = None):
+    selected = parse_fields(fields)
+    await catalog.ensure_fresh(storage.projects)
+    return cached_response(request, catalog_etag(request), lambda: encode_project_list(catalog.featured[:10], selected))
+
+@app.get("/api/projects/facets", response_model=ProjectFacets)
+async def get_project_facets(request: Request):
+    await catalog.ensure_fresh(storage.projects)
+    return cached_response(
+        request,
+        catalog_etag(request),
+        lambda: (encode_json(dict(catalog.facets.snapshot(), total=len(catalog.by_id))), None),
+    )
+
+@app.get("/api/projects/search", response_model=List[ProjectSearchHit])
+async def search_projects(q: str = Query(..., min_length=1, max_length=200), limit: int = Query(10, ge=1, le=50)):
+    await catalog.ensure_fresh(storage.projects)
+    hits = catalog.search.search(q, limit)
+    return [dict(catalog.summaries[project_id], score=round(score, 4)) for project_id, score in hits]
+
+@app.get("/api/projects/{project_id}/related", response_model=List[RelatedProject])
+async def related_projects(project_id: str, k: int = Query(4, ge=1, le=MAX_RELATED)):
+    await catalog.ensure_fresh(storage.projects)
+    if not catalog.get(project_id):
+        raise HTTPException(status_code=404, detail="Proiectul nu a fost găsit")
+    related = catalog.related.related(project_id, k)
+    return [dict(catalog.summaries[related_id], score=round(score, 4)) for related_id, score in related]
 
 @app.get("/api/projects/{project_id}", response_model=Project)
-async def get_project(project_id: str):
-    project = await db.projects.find_one({"id": project_id})
+async def get_project(request: Request, project_id: str):
+    await catalog.ensure_fresh(storage.projects)
+    project = catalog.get(project_id)
     if not project:
         raise HTTPException(status_code=404, detail="Proiectul nu a fost găsit")
-    return project
+    # Per-project tag, so edits elsewhere in the catalog don't invalidate it
+    etag = project_etag(project)
+    return cached_response(request, etag, lambda: (encode_project(project), None), versioned=False)
 
 @app.post("/api/projects", response_model=Project)
 async def create_project(project: ProjectBase):
@@ -225,33 +503,164 @@ async def create_project(project: ProjectBase):
     project_dict["id"] = str(uuid.uuid4())
     project_dict["created_at"] = datetime.now()
     project_dict["updated_at"] = datetime.now()
+    project_dict["version"] = 1
+    attach_srcsets(image_store, project_dict)
     
-    await db.projects.insert_one(project_dict)
+    await storage.projects.insert(project_dict)
+    catalog.upsert(project_dict)
+    if project_snapshots:
+        project_snapshots.refresh(project_dict)
     return project_dict
 
 @app.put("/api/projects/{project_id}", response_model=Project)
-async def update_project(project_id: str, project: ProjectBase):
+async def update_project(
+    project_id: str,
+    project: ProjectBase,
+    response: Response,
+    if_match: Optional[str] = Header(None),
+):
     project_dict = project.dict()
     project_dict["updated_at"] = datetime.now()
+    attach_srcsets(image_store, project_dict)
     
-    result = await db.projects.update_one(
-        {"id": project_id},
-        {"$set": project_dict}
-    )
-    
-    if result.matched_count == 0:
-        raise HTTPException(status_code=404, detail="Proiectul nu a fost găsit")
-    
-    updated_project = await db.projects.find_one({"id": project_id})
+    updated_project = await conditional_update(project_id, project_dict, parse_if_match(if_match), 412)
+    response.headers["ETag"] = project_etag(updated_project)
+    return updated_project
+
+@app.patch("/api/projects/{project_id}", response_model=Project)
+async def patch_project(
+    project_id: str,
+    patch: ProjectPatch,
+    response: Response,
+    if_match: Optional[str] = Header(None),
+):
+    changes = patch.model_dump(exclude_unset=True)
+    body_version = changes.pop("version", None)
+    if not changes:
+        raise HTTPException(status_code=400, detail="Nu a fost trimisă nicio modificare")
+    required = {name for name, field in ProjectBase.model_fields.items() if field.is_required()}
+    cleared = sorted(name for name, value in changes.items() if value is None and name in required)
+    if cleared:
+        raise HTTPException(status_code=422, detail=f"Câmpurile nu pot fi goale: {', '.join(cleared)}")
+
+    changes["updated_at"] = datetime.now()
+    if "hero_image" in changes:
+        changes["hero_image_srcset"] = image_store.srcset_for(changes["hero_image"])
+    if "gallery_images" in changes:
+        changes["gallery_srcsets"] = [image_store.srcset_for(url) for url in changes["gallery_images"]]
+
+    # If-Match is a failed precondition (412); a stale body version is a conflict (409)
+    header_version = parse_if_match(if_match)
+    if header_version is not None:
+        version, conflict_status = header_version, 412
+    else:
+        version, conflict_status = body_version, 409
+    updated_project = await conditional_update(project_id, changes, version, conflict_status)
+    response.headers["ETag"] = project_etag(updated_project)
     return updated_project
 
 @app.delete("/api/projects/{project_id}")
 async def delete_project(project_id: str):
-    result = await db.projects.delete_one({"id": project_id})
-    if result.deleted_count == 0:
+    if not await storage.projects.delete(project_id):
         raise HTTPException(status_code=404, detail="Proiectul nu a fost găsit")
+    catalog.remove(project_id)
+    if project_snapshots:
+        project_snapshots.discard(project_id)
     return {"message": "Proiectul a fost șters cu succes"}
 
+def validation_detail(exc: ValidationError) -> str:
+    """A one-line summary of `exc` instead of pydantic's multi-line report."""
+    missing, problems = [], []
+    for error in exc.errors():
+        field = ".".join(str(part) for part in error["loc"]) or "proiect"
+        if error["type"] == "missing":
+            missing.append(field)
+        else:
+            problems.append(f"{field}: {error['msg']}")
+    if missing:
+        problems.insert(0, f"lipsesc câmpurile {', '.join(missing)}")
+    return "Date invalide: " + "; ".join(problems)
+
+@app.post("/api/projects/bulk", response_model=BulkProjectResponse)
+async def bulk_projects(request: BulkProjectRequest):
+    operations = request.operations
+    results: List[Optional[dict]] = [None] * len(operations)
+
+    def fail(index: int, status: int, error: str):
+        operation = operations[index]
+        results[index] = {"index": index, "op": operation.op, "id": operation.id, "status": status, "error": error}
+
+    # Updates and deletes of unknown ids are reported up front; the write
+    # itself would silently match nothing
+    targeted = {operation.id for operation in operations if operation.op != "create" and operation.id}
+    existing = await storage.projects.existing_ids(list(targeted)) if targeted else set()
+
+    now = datetime.now()
+    writes, positions = [], []
+    for index, operation in enumerate(operations):
+        if operation.op != "create" and not operation.id:
+            fail(index, 400, "Lipsește id-ul proiectului")
+            continue
+        if operation.op != "create" and operation.id not in existing:
+            fail(index, 404, "Proiectul nu a fost găsit")
+            continue
+        if operation.op == "delete":
+            writes.append(("delete", operation.id, None))
+            positions.append(index)
+            continue
+        try:
+            project_dict = ProjectBase.model_validate(operation.project or {}).dict()
+        except ValidationError as exc:
+            fail(index, 422, validation_detail(exc))
+            continue
+        project_dict["updated_at"] = now
+        attach_srcsets(image_store, project_dict)
+        if operation.op == "create":
+            project_dict["id"] = operation.id = str(uuid.uuid4())
+            project_dict["created_at"] = now
+            project_dict["version"] = 1
+            writes.append(("create", operation.id, project_dict))
+        else:
+            writes.append(("update", operation.id, project_dict))
+        positions.append(index)
+
+    write_errors = {}
+    if writes:
+        write_errors = await storage.projects.bulk(writes)
+        await catalog.reload(storage.projects)
+
+    for position, index in enumerate(positions):
+        error = write_errors.get(position)
+        if error:
+            fail(index, error[0], error[1] or "Eroare la scriere")
+        else:
+            operation = operations[index]
+            results[index] = {"index": index, "op": operation.op, "id": operation.id, "status": 200, "error": None}
+            if project_snapshots and operation.op == "delete":
+                project_snapshots.discard(operation.id)
+            elif project_snapshots and catalog.get(operation.id):
+                project_snapshots.refresh(catalog.get(operation.id))
+
+    failed = sum(1 for result in results if result["status"] != 200)
+    return {"succeeded": len(results) - failed, "failed": failed, "results": results}
+
+@app.post("/api/images", response_model=ImageAsset)
+async def upload_image(file: UploadFile = File(...)):
+    data = await file.read(MAX_UPLOAD_BYTES + 1)
+    if len(data) > MAX_UPLOAD_BYTES:
+        raise HTTPException(status_code=413, detail="Imaginea depășește dimensiunea maximă permisă")
+    try:
+        return await image_store.ingest(data)
+    except InvalidImage:
+        raise HTTPException(status_code=400, detail="Fișierul încărcat nu este o imagine validă")
+
+@app.get("/media/images/{digest}/{filename}")
+async def get_image(digest: str, filename: str):
+    path = image_store.path_for(digest, filename)
+    if not path:
+        raise HTTPException(status_code=404, detail="Imaginea nu a fost găsită")
+    return FileResponse(path, headers={"Cache-Control": IMMUTABLE_CACHE})
+
 @app.post("/api/contact", response_model=ContactResponse)
 async def submit_contact(contact: ContactMessage):
     contact_dict = contact.dict()
@@ -259,14 +668,143 @@ async def submit_contact(contact: ContactMessage):
     contact_dict["created_at"] = datetime.now()
     contact_dict["status"] = "necitit"
     
-    await db.contacts.insert_one(contact_dict)
+    if contact_queue:
+        try:
+            await contact_queue.submit(contact_dict)
+        except QueueFull:
+            raise HTTPException(status_code=503, detail="Serviciul este temporar supraîncărcat, încercați din nou")
+        return contact_dict
+
+    await storage.contacts.insert(contact_dict)
     return contact_dict
 
 @app.get("/api/contacts", response_model=List[ContactResponse])
-async def get_contacts():
-    contacts = await db.contacts.find().sort("created_at", -1).to_list(100)
+async def get_contacts(
+    response: Response,
+    limit: int = Query(100, ge=1, le=500),
+    cursor: Optional[str] = None,
+):
+    key = parse_cursor(cursor)
+    # Fetch one extra document to know whether another page exists
+    contacts = await storage.contacts.page(key, limit + 1)
+    if len(contacts) > limit:
+        contacts = contacts[:limit]
+        response.headers["X-Next-Cursor"] = encode_cursor(contacts[-1])
     return contacts
 
-if __name__ == "__main__":
+@app.get("/api/contacts/stats", response_model=ContactStats)
+async def get_contact_stats():
+    # One small counters read, kept current by every insert and status change
+    counts = await storage.contacts.status_counts()
+    by_status = {status: counts.get(status, 0) for status in CONTACT_STATUSES}
+    by_status.update(counts)
+    return ContactStats(total=sum(by_status.values()), unread=by_status["necitit"], by_status=by_status)
+
+@app.post("/api/contacts/status", response_model=BulkContactStatusResponse)
+async def update_contacts_status(update: BulkContactStatusUpdate):
+    updated = await storage.contacts.set_status_many(update.ids, update.status)
+    return BulkContactStatusResponse(updated=updated)
+
+@app.patch("/api/contacts/{contact_id}", response_model=ContactResponse)
+async def update_contact_status(contact_id: str, update: ContactStatusUpdate):
+    contact = await storage.contacts.set_status(contact_id, update.status)
+    if not contact:
+        raise HTTPException(status_code=404, detail="Mesajul nu a fost găsit")
+    return contact
+
+@app.get("/api/contacts/export")
+async def export_contacts(
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$"),
+    since: Optional[datetime] = None,
+    status: Optional[str] = None,
+    after: Optional[str] = None,
+):
+    if since is not None and since.tzinfo is not None:
+        # Contacts are stamped with naive local time (datetime.now()); an
+        # offset such as ...Z would not compare with them in any backend
+        since = since.astimezone().replace(tzinfo=None)
+    # Oldest first, so an interrupted export resumes from the last id it saw
+    resume_key = None
+    if after:
+        last_seen = await storage.contacts.get(after)
+        if not last_seen:
+            raise HTTPException(status_code=400, detail="Mesajul de reluare nu există")
+        resume_key = (last_seen["created_at"], last_seen["id"])
+
+    cursor = storage.contacts.iterate(since, status, resume_key, EXPORT_BATCH_SIZE)
+    if format == "csv":
+        body, media_type = csv_stream(cursor, EXPORT_BATCH_SIZE), "text/csv"
+    else:
+        body, media_type = ndjson_stream(cursor, EXPORT_BATCH_SIZE), "application/x-ndjson"
+    filename = f"contacte.{format}"
+    return StreamingResponse(
+        body,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+# Registered last so every API route matches first
+async def frontend(request: Request, path: str):
+    asset = static_build.get("/" + path)
+    if asset:
+        return StaticFileResponse(request, asset)
+    last_segment = path.rsplit("/", 1)[-1]
+    if path.split("/", 1)[0] in ("api", "media") or "." in last_segment or not static_build.index:
+        raise HTTPException(status_code=404, detail="Resursa nu a fost găsită")
+    return StaticFileResponse(request, static_build.index)
+
+async def project_page(request: Request, project_id: str):
+    await catalog.ensure_fresh(storage.projects)
+    project = catalog.get(project_id)
+    asset = project_snapshots.cached(project) if project else None
+    if project and asset is None:
+        # Not rendered by this worker yet: pick it up from disk or render it now
+        try:
+            asset = await asyncio.to_thread(project_snapshots.write, project)
+        except OSError as exc:
+            print(f"Eroare la generarea paginii pentru proiectul {project_id}: {exc}")
+    if asset is None:
+        return await frontend(request, f"project/{project_id}")
+    return StaticFileResponse(request, asset)
+
+if static_build:
+    # The project page must be registered ahead of the catch-all
+    app.add_api_route("/project/{project_id}", project_page, methods=["GET", "HEAD"], include_in_schema=False)
+    app.add_api_route("/{path:path}", frontend, methods=["GET", "HEAD"], include_in_schema=False)
+
+async def migrate():
+    await storage.setup()
+    try:
+        ran = await run_migrations(storage, MIGRATION_LEASE)
+        print(f"Migrări aplicate: {', '.join(ran) if ran else 'niciuna'}")
+    finally:
+        await storage.close()
+
+def serve(host: str, port: int, workers: int):
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8001)
\ No newline at end of file
+    if workers <= 1:
+        uvicorn.run(app, host=host, port=port)
+        return
+    # Prefork: uvicorn binds the socket once and spawns `workers` processes
+    # that import this module again. Migrations run here first so no worker
+    # writes on start, and a fresh shared segment carries the catalog.
+    if RUN_MIGRATIONS and STORAGE_BACKEND != "memory":
+        asyncio.run(migrate())
+        os.environ["RUN_MIGRATIONS"] = "0"
+    os.environ["SHARED_CATALOG_PATH"] = SHARED_CATALOG_PATH or default_segment_path()
+    SharedCatalogSegment.create(os.environ["SHARED_CATALOG_PATH"]).close()
+    uvicorn.run("server:app", host=host, port=port, workers=workers)
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="API Portofoliu Luxos")
+    parser.add_argument("command", nargs="?", choices=["serve", "migrate"], default="serve")
+    parser.add_argument("--host", default=os.getenv("HOST", "0.0.0.0"))
+    parser.add_argument("--port", type=int, default=int(os.getenv("PORT", "8001")))
+    parser.add_argument("--workers", type=int, default=int(os.getenv("WEB_CONCURRENCY", "1")),
+                        help="worker processes sharing the port (default: WEB_CONCURRENCY or 1)")
+    args = parser.parse_args()
+    if args.command == "migrate":
+        asyncio.run(migrate())
+    else:
+        serve(args.host, args.port, args.workers)
\ No newline at end of file
@@ -0,0 +1,121 @@
+import json
+import mmap
+import os
+import struct
+import tempfile
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Tuple
+
+try:
+    import fcntl
+except ImportError:  # the multi-worker mode is POSIX-only
+    fcntl = None
+
+# A memory-mapped file shared by every worker on the host:
+#
+#   magic (8 bytes) | generation (u64) | payload length (u64) | payload
+#
+# The payload is the serialized project list. Writers take an exclusive
+# flock, write the payload, then bump the generation; readers compare the
+# generation against the one they last loaded, which is a single 8-byte read
+# from shared memory, and only take the lock when it has moved.
+
+MAGIC = b"PFCATv1\0"
+HEADER = struct.Struct("<8sQQ")
+GENERATION_OFFSET = 8
+INITIAL_SIZE = 1 << 20
+
+DATETIME_FIELDS = ("created_at", "updated_at")
+
+
+def default_path() -> str:
+    # tmpfs when available, so the segment never touches disk
+    directory = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+    return os.path.join(directory, f"portfolio-catalog-{os.getuid() if hasattr(os, 'getuid') else 0}")
+
+
+def encode_projects(projects: List[Dict[str, Any]]) -> bytes:
+    return json.dumps(
+        projects,
+        ensure_ascii=False,
+        separators=(",", ":"),
+        default=lambda value: value.isoformat() if isinstance(value, datetime) else str(value),
+    ).encode()
+
+
+def decode_projects(payload: bytes) -> List[Dict[str, Any]]:
+    projects = json.loads(payload)
+    for project in projects:
+        for field in DATETIME_FIELDS:
+            if isinstance(project.get(field), str):
+                project[field] = datetime.fromisoformat(project[field])
+    return projects
+
+
+class SharedCatalogSegment:
+    """The catalog snapshot shared by prefork workers, tagged with a generation."""
+
+    def __init__(self, path: str):
+        if fcntl is None:
+            raise RuntimeError("Catalogul partajat necesită un sistem POSIX")
+        self.path = path
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        with self.locked():
+            if os.fstat(self._fd).st_size < HEADER.size:
+                os.ftruncate(self._fd, INITIAL_SIZE)
+                os.pwrite(self._fd, HEADER.pack(MAGIC, 0, 0), 0)
+        self._map = mmap.mmap(self._fd, 0)
+
+    @classmethod
+    def create(cls, path: str) -> "SharedCatalogSegment":
+        """Start from an empty segment, discarding any left by an earlier run."""
+        if os.path.exists(path):
+            os.unlink(path)
+        return cls(path)
+
+    def generation(self) -> int:
+        return struct.unpack_from("<Q", self._map, GENERATION_OFFSET)[0]
+
+    @contextmanager
+    def locked(self) -> Iterator[None]:
+        """Exclusive lock for read-modify-write cycles across workers."""
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def read(self, locked: bool = False) -> Tuple[int, bytes]:
+        """The current generation and payload; pass `locked` when already inside locked()."""
+        if not locked:
+            fcntl.flock(self._fd, fcntl.LOCK_SH)
+        try:
+            self._remap()
+            _, generation, length = HEADER.unpack_from(self._map, 0)
+            return generation, self._map[HEADER.size:HEADER.size + length]
+        finally:
+            if not locked:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def write(self, payload: bytes) -> int:
+        """Store `payload` as the next generation; call inside locked()."""
+        needed = HEADER.size + len(payload)
+        if needed > os.fstat(self._fd).st_size:
+            os.ftruncate(self._fd, max(needed, 2 * len(self._map)))
+        self._remap()
+        generation = self.generation() + 1
+        self._map[HEADER.size:needed] = payload
+        # Publish the generation last so a reader never sees it ahead of its data
+        HEADER.pack_into(self._map, 0, MAGIC, generation, len(payload))
+        return generation
+
+    def _remap(self):
+        # Another worker may have grown the file since we mapped it
+        if os.fstat(self._fd).st_size != len(self._map):
+            self._map.close()
+            self._map = mmap.mmap(self._fd, 0)
+
+    def close(self):
+        self._map.close()
+        os.close(self._fd)
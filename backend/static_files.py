@@ -0,0 +1,237 @@
+import gzip
+import json
+import mimetypes
+import os
+import re
+import threading
+from email.utils import formatdate
+from typing import Dict, Optional, Tuple
+
+import anyio
+from starlette.requests import Request
+from starlette.responses import Response
+
+from images import IMMUTABLE_CACHE
+from response_cache import accepted_encodings, encoded_etag, etag_matches
+
+try:
+    import brotli
+except ImportError:  # brotli is optional; gzip siblings are always generated
+    brotli = None
+
+# Serves the production frontend build from this process. Every file under the
+# build directory is indexed once at startup, so requests are dictionary
+# lookups and nothing outside the build can ever be resolved. Text assets get
+# .br/.gz siblings written next to them, once; requests pick the best one the
+# client accepts.
+
+# index.html and other unhashed files must be revalidated on every load
+REVALIDATE_CACHE = "no-cache"
+
+COMPRESSIBLE_TYPES = re.compile(r"^(text/|application/(javascript|json|xml|manifest\+json)|image/svg\+xml)")
+MIN_COMPRESS_SIZE = 1024
+CHUNK_SIZE = 64 * 1024
+ENCODING_SUFFIXES = (("br", ".br"), ("gzip", ".gz"))
+
+RANGE_PATTERN = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+mimetypes.add_type("application/javascript", ".js")
+mimetypes.add_type("application/json", ".map")
+
+
+class StaticAsset:
+    __slots__ = ("path", "size", "etag", "last_modified", "content_type", "cache_control", "encoded")
+
+    def __init__(self, path: str, immutable: bool):
+        stat = os.stat(path)
+        content_type = mimetypes.guess_type(path)[0] or "application/octet-stream"
+        if content_type.startswith("text/") or content_type in ("application/javascript", "application/json"):
+            content_type += "; charset=utf-8"
+        self.path = path
+        self.size = stat.st_size
+        self.etag = f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+        self.last_modified = formatdate(stat.st_mtime, usegmt=True)
+        self.content_type = content_type
+        self.cache_control = IMMUTABLE_CACHE if immutable else REVALIDATE_CACHE
+        # encoding -> (path, size) of the precompressed sibling
+        self.encoded: Dict[str, Tuple[str, int]] = {}
+
+    @property
+    def compressible(self) -> bool:
+        return self.size >= MIN_COMPRESS_SIZE and COMPRESSIBLE_TYPES.match(self.content_type) is not None
+
+
+def write_atomic(path: str, data: bytes):
+    # Write-then-rename, so concurrent writers never serve a partial file
+    temporary = f"{path}.{os.getpid()}-{threading.get_ident()}.tmp"
+    with open(temporary, "wb") as handle:
+        handle.write(data)
+    os.replace(temporary, path)
+
+
+def _compress(encoding: str, data: bytes) -> bytes:
+    if encoding == "br":
+        return brotli.compress(data, quality=11)
+    return gzip.compress(data, compresslevel=9, mtime=0)
+
+
+def precompress(asset: StaticAsset):
+    """Write missing or stale .br/.gz siblings and record the ones worth serving."""
+    data = None
+    for encoding, suffix in ENCODING_SUFFIXES:
+        if encoding == "br" and brotli is None:
+            continue
+        sibling = asset.path + suffix
+        try:
+            if not os.path.exists(sibling) or os.stat(sibling).st_mtime_ns < os.stat(asset.path).st_mtime_ns:
+                if data is None:
+                    with open(asset.path, "rb") as handle:
+                        data = handle.read()
+                write_atomic(sibling, _compress(encoding, data))
+            size = os.stat(sibling).st_size
+        except OSError:
+            # Read-only build directory without prebuilt siblings: serve identity
+            continue
+        if size < asset.size:
+            asset.encoded[encoding] = (sibling, size)
+
+
+class StaticBuild:
+    """The hashed frontend build, indexed and precompressed."""
+
+    def __init__(self, root: str):
+        self.root = os.path.realpath(root)
+        self.assets: Dict[str, StaticAsset] = {}
+        self.index: Optional[StaticAsset] = None
+
+    def prepare(self):
+        """Index the build and write missing .br/.gz siblings; blocking, run once at startup."""
+        immutable = self._hashed_files()
+        assets = {}
+        for directory, _, filenames in os.walk(self.root):
+            for filename in filenames:
+                if filename.endswith((".br", ".gz", ".tmp")):
+                    continue
+                path = os.path.join(directory, filename)
+                url_path = "/" + os.path.relpath(path, self.root).replace(os.sep, "/")
+                asset = assets[url_path] = StaticAsset(path, url_path in immutable)
+                if asset.compressible:
+                    precompress(asset)
+        self.assets = assets
+        self.index = assets.get("/index.html")
+
+    def _hashed_files(self) -> set:
+        try:
+            with open(os.path.join(self.root, "asset-manifest.json"), encoding="utf-8") as handle:
+                manifest = json.load(handle)
+        except (OSError, ValueError):
+            return set()
+        # Everything the bundler emitted except the entry document carries a content hash
+        return {path for path in manifest.get("files", {}).values() if path != "/index.html"}
+
+    def get(self, url_path: str) -> Optional[StaticAsset]:
+        return self.assets.get(url_path)
+
+
+def _parse_range(header: str, size: int) -> Optional[Tuple[int, int]]:
+    """Single byte range as (start, end inclusive), empty (start > end) when unsatisfiable.
+
+    None when the header isn't exactly one byte range: multiple ranges and
+    malformed headers are ignored, and the whole body is served.
+    """
+    match = RANGE_PATTERN.match(header.strip())
+    if not match or not any(match.groups()):
+        return None
+    first, last = match.groups()
+    if not first:
+        # Suffix range: the final N bytes
+        length = int(last)
+        return (max(0, size - length), size - 1) if length else (size, size - 1)
+    start = int(first)
+    if last and int(last) < start:
+        # Syntactically invalid rather than unsatisfiable
+        return None
+    end = min(int(last), size - 1) if last else size - 1
+    return start, end
+
+
+class StaticFileResponse(Response):
+    """Serves a StaticAsset with content negotiation, conditional GETs and ranges.
+
+    Bodies go out through the ASGI zero-copy extension when the server offers
+    it, otherwise in chunks read off a worker thread.
+    """
+
+    def __init__(self, request: Request, asset: StaticAsset, cache_control: Optional[str] = None):
+        self.asset = asset
+        self.send_body = request.method != "HEAD"
+        self.path, self.offset, self.count = asset.path, 0, asset.size
+        self.status_code = 200
+        headers = {
+            "Content-Type": asset.content_type,
+            "Cache-Control": cache_control or asset.cache_control,
+            "Last-Modified": asset.last_modified,
+            "Accept-Ranges": "bytes",
+        }
+        if asset.encoded:
+            headers["Vary"] = "Accept-Encoding"
+        etag = asset.etag
+
+        range_header = request.headers.get("range")
+        if_range = request.headers.get("if-range")
+        byte_range = None
+        if range_header and (not if_range or if_range == asset.etag):
+            byte_range = _parse_range(range_header, asset.size)
+        if byte_range is not None:
+            # Ranges address the identity bytes, so resumed downloads line up
+            start, end = byte_range
+            if start > end:
+                self.status_code, self.count, self.send_body = 416, 0, False
+                headers["Content-Range"] = f"bytes */{asset.size}"
+            else:
+                self.status_code, self.offset, self.count = 206, start, end - start + 1
+                headers["Content-Range"] = f"bytes {start}-{end}/{asset.size}"
+        else:
+            accepted = accepted_encodings(request)
+            for encoding, _ in ENCODING_SUFFIXES:
+                if encoding in asset.encoded and accepted.get(encoding, 0) > 0:
+                    self.path, self.count = asset.encoded[encoding]
+                    headers["Content-Encoding"] = encoding
+                    etag = encoded_etag(asset.etag, encoding)
+                    break
+            if etag_matches(request, etag):
+                self.status_code, self.count, self.send_body = 304, 0, False
+                headers.pop("Content-Encoding", None)
+
+        headers["ETag"] = etag
+        if self.status_code != 304:
+            headers["Content-Length"] = str(self.count)
+        self.background = None
+        self.init_headers(headers)
+
+    async def __call__(self, scope, receive, send):
+        await send({"type": "http.response.start", "status": self.status_code, "headers": self.raw_headers})
+        if not self.send_body or not self.count:
+            await send({"type": "http.response.body", "body": b""})
+            return
+        if "http.response.zerocopy" in scope.get("extensions", {}):
+            with open(self.path, "rb") as handle:
+                await send({
+                    "type": "http.response.zerocopy",
+                    "file": handle,
+                    "offset": self.offset,
+                    "count": self.count,
+                })
+            return
+        async with await anyio.open_file(self.path, "rb") as handle:
+            await handle.seek(self.offset)
+            remaining = self.count
+            while remaining:
+                chunk = await handle.read(min(CHUNK_SIZE, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                await send({"type": "http.response.body", "body": chunk, "more_body": remaining > 0})
+            if remaining:
+                # The file shrank underneath us; end the body rather than hang
+                await send({"type": "http.response.body", "body": b""})
@@ -0,0 +1,44 @@
+from storage.base import (
+    BulkOperation,
+    ContactRepository,
+    Document,
+    ProjectRepository,
+    Storage,
+    StorageError,
+    VersionConflict,
+)
+
+BACKENDS = ("mongo", "sqlite", "memory")
+
+
+def create_storage(backend: str, **options) -> Storage:
+    """Build the storage backend named by STORAGE_BACKEND.
+
+    Backends are imported lazily so the embedded ones don't need Motor and
+    the Mongo one doesn't touch sqlite.
+    """
+    if backend == "mongo":
+        from storage.mongo import MongoStorage
+        return MongoStorage(
+            options["mongo_url"], options.get("mongo_listeners", ()), **options.get("mongo_options", {})
+        )
+    if backend == "sqlite":
+        from storage.sqlite import SQLiteStorage
+        return SQLiteStorage(options["sqlite_path"])
+    if backend == "memory":
+        from storage.memory import MemoryStorage
+        return MemoryStorage()
+    raise ValueError(f"Unknown STORAGE_BACKEND {backend!r}; expected one of {', '.join(BACKENDS)}")
+
+
+__all__ = [
+    "BACKENDS",
+    "BulkOperation",
+    "ContactRepository",
+    "Document",
+    "ProjectRepository",
+    "Storage",
+    "StorageError",
+    "VersionConflict",
+    "create_storage",
+]
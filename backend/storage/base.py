@@ -0,0 +1,150 @@
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Set, Tuple
+
+from pagination import CursorKey
+
+Document = Dict[str, Any]
+
+# One bulk operation: ("create", None, project), ("update", id, changes) or
+# ("delete", id, None)
+BulkOperation = Tuple[str, Optional[str], Optional[Document]]
+
+
+class StorageError(Exception):
+    """A backend failure that callers may retry."""
+
+
+class VersionConflict(Exception):
+    """The document exists but not at the version the caller expected."""
+
+
+class ProjectRepository(ABC):
+    @abstractmethod
+    async def count(self) -> int:
+        ...
+
+    @abstractmethod
+    async def list_all(self) -> List[Document]:
+        ...
+
+    @abstractmethod
+    async def get(self, project_id: str) -> Optional[Document]:
+        ...
+
+    @abstractmethod
+    async def insert(self, project: Document):
+        ...
+
+    @abstractmethod
+    async def insert_many(self, projects: List[Document]):
+        ...
+
+    @abstractmethod
+    async def update(self, project_id: str, changes: Document, expected_version: Optional[int]) -> Optional[Document]:
+        """Set `changes`, bump `version` and return the stored project.
+
+        Returns None when the project does not exist and raises
+        VersionConflict when `expected_version` is given and stale.
+        """
+
+    @abstractmethod
+    async def delete(self, project_id: str) -> bool:
+        ...
+
+    @abstractmethod
+    async def backfill_versions(self) -> int:
+        """Give projects stored before versioning `version: 1`; returns how many changed."""
+
+    @abstractmethod
+    async def existing_ids(self, project_ids: Sequence[str]) -> Set[str]:
+        ...
+
+    @abstractmethod
+    async def bulk(self, operations: List[BulkOperation]) -> Dict[int, Tuple[int, str]]:
+        """Apply operations unordered; returns (status, message) by position for failures."""
+
+
+class ContactRepository(ABC):
+    @abstractmethod
+    async def insert(self, contact: Document):
+        ...
+
+    @abstractmethod
+    async def insert_many(self, contacts: List[Document]):
+        """Insert a batch, skipping ids that already exist; raises StorageError to retry."""
+
+    @abstractmethod
+    async def get(self, contact_id: str) -> Optional[Document]:
+        ...
+
+    @abstractmethod
+    async def page(self, after: Optional[CursorKey], limit: int) -> List[Document]:
+        """Newest first, strictly after `after` in (created_at, id) order."""
+
+    @abstractmethod
+    def iterate(
+        self,
+        since: Optional[datetime],
+        status: Optional[str],
+        after: Optional[CursorKey],
+        batch_size: int,
+    ) -> AsyncIterator[Document]:
+        """Oldest first, fetched `batch_size` documents at a time."""
+
+    @abstractmethod
+    async def set_status(self, contact_id: str, status: str) -> Optional[Document]:
+        """Move one contact to `status`; returns the updated contact or None."""
+
+    @abstractmethod
+    async def set_status_many(self, contact_ids: Sequence[str], status: str) -> int:
+        """Move every listed contact to `status`; returns how many changed."""
+
+    @abstractmethod
+    async def status_counts(self) -> Dict[str, int]:
+        """Contacts per status, read from counters kept alongside every write."""
+
+    @abstractmethod
+    async def rebuild_status_counts(self):
+        """Recount the status counters from the contacts themselves."""
+
+
+class Storage(ABC):
+    name = ""
+    projects: ProjectRepository
+    contacts: ContactRepository
+
+    async def setup(self):
+        """Connect and warm up. Runs on every worker start, so it must not write."""
+
+    async def ping(self):
+        """One round trip to the backend; raises StorageError when it is unreachable."""
+
+    async def create_indexes(self):
+        """Build the indexes the queries rely on.
+
+        Idempotent, so a migration re-runs it whenever the index set grows.
+        """
+
+    @abstractmethod
+    async def applied_migrations(self) -> Set[str]:
+        """Names of the migrations that finished; running ones don't count."""
+
+    @abstractmethod
+    async def claim_migration(self, name: str, lease: timedelta) -> bool:
+        """Mark `name` as running for `lease`.
+
+        False when it is done or another process holds an unexpired lease;
+        an expired lease is taken over, since its holder died mid-step.
+        """
+
+    @abstractmethod
+    async def complete_migration(self, name: str):
+        """Mark a claimed migration as done."""
+
+    @abstractmethod
+    async def release_migration(self, name: str):
+        """Drop the record of a migration that failed after it was claimed."""
+
+    async def close(self):
+        pass
@@ -0,0 +1,185 @@
+import copy
+from bisect import bisect_left, bisect_right, insort
+from datetime import datetime, timedelta
+from typing import AsyncIterator, Dict, List, Optional, Sequence, Set, Tuple
+
+from pagination import CursorKey, sort_key
+from storage.base import (
+    BulkOperation,
+    ContactRepository,
+    Document,
+    ProjectRepository,
+    Storage,
+    VersionConflict,
+)
+
+# Pure in-process backend: nothing survives a restart. Used for tests,
+# benchmarks and throwaway demos. Documents are copied on the way in and out
+# so callers can't mutate stored state by accident.
+
+
+class MemoryProjectRepository(ProjectRepository):
+    def __init__(self):
+        self.documents: Dict[str, Document] = {}
+
+    async def count(self) -> int:
+        return len(self.documents)
+
+    async def list_all(self) -> List[Document]:
+        return [copy.deepcopy(project) for project in self.documents.values()]
+
+    async def get(self, project_id: str) -> Optional[Document]:
+        project = self.documents.get(project_id)
+        return copy.deepcopy(project) if project else None
+
+    async def insert(self, project: Document):
+        self.documents[project["id"]] = copy.deepcopy(project)
+
+    async def insert_many(self, projects: List[Document]):
+        for project in projects:
+            await self.insert(project)
+
+    def _apply(self, project_id: str, changes: Document, expected_version: Optional[int]) -> Optional[Document]:
+        project = self.documents.get(project_id)
+        if project is None:
+            return None
+        if expected_version is not None and project.get("version", 1) != expected_version:
+            raise VersionConflict(project_id)
+        project.update(copy.deepcopy(changes))
+        project["version"] = project.get("version", 1) + 1
+        return project
+
+    async def update(self, project_id: str, changes: Document, expected_version: Optional[int]) -> Optional[Document]:
+        project = self._apply(project_id, changes, expected_version)
+        return copy.deepcopy(project) if project else None
+
+    async def delete(self, project_id: str) -> bool:
+        return self.documents.pop(project_id, None) is not None
+
+    async def backfill_versions(self) -> int:
+        missing = [project for project in self.documents.values() if "version" not in project]
+        for project in missing:
+            project["version"] = 1
+        return len(missing)
+
+    async def existing_ids(self, project_ids: Sequence[str]) -> Set[str]:
+        return {project_id for project_id in project_ids if project_id in self.documents}
+
+    async def bulk(self, operations: List[BulkOperation]) -> Dict[int, Tuple[int, str]]:
+        errors = {}
+        for position, (op, project_id, document) in enumerate(operations):
+            if op == "create":
+                if document["id"] in self.documents:
+                    errors[position] = (409, "Id duplicat")
+                    continue
+                await self.insert(document)
+            elif op == "update":
+                self._apply(project_id, document, None)
+            else:
+                self.documents.pop(project_id, None)
+        return errors
+
+
+class MemoryContactRepository(ContactRepository):
+    def __init__(self):
+        self.documents: Dict[str, Document] = {}
+        # (created_at, id) ascending, so pages and exports are a bisect away
+        self.keys: List[CursorKey] = []
+        self.counts: Dict[str, int] = {}
+
+    def _count(self, status: str, delta: int):
+        self.counts[status] = self.counts.get(status, 0) + delta
+
+    async def insert(self, contact: Document):
+        if contact["id"] in self.documents:
+            return
+        self.documents[contact["id"]] = copy.deepcopy(contact)
+        insort(self.keys, sort_key(contact))
+        self._count(contact.get("status", ""), 1)
+
+    async def insert_many(self, contacts: List[Document]):
+        for contact in contacts:
+            await self.insert(contact)
+
+    async def get(self, contact_id: str) -> Optional[Document]:
+        contact = self.documents.get(contact_id)
+        return copy.deepcopy(contact) if contact else None
+
+    async def page(self, after: Optional[CursorKey], limit: int) -> List[Document]:
+        end = bisect_left(self.keys, after) if after else len(self.keys)
+        keys = self.keys[max(0, end - limit):end]
+        return [copy.deepcopy(self.documents[key[1]]) for key in reversed(keys)]
+
+    async def iterate(
+        self,
+        since: Optional[datetime],
+        status: Optional[str],
+        after: Optional[CursorKey],
+        batch_size: int,
+    ) -> AsyncIterator[Document]:
+        index = bisect_right(self.keys, after) if after else 0
+        if since:
+            index = max(index, bisect_left(self.keys, (since, "")))
+        while True:
+            batch = self.keys[index:index + batch_size]
+            if not batch:
+                return
+            for key in batch:
+                contact = self.documents[key[1]]
+                if not status or contact.get("status") == status:
+                    yield copy.deepcopy(contact)
+            # Resume by key rather than index so inserts during the export are harmless
+            index = bisect_right(self.keys, batch[-1])
+
+    async def set_status(self, contact_id: str, status: str) -> Optional[Document]:
+        contact = self.documents.get(contact_id)
+        if contact is None:
+            return None
+        if contact.get("status") != status:
+            self._count(contact.get("status", ""), -1)
+            self._count(status, 1)
+            contact["status"] = status
+        return copy.deepcopy(contact)
+
+    async def set_status_many(self, contact_ids: Sequence[str], status: str) -> int:
+        changed = 0
+        for contact_id in set(contact_ids):
+            contact = self.documents.get(contact_id)
+            if contact is not None and contact.get("status") != status:
+                await self.set_status(contact_id, status)
+                changed += 1
+        return changed
+
+    async def status_counts(self) -> Dict[str, int]:
+        return {status: count for status, count in self.counts.items() if count}
+
+    async def rebuild_status_counts(self):
+        self.counts = {}
+        for contact in self.documents.values():
+            self._count(contact.get("status", ""), 1)
+
+
+class MemoryStorage(Storage):
+    name = "memory"
+
+    def __init__(self):
+        self.projects = MemoryProjectRepository()
+        self.contacts = MemoryContactRepository()
+        # name -> lease expiry while running, None once done
+        self.migrations: Dict[str, Optional[datetime]] = {}
+
+    async def applied_migrations(self) -> Set[str]:
+        return {name for name, lease_until in self.migrations.items() if lease_until is None}
+
+    async def claim_migration(self, name: str, lease: timedelta) -> bool:
+        now = datetime.now()
+        if name in self.migrations and (self.migrations[name] is None or self.migrations[name] > now):
+            return False
+        self.migrations[name] = now + lease
+        return True
+
+    async def complete_migration(self, name: str):
+        self.migrations[name] = None
+
+    async def release_migration(self, name: str):
+        self.migrations.pop(name, None)
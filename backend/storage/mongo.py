@@ -0,0 +1,353 @@
+from datetime import datetime, timedelta
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import DeleteOne, InsertOne, ReturnDocument, UpdateOne
+from pymongo.errors import BulkWriteError, DuplicateKeyError, PyMongoError
+
+from pagination import SORT, SORT_ASCENDING, CursorKey, keyset_filter
+from storage.base import (
+    BulkOperation,
+    ContactRepository,
+    Document,
+    ProjectRepository,
+    Storage,
+    StorageError,
+    VersionConflict,
+)
+
+# Mongo error code for a unique index violation
+DUPLICATE_KEY = 11000
+
+NO_ID = {"_id": 0}
+
+
+def version_filter(project_id: str, version: Optional[int]) -> dict:
+    # Projects written before versioning get `version: 1` from the
+    # 0004_project_versions migration, so every stored project has one
+    query = {"id": project_id}
+    if version is not None:
+        query["version"] = version
+    return query
+
+
+def version_update(changes: Document, expected_version: Optional[int]) -> dict:
+    if expected_version is None:
+        return {"$set": changes, "$inc": {"version": 1}}
+    # Set the next version outright; it is known once the filter matched
+    return {"$set": dict(changes, version=expected_version + 1)}
+
+
+class MongoProjectRepository(ProjectRepository):
+    def __init__(self, collection):
+        self.collection = collection
+
+    async def count(self) -> int:
+        return await self.collection.count_documents({})
+
+    async def list_all(self) -> List[Document]:
+        return await self.collection.find({}, NO_ID).to_list(None)
+
+    async def get(self, project_id: str) -> Optional[Document]:
+        return await self.collection.find_one({"id": project_id}, NO_ID)
+
+    async def insert(self, project: Document):
+        await self.collection.insert_one(dict(project))
+
+    async def insert_many(self, projects: List[Document]):
+        await self.collection.insert_many([dict(project) for project in projects])
+
+    async def update(self, project_id: str, changes: Document, expected_version: Optional[int]) -> Optional[Document]:
+        updated = await self.collection.find_one_and_update(
+            version_filter(project_id, expected_version),
+            version_update(changes, expected_version),
+            projection=NO_ID,
+            return_document=ReturnDocument.AFTER,
+        )
+        # Only the failure path pays for telling "missing" from "stale"
+        if updated is None and expected_version is not None:
+            if await self.collection.count_documents({"id": project_id}, limit=1):
+                raise VersionConflict(project_id)
+        return updated
+
+    async def delete(self, project_id: str) -> bool:
+        result = await self.collection.delete_one({"id": project_id})
+        return result.deleted_count > 0
+
+    async def backfill_versions(self) -> int:
+        result = await self.collection.update_many({"version": {"$exists": False}}, {"$set": {"version": 1}})
+        return result.modified_count
+
+    async def existing_ids(self, project_ids: Sequence[str]) -> Set[str]:
+        found = await self.collection.find({"id": {"$in": list(project_ids)}}, {"_id": 0, "id": 1}).to_list(None)
+        return {doc["id"] for doc in found}
+
+    async def bulk(self, operations: List[BulkOperation]) -> Dict[int, Tuple[int, str]]:
+        requests = []
+        for op, project_id, document in operations:
+            if op == "create":
+                requests.append(InsertOne(dict(document)))
+            elif op == "update":
+                requests.append(UpdateOne({"id": project_id}, {"$set": document, "$inc": {"version": 1}}))
+            else:
+                requests.append(DeleteOne({"id": project_id}))
+        try:
+            await self.collection.bulk_write(requests, ordered=False)
+        except BulkWriteError as exc:
+            return {
+                error["index"]: (409 if error.get("code") == DUPLICATE_KEY else 500, error.get("errmsg", ""))
+                for error in exc.details.get("writeErrors", [])
+            }
+        return {}
+
+
+# Single document holding the per-status contact counters
+CONTACT_COUNTS_ID = "contacts_by_status"
+
+
+class MongoContactRepository(ContactRepository):
+    """Contacts plus a per-status counter document.
+
+    On a replica set or sharded cluster every contact write and its counter
+    update run in one transaction. A standalone server has no transactions,
+    so there they are separate writes and the counters are not atomic: a
+    process dying between the two leaves a counter off by that write until
+    `rebuild_status_counts` runs again.
+    """
+
+    def __init__(self, collection, counters=None):
+        self.collection = collection
+        self.counters = counters
+        # Set by MongoStorage.setup() when the deployment supports transactions
+        self.client = None
+
+    async def _atomic(self, write: Callable[[Any], Awaitable[Any]]) -> Any:
+        """Run `write(session)` in one transaction when the deployment has them."""
+        if self.client is None:
+            return await write(None)
+        async with await self.client.start_session() as session:
+            return await session.with_transaction(write)
+
+    async def _count(self, deltas: Dict[str, int], session=None):
+        deltas = {f"by_status.{status}": delta for status, delta in deltas.items() if delta}
+        if deltas:
+            await self.counters.update_one({"_id": CONTACT_COUNTS_ID}, {"$inc": deltas}, upsert=True, session=session)
+
+    async def insert(self, contact: Document):
+        async def write(session):
+            await self.collection.insert_one(dict(contact), session=session)
+            await self._count({contact.get("status", ""): 1}, session)
+
+        await self._atomic(write)
+
+    async def insert_many(self, contacts: List[Document]):
+        if self.client is not None:
+            try:
+                await self._atomic(lambda session: self._insert_new(contacts, session))
+            except PyMongoError as exc:
+                raise StorageError(str(exc)) from exc
+            return
+        failed, error = set(), None
+        try:
+            await self.collection.insert_many([dict(contact) for contact in contacts], ordered=False)
+        except BulkWriteError as exc:
+            errors = exc.details.get("writeErrors", [])
+            failed = {error["index"] for error in errors}
+            if any(error.get("code") != DUPLICATE_KEY for error in errors):
+                error = StorageError(str(exc))
+        except PyMongoError as exc:
+            raise StorageError(str(exc)) from exc
+        # Count what was stored even when the batch is retried: the retry skips
+        # these as duplicates and would never count them
+        deltas: Dict[str, int] = {}
+        for index, contact in enumerate(contacts):
+            if index not in failed:
+                status = contact.get("status", "")
+                deltas[status] = deltas.get(status, 0) + 1
+        try:
+            await self._count(deltas)
+        except PyMongoError as exc:
+            # Without a transaction the contacts are stored regardless; the
+            # counters are off until the next rebuild
+            raise StorageError(str(exc)) from exc
+        if error:
+            raise error
+
+    async def _insert_new(self, contacts: List[Document], session):
+        # A duplicate key error aborts the whole transaction, so contacts a
+        # retried batch already stored are left out up front
+        ids = [contact["id"] for contact in contacts]
+        stored = set(await self.collection.distinct("id", {"id": {"$in": ids}}, session=session))
+        fresh = list({contact["id"]: dict(contact) for contact in contacts if contact["id"] not in stored}.values())
+        if not fresh:
+            return
+        await self.collection.insert_many(fresh, session=session)
+        deltas: Dict[str, int] = {}
+        for contact in fresh:
+            status = contact.get("status", "")
+            deltas[status] = deltas.get(status, 0) + 1
+        await self._count(deltas, session)
+
+    async def get(self, contact_id: str) -> Optional[Document]:
+        return await self.collection.find_one({"id": contact_id}, NO_ID)
+
+    async def page(self, after: Optional[CursorKey], limit: int) -> List[Document]:
+        query = keyset_filter(after) if after else {}
+        return await self.collection.find(query, NO_ID).sort(SORT).limit(limit).to_list(limit)
+
+    async def iterate(
+        self,
+        since: Optional[datetime],
+        status: Optional[str],
+        after: Optional[CursorKey],
+        batch_size: int,
+    ) -> AsyncIterator[Document]:
+        conditions = []
+        if since:
+            conditions.append({"created_at": {"$gte": since}})
+        if status:
+            conditions.append({"status": status})
+        if after:
+            conditions.append(keyset_filter(after, ascending=True))
+        query = {"$and": conditions} if conditions else {}
+        async for contact in self.collection.find(query, NO_ID).sort(SORT_ASCENDING).batch_size(batch_size):
+            yield contact
+
+    async def set_status(self, contact_id: str, status: str) -> Optional[Document]:
+        async def write(session):
+            previous = await self.collection.find_one_and_update(
+                {"id": contact_id}, {"$set": {"status": status}}, projection=NO_ID, session=session
+            )
+            if previous is None:
+                return None
+            if previous.get("status") != status:
+                await self._count({previous.get("status", ""): -1, status: 1}, session)
+            return dict(previous, status=status)
+
+        return await self._atomic(write)
+
+    async def set_status_many(self, contact_ids: Sequence[str], status: str) -> int:
+        # One update_many per source status keeps the counter deltas exact:
+        # every document it modifies left exactly that status, so concurrent
+        # changes to the same contacts can't be counted twice
+        ids = list(set(contact_ids))
+
+        async def write(session):
+            current = await self.collection.distinct("status", {"id": {"$in": ids}}, session=session)
+            sources = [source for source in current if source != status]
+            changed, deltas = 0, {}
+            for source in sources:
+                result = await self.collection.update_many(
+                    {"id": {"$in": ids}, "status": source}, {"$set": {"status": status}}, session=session
+                )
+                if result.modified_count:
+                    changed += result.modified_count
+                    deltas[source] = -result.modified_count
+            deltas[status] = changed
+            await self._count(deltas, session)
+            return changed
+
+        return await self._atomic(write)
+
+    async def status_counts(self) -> Dict[str, int]:
+        counters = await self.counters.find_one({"_id": CONTACT_COUNTS_ID})
+        by_status = (counters or {}).get("by_status", {})
+        return {status: count for status, count in by_status.items() if count}
+
+    async def rebuild_status_counts(self):
+        async def write(session):
+            grouped = await self.collection.aggregate(
+                [{"$group": {"_id": "$status", "count": {"$sum": 1}}}], session=session
+            ).to_list(None)
+            await self.counters.replace_one(
+                {"_id": CONTACT_COUNTS_ID},
+                {"by_status": {group["_id"] or "": group["count"] for group in grouped}},
+                upsert=True,
+                session=session,
+            )
+
+        await self._atomic(write)
+
+
+class MongoStorage(Storage):
+    name = "mongo"
+
+    def __init__(self, url: str, event_listeners: Sequence = (), **client_options):
+        self.url = url
+        self.client_options = dict(client_options, event_listeners=list(event_listeners))
+        self.client = None
+        self.db = None
+        self.migrations = None
+        # Collections are bound in setup(), once the client exists
+        self.projects = MongoProjectRepository(None)
+        self.contacts = MongoContactRepository(None)
+
+    async def setup(self):
+        # Created here rather than at import so the pool settings come from the
+        # environment at start and the client binds to the serving event loop
+        self.client = AsyncIOMotorClient(self.url, **self.client_options)
+        self.db = self.client.portfolio_db
+        self.projects.collection = self.db.projects
+        self.contacts.collection = self.db.contacts
+        self.contacts.counters = self.db.counters
+        self.migrations = self.db["_migrations"]
+        # Warm-up: selects a server and opens the first pooled connection
+        await self.ping()
+        # Transactions need a replica set member or a mongos router
+        try:
+            hello = await self.client.admin.command("hello")
+        except PyMongoError as exc:
+            raise StorageError(str(exc)) from exc
+        if hello.get("setName") or hello.get("msg") == "isdbgrid":
+            self.contacts.client = self.client
+
+    async def ping(self):
+        try:
+            await self.client.admin.command("ping")
+        except PyMongoError as exc:
+            raise StorageError(str(exc)) from exc
+
+    async def create_indexes(self):
+        await self.db.projects.create_index("id", unique=True)
+        await self.db.contacts.create_index("id", unique=True)
+        # Keyset pagination and the featured list sort on these
+        await self.db.projects.create_index([("created_at", -1), ("id", -1)])
+        await self.db.projects.create_index([("featured", 1), ("created_at", -1)])
+        # Facet filters: multikey index for tech=, plain index for category=
+        await self.db.projects.create_index([("tech_stack", 1), ("created_at", -1)])
+        await self.db.projects.create_index([("category", 1), ("created_at", -1)])
+        await self.db.contacts.create_index([("created_at", -1), ("id", -1)])
+        # Inbox views and exports filtered by status
+        await self.db.contacts.create_index([("status", 1), ("created_at", -1)])
+
+    async def applied_migrations(self) -> Set[str]:
+        # Records written before leases existed have no status and count as done
+        applied = await self.migrations.find({"status": {"$ne": "running"}}, {"_id": 1}).to_list(None)
+        return {doc["_id"] for doc in applied}
+
+    async def claim_migration(self, name: str, lease: timedelta) -> bool:
+        now = datetime.now()
+        # Matches only an expired lease; with no record at all the upsert
+        # inserts one, and any other record fails the insert on _id
+        try:
+            await self.migrations.update_one(
+                {"_id": name, "status": "running", "lease_until": {"$lt": now}},
+                {"$set": {"claimed_at": now, "lease_until": now + lease}},
+                upsert=True,
+            )
+        except DuplicateKeyError:
+            return False
+        return True
+
+    async def complete_migration(self, name: str):
+        await self.migrations.update_one(
+            {"_id": name},
+            {"$set": {"status": "done", "applied_at": datetime.now()}, "$unset": {"lease_until": ""}},
+        )
+
+    async def release_migration(self, name: str):
+        await self.migrations.delete_one({"_id": name})
+
+    async def close(self):
+        if self.client is not None:
+            self.client.close()
@@ -0,0 +1,397 @@
+import asyncio
+import json
+import os
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+from pagination import CursorKey
+from storage.base import (
+    BulkOperation,
+    ContactRepository,
+    Document,
+    ProjectRepository,
+    Storage,
+    StorageError,
+    VersionConflict,
+)
+
+# Embedded single-file backend. Documents are stored as JSON next to the
+# columns used for ordering and filtering. SQLite calls block, so they all run
+# on one dedicated thread: writes are serialized the way SQLite wants them and
+# the event loop never waits on disk.
+
+DATETIME_FIELDS = ("created_at", "updated_at")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS projects (
+    id TEXT PRIMARY KEY,
+    created_at TEXT NOT NULL,
+    version INTEGER NOT NULL DEFAULT 1,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS projects_created ON projects (created_at DESC, id DESC);
+CREATE TABLE IF NOT EXISTS contacts (
+    id TEXT PRIMARY KEY,
+    created_at TEXT NOT NULL,
+    status TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS contacts_created ON contacts (created_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS contacts_status ON contacts (status, created_at DESC);
+CREATE TABLE IF NOT EXISTS contact_counts (
+    status TEXT PRIMARY KEY,
+    count INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS _migrations (
+    name TEXT PRIMARY KEY,
+    applied_at TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'done',
+    lease_until TEXT
+);
+"""
+
+
+def _upgrade_schema(connection: sqlite3.Connection):
+    # Databases created before migration leases lack the status columns;
+    # every step they recorded had run, hence the 'done' default
+    columns = {row[1] for row in connection.execute("PRAGMA table_info(_migrations)")}
+    if "status" not in columns:
+        connection.execute("ALTER TABLE _migrations ADD COLUMN status TEXT NOT NULL DEFAULT 'done'")
+        connection.execute("ALTER TABLE _migrations ADD COLUMN lease_until TEXT")
+
+
+def _timestamp(value: datetime) -> str:
+    # Fixed precision so the text column sorts chronologically
+    return value.isoformat(timespec="microseconds")
+
+
+def _encode(document: Document) -> str:
+    return json.dumps(
+        document,
+        ensure_ascii=False,
+        default=lambda value: _timestamp(value) if isinstance(value, datetime) else str(value),
+    )
+
+
+def _decode(data: str) -> Document:
+    document = json.loads(data)
+    for field in DATETIME_FIELDS:
+        if isinstance(document.get(field), str):
+            document[field] = datetime.fromisoformat(document[field])
+    return document
+
+
+class SQLiteDatabase:
+    def __init__(self, path: str):
+        self.path = path
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sqlite")
+        self._connection: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            connection = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.executescript(SCHEMA)
+            _upgrade_schema(connection)
+            self._connection = connection
+        return self._connection
+
+    async def run(self, work: Callable[[sqlite3.Connection], Any]) -> Any:
+        def call():
+            try:
+                return work(self._connect())
+            except sqlite3.Error as exc:
+                raise StorageError(str(exc)) from exc
+
+        return await asyncio.get_running_loop().run_in_executor(self._executor, call)
+
+    async def transaction(self, work: Callable[[sqlite3.Connection], Any]) -> Any:
+        def atomic(connection: sqlite3.Connection):
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                result = work(connection)
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+            return result
+
+        return await self.run(atomic)
+
+    def close(self):
+        def close_connection():
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+        self._executor.submit(close_connection).result()
+        self._executor.shutdown(wait=True)
+
+
+def _insert_project(connection: sqlite3.Connection, project: Document):
+    connection.execute(
+        "INSERT INTO projects (id, created_at, version, data) VALUES (?, ?, ?, ?)",
+        (project["id"], _timestamp(project["created_at"]), project.get("version", 1), _encode(project)),
+    )
+
+
+def _update_project(
+    connection: sqlite3.Connection, project_id: str, changes: Document, expected_version: Optional[int]
+) -> Optional[Document]:
+    row = connection.execute("SELECT version, data FROM projects WHERE id = ?", (project_id,)).fetchone()
+    if row is None:
+        return None
+    if expected_version is not None and row[0] != expected_version:
+        raise VersionConflict(project_id)
+    project = _decode(row[1])
+    project.update(changes)
+    project["version"] = row[0] + 1
+    connection.execute(
+        "UPDATE projects SET version = ?, data = ? WHERE id = ?",
+        (project["version"], _encode(project), project_id),
+    )
+    return project
+
+
+class SQLiteProjectRepository(ProjectRepository):
+    def __init__(self, database: SQLiteDatabase):
+        self.database = database
+
+    async def count(self) -> int:
+        return await self.database.run(lambda c: c.execute("SELECT COUNT(*) FROM projects").fetchone()[0])
+
+    async def list_all(self) -> List[Document]:
+        rows = await self.database.run(lambda c: c.execute("SELECT data FROM projects").fetchall())
+        return [_decode(row[0]) for row in rows]
+
+    async def get(self, project_id: str) -> Optional[Document]:
+        row = await self.database.run(
+            lambda c: c.execute("SELECT data FROM projects WHERE id = ?", (project_id,)).fetchone()
+        )
+        return _decode(row[0]) if row else None
+
+    async def insert(self, project: Document):
+        await self.database.run(lambda c: _insert_project(c, project))
+
+    async def insert_many(self, projects: List[Document]):
+        await self.database.transaction(lambda c: [_insert_project(c, project) for project in projects])
+
+    async def update(self, project_id: str, changes: Document, expected_version: Optional[int]) -> Optional[Document]:
+        return await self.database.transaction(lambda c: _update_project(c, project_id, changes, expected_version))
+
+    async def delete(self, project_id: str) -> bool:
+        cursor = await self.database.run(lambda c: c.execute("DELETE FROM projects WHERE id = ?", (project_id,)))
+        return cursor.rowcount > 0
+
+    async def backfill_versions(self) -> int:
+        # The version column is NOT NULL with a default, so there is nothing to fill
+        return 0
+
+    async def existing_ids(self, project_ids: Sequence[str]) -> Set[str]:
+        ids = list(project_ids)
+        if not ids:
+            return set()
+        placeholders = ",".join("?" * len(ids))
+        rows = await self.database.run(
+            lambda c: c.execute(f"SELECT id FROM projects WHERE id IN ({placeholders})", ids).fetchall()
+        )
+        return {row[0] for row in rows}
+
+    async def bulk(self, operations: List[BulkOperation]) -> Dict[int, Tuple[int, str]]:
+        def apply(connection: sqlite3.Connection):
+            errors = {}
+            for position, (op, project_id, document) in enumerate(operations):
+                try:
+                    if op == "create":
+                        _insert_project(connection, document)
+                    elif op == "update":
+                        _update_project(connection, project_id, document, None)
+                    else:
+                        connection.execute("DELETE FROM projects WHERE id = ?", (project_id,))
+                except sqlite3.IntegrityError as exc:
+                    errors[position] = (409, str(exc))
+            return errors
+
+        return await self.database.transaction(apply)
+
+
+def _count_status(connection: sqlite3.Connection, status: str, delta: int):
+    connection.execute(
+        "INSERT INTO contact_counts (status, count) VALUES (?, ?) "
+        "ON CONFLICT (status) DO UPDATE SET count = count + excluded.count",
+        (status, delta),
+    )
+
+
+def _insert_contact(connection: sqlite3.Connection, contact: Document, ignore_existing: bool = False):
+    # Always inside a transaction, so the counter moves with the row
+    verb = "INSERT OR IGNORE" if ignore_existing else "INSERT"
+    status = contact.get("status", "")
+    cursor = connection.execute(
+        f"{verb} INTO contacts (id, created_at, status, data) VALUES (?, ?, ?, ?)",
+        (contact["id"], _timestamp(contact["created_at"]), status, _encode(contact)),
+    )
+    if cursor.rowcount > 0:
+        _count_status(connection, status, 1)
+
+
+def _set_contact_status(connection: sqlite3.Connection, contact_id: str, status: str) -> Optional[Document]:
+    row = connection.execute("SELECT status, data FROM contacts WHERE id = ?", (contact_id,)).fetchone()
+    if row is None:
+        return None
+    contact = _decode(row[1])
+    if row[0] != status:
+        contact["status"] = status
+        connection.execute(
+            "UPDATE contacts SET status = ?, data = ? WHERE id = ?", (status, _encode(contact), contact_id)
+        )
+        _count_status(connection, row[0], -1)
+        _count_status(connection, status, 1)
+    return contact
+
+
+class SQLiteContactRepository(ContactRepository):
+    def __init__(self, database: SQLiteDatabase):
+        self.database = database
+
+    async def insert(self, contact: Document):
+        await self.database.transaction(lambda c: _insert_contact(c, contact))
+
+    async def insert_many(self, contacts: List[Document]):
+        await self.database.transaction(
+            lambda c: [_insert_contact(c, contact, ignore_existing=True) for contact in contacts]
+        )
+
+    async def get(self, contact_id: str) -> Optional[Document]:
+        row = await self.database.run(
+            lambda c: c.execute("SELECT data FROM contacts WHERE id = ?", (contact_id,)).fetchone()
+        )
+        return _decode(row[0]) if row else None
+
+    async def page(self, after: Optional[CursorKey], limit: int) -> List[Document]:
+        if after:
+            created_at = _timestamp(after[0])
+            query = (
+                "SELECT data FROM contacts WHERE created_at < ? OR (created_at = ? AND id < ?) "
+                "ORDER BY created_at DESC, id DESC LIMIT ?"
+            )
+            params: tuple = (created_at, created_at, after[1], limit)
+        else:
+            query, params = "SELECT data FROM contacts ORDER BY created_at DESC, id DESC LIMIT ?", (limit,)
+        rows = await self.database.run(lambda c: c.execute(query, params).fetchall())
+        return [_decode(row[0]) for row in rows]
+
+    async def iterate(
+        self,
+        since: Optional[datetime],
+        status: Optional[str],
+        after: Optional[CursorKey],
+        batch_size: int,
+    ) -> AsyncIterator[Document]:
+        filters, base_params = [], []
+        if since:
+            filters.append("created_at >= ?")
+            base_params.append(_timestamp(since))
+        if status:
+            filters.append("status = ?")
+            base_params.append(status)
+        position = (_timestamp(after[0]), after[1]) if after else None
+        while True:
+            clauses, params = list(filters), list(base_params)
+            if position:
+                clauses.append("(created_at > ? OR (created_at = ? AND id > ?))")
+                params.extend([position[0], position[0], position[1]])
+            where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+            query = f"SELECT created_at, id, data FROM contacts {where} ORDER BY created_at, id LIMIT ?"
+            rows = await self.database.run(lambda c: c.execute(query, params + [batch_size]).fetchall())
+            for row in rows:
+                yield _decode(row[2])
+            if len(rows) < batch_size:
+                return
+            position = (rows[-1][0], rows[-1][1])
+
+    async def set_status(self, contact_id: str, status: str) -> Optional[Document]:
+        return await self.database.transaction(lambda c: _set_contact_status(c, contact_id, status))
+
+    async def set_status_many(self, contact_ids: Sequence[str], status: str) -> int:
+        def apply(connection: sqlite3.Connection) -> int:
+            changed = 0
+            for contact_id in set(contact_ids):
+                row = connection.execute("SELECT status FROM contacts WHERE id = ?", (contact_id,)).fetchone()
+                if row is not None and row[0] != status:
+                    _set_contact_status(connection, contact_id, status)
+                    changed += 1
+            return changed
+
+        return await self.database.transaction(apply)
+
+    async def status_counts(self) -> Dict[str, int]:
+        rows = await self.database.run(
+            lambda c: c.execute("SELECT status, count FROM contact_counts WHERE count > 0").fetchall()
+        )
+        return dict(rows)
+
+    async def rebuild_status_counts(self):
+        def recount(connection: sqlite3.Connection):
+            connection.execute("DELETE FROM contact_counts")
+            connection.execute(
+                "INSERT INTO contact_counts (status, count) SELECT status, COUNT(*) FROM contacts GROUP BY status"
+            )
+
+        await self.database.transaction(recount)
+
+
+class SQLiteStorage(Storage):
+    name = "sqlite"
+
+    def __init__(self, path: str):
+        self.database = SQLiteDatabase(path)
+        self.projects = SQLiteProjectRepository(self.database)
+        self.contacts = SQLiteContactRepository(self.database)
+
+    async def setup(self):
+        # Opening the connection applies WAL mode and the schema, which also
+        # carries the indexes, so create_indexes has nothing left to do
+        await self.database.run(lambda c: None)
+
+    async def ping(self):
+        await self.database.run(lambda c: c.execute("SELECT 1").fetchone())
+
+    async def applied_migrations(self) -> Set[str]:
+        rows = await self.database.run(
+            lambda c: c.execute("SELECT name FROM _migrations WHERE status = 'done'").fetchall()
+        )
+        return {row[0] for row in rows}
+
+    async def claim_migration(self, name: str, lease: timedelta) -> bool:
+        now = datetime.now()
+        # Inserts a running record, or takes over one whose lease expired
+        cursor = await self.database.run(
+            lambda c: c.execute(
+                "INSERT INTO _migrations (name, applied_at, status, lease_until) VALUES (?, ?, 'running', ?) "
+                "ON CONFLICT (name) DO UPDATE SET applied_at = excluded.applied_at, lease_until = excluded.lease_until "
+                "WHERE status = 'running' AND lease_until < ?",
+                (name, _timestamp(now), _timestamp(now + lease), _timestamp(now)),
+            )
+        )
+        return cursor.rowcount > 0
+
+    async def complete_migration(self, name: str):
+        await self.database.run(
+            lambda c: c.execute(
+                "UPDATE _migrations SET status = 'done', applied_at = ?, lease_until = NULL WHERE name = ?",
+                (_timestamp(datetime.now()), name),
+            )
+        )
+
+    async def release_migration(self, name: str):
+        await self.database.run(lambda c: c.execute("DELETE FROM _migrations WHERE name = ?", (name,)))
+
+    async def close(self):
+        await asyncio.get_running_loop().run_in_executor(None, self.database.close)
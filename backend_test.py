@@ -2,16 +2,32 @@
 """
 Backend API Testing for Luxury Portfolio Website
 Tests all API endpoints and functionality
+
+Also contains a load-testing harness that drives the FastAPI app in-process
+against an in-memory Mongo stand-in:
+
+    python backend_test.py                      # functional tests against a running server
+    python backend_test.py local                # functional tests in-process on the memory backend
+    python backend_test.py bench -c 32 -n 5000  # concurrent benchmark, results saved as JSON
 """
 
+import argparse
+import asyncio
+import copy
+import os
+import random
 import requests
+import subprocess
 import sys
+import tempfile
 import json
+import time
+import uuid
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
 
 class LuxuryPortfolioAPITester:
-    def __init__(self, base_url="http://localhost:8001"):
+    def __init__(self, base_url="http://localhost:8001", client=None):
         # Read the public URL from frontend .env
         try:
             with open('/app/frontend/.env', 'r') as f:
@@ -22,6 +38,8 @@ class LuxuryPortfolioAPITester:
         except:
             pass  # Use default if can't read .env
         self.base_url = base_url
+        # `requests` for a running server, or an in-process TestClient
+        self.client = client or requests
         self.tests_run = 0
         self.tests_passed = 0
         self.project_ids = []
@@ -36,20 +54,23 @@ class LuxuryPortfolioAPITester:
             print(f"❌ {name} - FAILED {details}")
         return success
 
-    def make_request(self, method: str, endpoint: str, data: Dict[Any, Any] = None) -> tuple:
+    def make_request(self, method: str, endpoint: str, data: Dict[Any, Any] = None,
+                     headers: Dict[str, str] = None) -> tuple:
         """Make HTTP request and return success status and response"""
         url = f"{self.base_url}{endpoint}"
-        headers = {'Content-Type': 'application/json'}
+        headers = {'Content-Type': 'application/json', **(headers or {})}
         
         try:
             if method == 'GET':
-                response = requests.get(url, headers=headers, timeout=10)
+                response = self.client.get(url, headers=headers, timeout=10)
             elif method == 'POST':
-                response = requests.post(url, json=data, headers=headers, timeout=10)
+                response = self.client.post(url, json=data, headers=headers, timeout=10)
             elif method == 'PUT':
-                response = requests.put(url, json=data, headers=headers, timeout=10)
+                response = self.client.put(url, json=data, headers=headers, timeout=10)
+            elif method == 'PATCH':
+                response = self.client.patch(url, json=data, headers=headers, timeout=10)
             elif method == 'DELETE':
-                response = requests.delete(url, headers=headers, timeout=10)
+                response = self.client.delete(url, headers=headers, timeout=10)
             else:
                 return False, None, f"Unsupported method: {method}"
 
@@ -215,6 +236,139 @@ class LuxuryPortfolioAPITester:
         else:
             return self.log_test("Create Project", False, f"Status: {response.status_code}")
 
+    def test_project_not_modified(self):
+        """Test GET /api/projects/{id} with If-None-Match"""
+        if not self.project_ids:
+            return self.log_test("Project Not Modified", False, "No project IDs available")
+
+        endpoint = f'/api/projects/{self.project_ids[0]}'
+        success, response, error = self.make_request('GET', endpoint)
+        if not success:
+            return self.log_test("Project Not Modified", False, f"Request failed: {error}")
+        etag = response.headers.get('ETag')
+        if not etag:
+            return self.log_test("Project Not Modified", False, "Missing ETag header")
+
+        success, response, error = self.make_request('GET', endpoint, headers={'If-None-Match': etag})
+        if not success:
+            return self.log_test("Project Not Modified", False, f"Request failed: {error}")
+        if response.status_code == 304:
+            return self.log_test("Project Not Modified", True, f"ETag: {etag}")
+        return self.log_test("Project Not Modified", False, f"Expected 304, got {response.status_code}")
+
+    def test_stale_project_updates(self):
+        """Test PATCH/PUT with a stale If-Match (412) and a stale body version (409)"""
+        project_id = getattr(self, 'test_project_id', None)
+        if not project_id:
+            return self.log_test("Stale Project Updates", False, "No created project available")
+
+        endpoint = f'/api/projects/{project_id}'
+        success, response, error = self.make_request('GET', endpoint)
+        if not success:
+            return self.log_test("Stale Project Updates", False, f"Request failed: {error}")
+        project, stale_etag = response.json(), response.headers.get('ETag')
+
+        # The first writer holding the current ETag wins
+        success, response, error = self.make_request(
+            'PATCH', endpoint, {"title": "Test Project (edited)"}, headers={'If-Match': stale_etag}
+        )
+        if not success or response.status_code != 200:
+            return self.log_test("Stale Project Updates", False, f"Fresh PATCH failed: {error or response.status_code}")
+
+        # Anyone still holding the old ETag or version must not overwrite it
+        expected = {
+            "PATCH If-Match": (412, self.make_request(
+                'PATCH', endpoint, {"title": "Lost update"}, headers={'If-Match': stale_etag})),
+            "PATCH body version": (409, self.make_request(
+                'PATCH', endpoint, {"title": "Lost update", "version": project["version"]})),
+            "PUT If-Match": (412, self.make_request(
+                'PUT', endpoint, dict(project, title="Lost update"), headers={'If-Match': stale_etag})),
+        }
+        wrong = [
+            f"{name}: {response.status_code if success else error}"
+            for name, (status, (success, response, error)) in expected.items()
+            if not success or response.status_code != status
+        ]
+        if wrong:
+            return self.log_test("Stale Project Updates", False, "; ".join(wrong))
+
+        success, response, error = self.make_request('GET', endpoint)
+        if success and response.json().get('title') == "Test Project (edited)":
+            return self.log_test("Stale Project Updates", True, "412/409 and the first write kept")
+        return self.log_test("Stale Project Updates", False, "Stale write changed the project")
+
+    def test_bulk_partial_failure(self):
+        """Test POST /api/projects/bulk with per-item failures"""
+        operations = [
+            {"op": "update", "id": "nonexistent-project-id", "project": {"title": "Missing"}},
+            {"op": "create", "project": {"title": "Missing required fields"}},
+            {"op": "create", "project": {
+                "title": "Bulk Test Project",
+                "subtitle": "Created in bulk",
+                "description": "Created by the bulk partial-failure test.",
+                "tech_stack": ["Python"],
+                "category": "Testing",
+                "hero_image": "https://example.com/bulk.jpg",
+                "gallery_images": [],
+                "challenge": "Bulk writes",
+                "solution": "One request",
+                "process": "Validate → Write",
+                "results": "Created",
+            }},
+        ]
+        success, response, error = self.make_request('POST', '/api/projects/bulk', {"operations": operations})
+        if not success:
+            return self.log_test("Bulk Partial Failure", False, f"Request failed: {error}")
+        if response.status_code != 200:
+            return self.log_test("Bulk Partial Failure", False, f"Status: {response.status_code}")
+
+        result = response.json()
+        statuses = [item['status'] for item in result['results']]
+        if statuses == [404, 422, 200] and (result['succeeded'], result['failed']) == (1, 2):
+            return self.log_test("Bulk Partial Failure", True, f"Per-item statuses: {statuses}")
+        return self.log_test("Bulk Partial Failure", False, f"Per-item statuses: {statuses}")
+
+    def test_contact_status_counters(self):
+        """Test /api/contacts/stats after single and bulk status changes"""
+        def by_status():
+            success, response, error = self.make_request('GET', '/api/contacts/stats')
+            return response.json()['by_status'] if success and response.status_code == 200 else None
+
+        before = by_status()
+        if before is None:
+            return self.log_test("Contact Status Counters", False, "Stats request failed")
+
+        contact_ids = []
+        for index in range(2):
+            success, response, error = self.make_request('POST', '/api/contact', {
+                "name": "Counter Test",
+                "email": "counters@example.com",
+                "subject": f"Counter test {index}",
+                "message": "Checks the per-status contact counters.",
+            })
+            if not success or response.status_code != 200:
+                return self.log_test("Contact Status Counters", False, "Contact submission failed")
+            contact_ids.append(response.json()['id'])
+
+        def changed(since):
+            current = by_status() or {}
+            return {status: current.get(status, 0) - count for status, count in since.items()
+                    if current.get(status, 0) != count}
+
+        steps = []
+        steps.append(("insert", changed(before), {"necitit": 2}))
+        success, response, error = self.make_request('PATCH', f'/api/contacts/{contact_ids[0]}', {"status": "citit"})
+        steps.append(("single", changed(before), {"necitit": 1, "citit": 1}))
+        success, response, error = self.make_request(
+            'POST', '/api/contacts/status', {"ids": contact_ids, "status": "arhivat"}
+        )
+        steps.append(("bulk", changed(before), {"arhivat": 2}))
+
+        wrong = [f"{name}: {actual} != {wanted}" for name, actual, wanted in steps if actual != wanted]
+        if wrong:
+            return self.log_test("Contact Status Counters", False, "; ".join(wrong))
+        return self.log_test("Contact Status Counters", True, "Counters follow insert, single and bulk changes")
+
     def run_all_tests(self):
         """Run all API tests"""
         print("🚀 Starting Luxury Portfolio API Tests")
@@ -235,6 +389,12 @@ class LuxuryPortfolioAPITester:
         
         # Project creation test
         self.test_create_project()
+
+        # Caching, concurrency and bulk tests
+        self.test_project_not_modified()
+        self.test_stale_project_updates()
+        self.test_bulk_partial_failure()
+        self.test_contact_status_counters()
         
         # Print summary
         print("\n" + "=" * 50)
@@ -247,8 +407,592 @@ class LuxuryPortfolioAPITester:
             print(f"⚠️  {self.tests_run - self.tests_passed} tests failed.")
             return 1
 
+# ---------------------------------------------------------------------------
+# In-memory Mongo stand-in
+#
+# Implements the subset of the Motor API that server.py uses, so benchmarks
+# run hermetically and measure the application rather than the network.
+# ---------------------------------------------------------------------------
+
+def _lookup(doc, key):
+    return doc.get(key)
+
+
+def _compare(value, op, arg):
+    if op == "$eq":
+        return value == arg or (isinstance(value, list) and arg in value)
+    if op == "$ne":
+        return not _compare(value, "$eq", arg)
+    if op == "$in":
+        return any(_compare(value, "$eq", item) for item in arg)
+    if op == "$nin":
+        return not _compare(value, "$in", arg)
+    if op == "$exists":
+        return (value is not None) == bool(arg)
+    if value is None:
+        return False
+    if op == "$gt":
+        return value > arg
+    if op == "$gte":
+        return value >= arg
+    if op == "$lt":
+        return value < arg
+    if op == "$lte":
+        return value <= arg
+    if op == "$all":
+        return all(item in value for item in arg)
+    raise NotImplementedError(f"Unsupported operator in stand-in: {op}")
+
+
+def _matches(doc, query):
+    for key, condition in query.items():
+        if key == "$or":
+            if not any(_matches(doc, sub) for sub in condition):
+                return False
+        elif key == "$and":
+            if not all(_matches(doc, sub) for sub in condition):
+                return False
+        elif isinstance(condition, dict) and condition and all(op.startswith("$") for op in condition):
+            if not all(_compare(_lookup(doc, key), op, arg) for op, arg in condition.items()):
+                return False
+        elif not _compare(_lookup(doc, key), "$eq", condition):
+            return False
+    return True
+
+
+def _apply_update(doc, update, inserting=False):
+    for op, fields in update.items():
+        for key, value in fields.items():
+            # Dotted keys address nested documents, as in Mongo
+            *parents, field = key.split(".")
+            target = doc
+            for parent in parents:
+                target = target.setdefault(parent, {})
+            if op == "$set":
+                target[field] = copy.deepcopy(value)
+            elif op == "$inc":
+                target[field] = (target.get(field) or 0) + value
+            elif op == "$unset":
+                target.pop(field, None)
+            elif op == "$setOnInsert":
+                if inserting:
+                    target[field] = copy.deepcopy(value)
+            else:
+                raise NotImplementedError(f"Unsupported update in stand-in: {op}")
+
+
+def _project(doc, projection):
+    if not projection:
+        return copy.deepcopy(doc)
+    included = [key for key, flag in projection.items() if flag and key != "_id"]
+    if included:
+        result = {key: copy.deepcopy(doc[key]) for key in included if key in doc}
+        if projection.get("_id", 1) and "_id" in doc:
+            result["_id"] = doc["_id"]
+        return result
+    return {key: copy.deepcopy(value) for key, value in doc.items() if projection.get(key, 1)}
+
+
+class MemoryCursor:
+    def __init__(self, collection, query, projection):
+        self._collection = collection
+        self._query = query or {}
+        self._projection = projection
+        self._sort = []
+        self._limit = 0
+        self._iterator = None
+
+    def sort(self, key, direction=1):
+        self._sort = key if isinstance(key, list) else [(key, direction)]
+        return self
+
+    def limit(self, count):
+        self._limit = count
+        return self
+
+    def batch_size(self, size):
+        return self
+
+    def _results(self):
+        docs = [doc for doc in self._collection.docs if _matches(doc, self._query)]
+        for key, direction in reversed(self._sort):
+            docs.sort(key=lambda doc: (doc.get(key) is not None, doc.get(key)), reverse=direction == -1)
+        if self._limit:
+            docs = docs[:self._limit]
+        return [_project(doc, self._projection) for doc in docs]
+
+    async def to_list(self, length=None):
+        results = self._results()
+        return results[:length] if length else results
+
+    def __aiter__(self):
+        self._iterator = iter(self._results())
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._iterator)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+class MemoryCollection:
+    def __init__(self, name, docs=None):
+        self.name = name
+        self.docs = docs or []
+        self.unique_keys = {"_id"}
+        self._next_id = 0
+
+    def _prepare(self, doc):
+        from pymongo.errors import DuplicateKeyError
+        if "_id" not in doc:
+            self._next_id += 1
+            doc["_id"] = f"{self.name}-{self._next_id}"
+        for key in self.unique_keys:
+            if key in doc and any(existing.get(key) == doc[key] for existing in self.docs):
+                raise DuplicateKeyError(f"E11000 duplicate key error: {key}")
+
+    async def create_index(self, keys, unique=False, **kwargs):
+        if unique and isinstance(keys, str):
+            self.unique_keys.add(keys)
+        return str(keys)
+
+    def find(self, query=None, projection=None, **kwargs):
+        return MemoryCursor(self, query, projection)
+
+    async def find_one(self, query=None, projection=None, **kwargs):
+        results = await self.find(query, projection).limit(1).to_list(1)
+        return results[0] if results else None
+
+    async def count_documents(self, query, **kwargs):
+        return sum(1 for doc in self.docs if _matches(doc, query))
+
+    async def insert_one(self, doc, **kwargs):
+        from pymongo.results import InsertOneResult
+        self._prepare(doc)
+        self.docs.append(copy.deepcopy(doc))
+        return InsertOneResult(doc["_id"], True)
+
+    async def insert_many(self, docs, ordered=True, **kwargs):
+        from pymongo.errors import BulkWriteError, DuplicateKeyError
+        from pymongo.results import InsertManyResult
+        inserted, errors = [], []
+        for index, doc in enumerate(docs):
+            try:
+                self._prepare(doc)
+            except DuplicateKeyError as exc:
+                errors.append({"index": index, "code": 11000, "errmsg": str(exc)})
+                if ordered:
+                    break
+                continue
+            self.docs.append(copy.deepcopy(doc))
+            inserted.append(doc["_id"])
+        if errors:
+            raise BulkWriteError({"writeErrors": errors, "nInserted": len(inserted)})
+        return InsertManyResult(inserted, True)
+
+    async def update_one(self, query, update, upsert=False, **kwargs):
+        from pymongo.results import UpdateResult
+        for doc in self.docs:
+            if _matches(doc, query):
+                _apply_update(doc, update)
+                return UpdateResult({"n": 1, "nModified": 1}, True)
+        if upsert:
+            doc = {key: value for key, value in query.items() if not key.startswith("$")}
+            _apply_update(doc, update, inserting=True)
+            await self.insert_one(doc)
+            return UpdateResult({"n": 1, "nModified": 0, "upserted": doc["_id"]}, True)
+        return UpdateResult({"n": 0, "nModified": 0}, True)
+
+    async def update_many(self, query, update, **kwargs):
+        from pymongo.results import UpdateResult
+        matched = [doc for doc in self.docs if _matches(doc, query)]
+        for doc in matched:
+            _apply_update(doc, update)
+        return UpdateResult({"n": len(matched), "nModified": len(matched)}, True)
+
+    async def replace_one(self, query, replacement, upsert=False, **kwargs):
+        from pymongo.results import UpdateResult
+        for index, doc in enumerate(self.docs):
+            if _matches(doc, query):
+                self.docs[index] = dict(copy.deepcopy(replacement), _id=doc["_id"])
+                return UpdateResult({"n": 1, "nModified": 1}, True)
+        if upsert:
+            doc = dict(copy.deepcopy(replacement), **{k: v for k, v in query.items() if not k.startswith("$")})
+            await self.insert_one(doc)
+        return UpdateResult({"n": 0, "nModified": 0}, True)
+
+    async def distinct(self, key, query=None, **kwargs):
+        values = []
+        for doc in self.docs:
+            if _matches(doc, query or {}) and _lookup(doc, key) not in values:
+                values.append(_lookup(doc, key))
+        return values
+
+    def aggregate(self, pipeline, **kwargs):
+        # Only the single $group-by-field count the server uses
+        (stage,) = pipeline
+        field = stage["$group"]["_id"].lstrip("$")
+        counts = {}
+        for doc in self.docs:
+            counts[doc.get(field)] = counts.get(doc.get(field), 0) + 1
+        return MemoryCursor(MemoryCollection("aggregate", [{"_id": k, "count": v} for k, v in counts.items()]), {}, None)
+
+    async def find_one_and_update(self, query, update, projection=None, return_document=False, **kwargs):
+        for doc in self.docs:
+            if _matches(doc, query):
+                before = copy.deepcopy(doc)
+                _apply_update(doc, update)
+                return _project(doc if return_document else before, projection)
+        return None
+
+    async def delete_one(self, query):
+        from pymongo.results import DeleteResult
+        for index, doc in enumerate(self.docs):
+            if _matches(doc, query):
+                del self.docs[index]
+                return DeleteResult({"n": 1}, True)
+        return DeleteResult({"n": 0}, True)
+
+    async def bulk_write(self, operations, ordered=True):
+        from pymongo import DeleteOne, InsertOne, UpdateOne
+        from pymongo.errors import BulkWriteError, DuplicateKeyError
+        from pymongo.results import BulkWriteResult
+        counts = {"nInserted": 0, "nMatched": 0, "nModified": 0, "nRemoved": 0, "nUpserted": 0, "upserted": []}
+        errors = []
+        for index, operation in enumerate(operations):
+            try:
+                if isinstance(operation, InsertOne):
+                    await self.insert_one(operation._doc)
+                    counts["nInserted"] += 1
+                elif isinstance(operation, UpdateOne):
+                    result = await self.update_one(operation._filter, operation._doc)
+                    counts["nMatched"] += result.matched_count
+                    counts["nModified"] += result.modified_count
+                elif isinstance(operation, DeleteOne):
+                    counts["nRemoved"] += (await self.delete_one(operation._filter)).deleted_count
+            except DuplicateKeyError as exc:
+                errors.append({"index": index, "code": 11000, "errmsg": str(exc)})
+                if ordered:
+                    break
+        if errors:
+            raise BulkWriteError(dict(counts, writeErrors=errors, writeConcernErrors=[]))
+        return BulkWriteResult(counts, True)
+
+
+class MemoryDatabase:
+    def __init__(self):
+        self._collections = {}
+
+    def __getitem__(self, name):
+        if name not in self._collections:
+            self._collections[name] = MemoryCollection(name)
+        return self._collections[name]
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return self[name]
+
+    async def command(self, *args, **kwargs):
+        return {"ok": 1}
+
+
+class MemoryMongoClient:
+    """Drop-in for AsyncIOMotorClient backed by MemoryDatabase."""
+
+    def __init__(self, *args, **kwargs):
+        self._database = MemoryDatabase()
+
+    def __getitem__(self, name):
+        return self._database
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return self._database
+
+    def close(self):
+        pass
+
+
+# ---------------------------------------------------------------------------
+# Benchmark harness
+# ---------------------------------------------------------------------------
+
+DEFAULT_MIX = "projects=45,project=45,contact=10"
+
+ROUTE_LABELS = {
+    "projects": "GET /api/projects",
+    "featured": "GET /api/projects/featured",
+    "project": "GET /api/projects/{id}",
+    "search": "GET /api/projects/search",
+    "contact": "POST /api/contact",
+}
+
+
+def parse_mix(mix: str) -> Dict[str, float]:
+    weights = {}
+    for item in mix.split(","):
+        name, _, weight = item.partition("=")
+        name = name.strip()
+        if name not in ROUTE_LABELS:
+            raise ValueError(f"Unknown route in mix: {name} (choose from {', '.join(ROUTE_LABELS)})")
+        weights[name] = float(weight or 1)
+    return weights
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(fraction * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+
+def summarize_latencies(latencies: List[float], errors: int, elapsed: float) -> Dict[str, Any]:
+    ordered = sorted(latencies)
+    count = len(ordered)
+    return {
+        "requests": count,
+        "errors": errors,
+        "throughput_rps": round(count / elapsed, 2) if elapsed else 0.0,
+        "mean_ms": round(sum(ordered) / count * 1000, 3) if count else 0.0,
+        "p50_ms": round(percentile(ordered, 0.50) * 1000, 3),
+        "p95_ms": round(percentile(ordered, 0.95) * 1000, 3),
+        "p99_ms": round(percentile(ordered, 0.99) * 1000, 3),
+        "max_ms": round(ordered[-1] * 1000, 3) if count else 0.0,
+    }
+
+
+def load_server(backend_dir: str, storage: str = "mongo-memory"):
+    """Import server.py on the requested storage backend.
+
+    "mongo-memory" keeps the Mongo backend but swaps Motor for the in-memory
+    stand-in; "memory" and "sqlite" use the server's own embedded backends.
+    """
+    if storage == "mongo-memory":
+        import motor.motor_asyncio
+        motor.motor_asyncio.AsyncIOMotorClient = MemoryMongoClient
+        os.environ["STORAGE_BACKEND"] = "mongo"
+    else:
+        os.environ["STORAGE_BACKEND"] = storage
+    # All benchmark traffic comes from one client address, so lift the
+    # contact form's per-IP rate limit unless the caller set one
+    os.environ.setdefault("CONTACT_RATE_PER_MINUTE", "100000000")
+    os.environ.setdefault("CONTACT_RATE_BURST", "100000")
+    # Prerendered project pages go to a scratch directory, not the working tree
+    os.environ.setdefault("SNAPSHOT_DIR", tempfile.mkdtemp(prefix="bench-snapshots-"))
+    if storage == "sqlite":
+        # Fresh database per run so results don't depend on earlier runs
+        os.environ.setdefault("SQLITE_PATH", os.path.join(tempfile.mkdtemp(prefix="bench-"), "portfolio.db"))
+    sys.path.insert(0, backend_dir)
+    import server
+    return server
+
+
+def current_commit() -> Optional[str]:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], stderr=subprocess.DEVNULL, text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+class PortfolioBenchmark:
+    def __init__(self, concurrency: int, total_requests: int, mix: Dict[str, float],
+                 seed_projects: int = 0, warmup: int = 100, random_seed: int = 42):
+        self.concurrency = concurrency
+        self.total_requests = total_requests
+        self.mix = mix
+        self.seed_projects = seed_projects
+        self.warmup = warmup
+        self.random = random.Random(random_seed)
+        self.project_ids: List[str] = []
+        self.latencies: Dict[str, List[float]] = {label: [] for label in mix}
+        self.errors: Dict[str, int] = {label: 0 for label in mix}
+        self.status_codes: Dict[str, Dict[str, int]] = {label: {} for label in mix}
+
+    async def _request(self, client, route: str):
+        if route == "projects":
+            return await client.get("/api/projects")
+        if route == "featured":
+            return await client.get("/api/projects/featured")
+        if route == "project":
+            return await client.get(f"/api/projects/{self.random.choice(self.project_ids)}")
+        if route == "search":
+            return await client.get("/api/projects/search", params={"q": self.random.choice(["platf", "react", "mob", "dash"])})
+        return await client.post("/api/contact", json={
+            "name": "Benchmark",
+            "email": "bench@example.com",
+            "subject": "Benchmark",
+            # Unique text, otherwise the duplicate window answers from memory
+            "message": f"Mesaj generat de suita de benchmark ({uuid.uuid4().hex}).",
+        })
+
+    async def _seed(self, client):
+        if self.seed_projects:
+            template = {
+                "title": "Proiect Benchmark", "subtitle": "Generat", "description": "Proiect generat pentru benchmark.",
+                "tech_stack": ["React", "FastAPI", "MongoDB"], "category": "Benchmark",
+                "hero_image": "https://example.com/hero.jpg", "gallery_images": [],
+                "challenge": "-", "solution": "-", "process": "-", "results": "-",
+            }
+            for start in range(0, self.seed_projects, 500):
+                operations = [
+                    {"op": "create", "project": dict(template, title=f"Proiect Benchmark {index}")}
+                    for index in range(start, min(start + 500, self.seed_projects))
+                ]
+                response = await client.post("/api/projects/bulk", json={"operations": operations})
+                response.raise_for_status()
+        response = await client.get("/api/projects", params={"limit": 500})
+        self.project_ids = [project["id"] for project in response.json()]
+
+    async def _worker(self, client, routes: List[str], weights: List[float], budget: List[int], record: bool):
+        while budget[0] > 0:
+            budget[0] -= 1
+            route = self.random.choices(routes, weights)[0]
+            started = time.perf_counter()
+            try:
+                response = await self._request(client, route)
+                status = str(response.status_code)
+                failed = response.status_code >= 400
+            except Exception as exc:  # a crashed request still counts against the route
+                status, failed = type(exc).__name__, True
+            elapsed = time.perf_counter() - started
+            if record:
+                self.latencies[route].append(elapsed)
+                self.status_codes[route][status] = self.status_codes[route].get(status, 0) + 1
+                if failed:
+                    self.errors[route] += 1
+
+    async def _drive(self, client, count: int, record: bool) -> float:
+        routes, weights = list(self.mix), list(self.mix.values())
+        budget = [count]
+        started = time.perf_counter()
+        await asyncio.gather(*[
+            self._worker(client, routes, weights, budget, record) for _ in range(self.concurrency)
+        ])
+        return time.perf_counter() - started
+
+    async def run(self, app) -> Dict[str, Any]:
+        import httpx
+
+        async with app.router.lifespan_context(app):
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+                await self._seed(client)
+                await self._drive(client, self.warmup, record=False)
+                elapsed = await self._drive(client, self.total_requests, record=True)
+
+        all_latencies = [latency for values in self.latencies.values() for latency in values]
+        return {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "commit": current_commit(),
+            "python": sys.version.split()[0],
+            "config": {
+                "concurrency": self.concurrency,
+                "requests": self.total_requests,
+                "mix": self.mix,
+                "projects": len(self.project_ids),
+                "warmup": self.warmup,
+            },
+            "elapsed_s": round(elapsed, 3),
+            "total": summarize_latencies(all_latencies, sum(self.errors.values()), elapsed),
+            "routes": {
+                ROUTE_LABELS[route]: dict(
+                    summarize_latencies(self.latencies[route], self.errors[route], elapsed),
+                    status_codes=self.status_codes[route],
+                )
+                for route in self.mix
+            },
+        }
+
+
+def print_report(results: Dict[str, Any], baseline: Optional[Dict[str, Any]] = None):
+    print(f"\n📈 {results['total']['requests']} requests in {results['elapsed_s']}s "
+          f"@ concurrency {results['config']['concurrency']}")
+    header = f"{'route':<30}{'req':>8}{'rps':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'err':>6}"
+    print(header)
+    print("-" * len(header))
+    rows = dict(results["routes"], TOTAL=results["total"])
+    for label, stats in rows.items():
+        line = (f"{label:<30}{stats['requests']:>8}{stats['throughput_rps']:>10}"
+                f"{stats['p50_ms']:>10}{stats['p95_ms']:>10}{stats['p99_ms']:>10}{stats['errors']:>6}")
+        previous = baseline and (baseline["total"] if label == "TOTAL" else baseline["routes"].get(label))
+        if previous and previous["p50_ms"]:
+            change = (stats["p50_ms"] - previous["p50_ms"]) / previous["p50_ms"] * 100
+            line += f"   p50 {change:+.1f}% vs baseline"
+        print(line)
+
+
+def run_benchmark(args) -> int:
+    backend_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "backend")
+    server = load_server(backend_dir, args.storage)
+    benchmark = PortfolioBenchmark(
+        concurrency=args.concurrency,
+        total_requests=args.requests,
+        mix=parse_mix(args.mix),
+        seed_projects=args.seed_projects,
+        warmup=args.warmup,
+        random_seed=args.seed,
+    )
+    results = asyncio.run(benchmark.run(server.app))
+    results["config"]["storage"] = args.storage
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as baseline_file:
+            baseline = json.load(baseline_file)
+    print_report(results, baseline)
+
+    output = args.output or os.path.join(
+        "bench_results", f"bench-{datetime.now().strftime('%Y%m%d-%H%M%S')}.json"
+    )
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+    with open(output, "w") as output_file:
+        json.dump(results, output_file, indent=2)
+    print(f"\n💾 Results saved to {output}")
+    return 1 if results["total"]["errors"] else 0
+
+
+def run_local_tests(args) -> int:
+    """The functional tests against the app in-process, on an embedded backend."""
+    from fastapi.testclient import TestClient
+
+    backend_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "backend")
+    server = load_server(backend_dir, args.storage)
+    with TestClient(server.app) as client:
+        tester = LuxuryPortfolioAPITester(base_url=str(client.base_url), client=client)
+        return tester.run_all_tests()
+
+
 def main():
     """Main test runner"""
+    parser = argparse.ArgumentParser(description="Luxury Portfolio backend tests and benchmarks")
+    subcommands = parser.add_subparsers(dest="command")
+    local = subcommands.add_parser("local", help="run the functional tests in-process, without a server")
+    local.add_argument("--storage", choices=["memory", "sqlite", "mongo-memory"], default="memory",
+                       help="storage backend (mongo-memory runs the Mongo code against an in-memory Motor)")
+    bench = subcommands.add_parser("bench", help="run the in-process concurrent benchmark")
+    bench.add_argument("-c", "--concurrency", type=int, default=32)
+    bench.add_argument("-n", "--requests", type=int, default=5000)
+    bench.add_argument("--mix", default=DEFAULT_MIX,
+                       help=f"weighted routes, e.g. {DEFAULT_MIX} (routes: {', '.join(ROUTE_LABELS)})")
+    bench.add_argument("--seed-projects", type=int, default=0, help="extra projects to create before the run")
+    bench.add_argument("--warmup", type=int, default=100, help="unrecorded requests before measuring")
+    bench.add_argument("--seed", type=int, default=42, help="random seed for the request mix")
+    bench.add_argument("--storage", choices=["mongo-memory", "memory", "sqlite"], default="mongo-memory",
+                       help="storage backend (mongo-memory runs the Mongo code against an in-memory Motor)")
+    bench.add_argument("--output", help="results file (default: bench_results/bench-<timestamp>.json)")
+    bench.add_argument("--compare", help="earlier results file to compare p50 against")
+    args = parser.parse_args()
+
+    if args.command == "bench":
+        return run_benchmark(args)
+    if args.command == "local":
+        return run_local_tests(args)
+
     print("Luxury Portfolio Backend API Tester")
     print(f"Testing backend at: http://localhost:8001")
     print(f"Test started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
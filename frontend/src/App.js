@@ -22,7 +22,8 @@ import useCustomCursor from './hooks/useCustomCursor';
 import useScrollDirection from './hooks/useScrollDirection';
 
 function App() {
-  const [isLoading, setIsLoading] = useState(true);
+  // Prerendered project pages are already painted; skip the intro screen there
+  const [isLoading, setIsLoading] = useState(() => !document.getElementById('project-data'));
   const [darkMode, setDarkMode] = useState(true);
   const [soundEnabled, setSoundEnabled] = useState(false);
   const [navigationOpen, setNavigationOpen] = useState(false);
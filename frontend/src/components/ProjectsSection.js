@@ -193,7 +193,7 @@ const ProjectsSection = ({ soundEnabled }) => {
                 </div>
 
                 <p className="text-silver text-lg leading-relaxed mb-8">
-                  {project.description.substring(0, 200)}...
+                  {project.excerpt}...
                 </p>
                 
                 {/* Tech Stack */}
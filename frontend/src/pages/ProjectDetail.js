@@ -3,14 +3,36 @@ import { useParams, Link } from 'react-router-dom';
 import { projectsAPI } from '../services/api';
 import { soundUtils } from '../utils/animations';
 
+// Prerendered project pages embed the project so the first render needs no API call
+const readEmbeddedProject = () => {
+  const element = document.getElementById('project-data');
+  if (!element) {
+    return null;
+  }
+  try {
+    return JSON.parse(element.textContent);
+  } catch (err) {
+    return null;
+  }
+};
+
+const embeddedProject = readEmbeddedProject();
+
 const ProjectDetail = ({ soundEnabled }) => {
   const { id } = useParams();
-  const [project, setProject] = useState(null);
-  const [loading, setLoading] = useState(true);
+  const initialProject = embeddedProject && embeddedProject.id === id ? embeddedProject : null;
+  const [project, setProject] = useState(initialProject);
+  const [loading, setLoading] = useState(!initialProject);
   const [error, setError] = useState(null);
   const [activeImage, setActiveImage] = useState(0);
 
   useEffect(() => {
+    if (embeddedProject && embeddedProject.id === id) {
+      setProject(embeddedProject);
+      setLoading(false);
+      return;
+    }
+
     const fetchProject = async () => {
       try {
         const response = await projectsAPI.getById(id);
@@ -41,31 +41,68 @@ api.interceptors.response.use(
 // Projects API
 export const projectsAPI = {
   // Get all projects
-  getAll: () => api.get('/api/projects'),
+  getAll: (params) => api.get('/api/projects', { params }),
   
   // Get featured projects
   getFeatured: () => api.get('/api/projects/featured'),
   
+  // Project counts per category and technology, for filter chips
+  getFacets: () => api.get('/api/projects/facets'),
+  
+  // Full-text search (prefix-matches the last word for type-ahead)
+  search: (q, params) => api.get('/api/projects/search', { params: { q, ...params } }),
+  
   // Get project by ID
   getById: (id) => api.get(`/api/projects/${id}`),
   
+  // Most similar projects by shared technologies and category
+  getRelated: (id, k) => api.get(`/api/projects/${id}/related`, { params: { k } }),
+  
   // Create new project
   create: (projectData) => api.post('/api/projects', projectData),
   
+  // Mixed create/update/delete batch; returns a result per operation
+  bulk: (operations) => api.post('/api/projects/bulk', { operations }),
+  
   // Update project
   update: (id, projectData) => api.put(`/api/projects/${id}`, projectData),
   
+  // Partial update; pass the ETag from the last read to avoid overwriting concurrent edits
+  patch: (id, changes, etag) =>
+    api.patch(`/api/projects/${id}`, changes, etag ? { headers: { 'If-Match': etag } } : undefined),
+  
   // Delete project
   delete: (id) => api.delete(`/api/projects/${id}`),
 };
 
+// Images API
+export const imagesAPI = {
+  // Upload an image; the response lists its responsive variants and srcset
+  upload: (file) => {
+    const formData = new FormData();
+    formData.append('file', file);
+    return api.post('/api/images', formData, {
+      headers: { 'Content-Type': 'multipart/form-data' },
+    });
+  },
+};
+
 // Contact API
 export const contactAPI = {
   // Submit contact form
   submit: (contactData) => api.post('/api/contact', contactData),
   
   // Get all contacts (admin only)
-  getAll: () => api.get('/api/contacts'),
+  getAll: (params) => api.get('/api/contacts', { params }),
+
+  // Per-status counts for the inbox badge
+  getStats: () => api.get('/api/contacts/stats'),
+
+  // Mark one contact as citit / raspuns / arhivat / necitit
+  setStatus: (id, status) => api.patch(`/api/contacts/${id}`, { status }),
+
+  // Same transition for many contacts at once
+  setStatusMany: (ids, status) => api.post('/api/contacts/status', { ids, status }),
 };
 
 // Utility functions